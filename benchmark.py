@@ -0,0 +1,355 @@
+#!/usr/bin/python3
+
+import argparse
+import json
+import math
+import sys
+import threading
+import time
+
+# Local imports
+import utils.clock as clock
+from robot import Robot
+from hardware.sim import SimBackend
+from inference.backend import NUM_THREADS
+from inference.registry import registry
+from utils.profiling import StageProfiler
+from utils.scheduler import Scheduler, Task
+
+# Stages reported by the benchmark
+STAGES: tuple[str, ...] = (
+    'capture', 'state', 'control', 'inference', 'overlay', 'display', 'actuation'
+)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses command-line arguments for configuring the benchmark.
+
+    Returns:
+        argparse.Namespace: Parsed command-line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the supervisor main loop on simulated hardware.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+
+    parser.add_argument(
+        '--ticks',
+        help='Number of control ticks to run.',
+        type=int,
+        default=1000
+    )
+    parser.add_argument(
+        '--warmup',
+        help='Number of control ticks run before measuring.',
+        type=int,
+        default=50
+    )
+    parser.add_argument(
+        '--command',
+        help='Command the supervisor executes during the run.',
+        type=str,
+        default='track'
+    )
+    parser.add_argument(
+        '--target',
+        help='Target object of the command.',
+        type=str,
+        default='person'
+    )
+    parser.add_argument(
+        '--video',
+        help='Video file or recorder log played back as the camera (default: synthetic scene).',
+        type=str,
+        default=None
+    )
+    parser.add_argument(
+        '--lockstep',
+        help='Deliver every camera frame exactly once (deterministic replay).',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--tracking',
+        help='Run the detector only every few frames and track the target in between.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--multiModel',
+        help='Run the face and object detectors on every frame in the background (no model swaps; '
+             'not with --tracking or --roi).',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--roi',
+        help='Run the detector on a window around the last known target before the full frame.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--predict',
+        help='Project detections into the current camera view, compensating motion during inference latency.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--scanPause',
+        help='While searching for an object, turn in steps and pause at each heading to capture sharp frames.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--motionBlur',
+        help='Blur the synthetic scene while the robot turns.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--gui',
+        help='Draw the status overlay and show the camera feed in a window.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--numThreads',
+        help='Number of CPU threads for model inference without an EdgeTPU (with --video).',
+        type=int,
+        default=NUM_THREADS
+    )
+    parser.add_argument(
+        '--enableEdgeTPU',
+        help='Run models on the EdgeTPU if one is present (with --video).',
+        action=argparse.BooleanOptionalAction,
+        default=True
+    )
+    parser.add_argument(
+        '--realTime',
+        help='Run on the wall clock instead of skipping idle time with a virtual clock.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--output',
+        help='Path of the JSON file the results are written to (default: stdout only).',
+        type=str,
+        default=None
+    )
+
+    args = parser.parse_args()
+
+    # The shared detections are computed on full frames, independently of the controllers
+    if args.multiModel and (args.tracking or args.roi):
+        parser.error('--multiModel cannot be combined with --tracking or --roi')
+
+    return args
+
+
+def collect_counters(robot: Robot) -> dict:
+    """
+    Gathers the statistics counters of the robot's subsystems.
+
+    Args:
+        robot (Robot): The benchmarked robot.
+
+    Returns:
+        dict: Counter values grouped by subsystem.
+    """
+    supervisor = robot.supervisor
+    counters = {
+        'camera': {
+            'frames_captured': robot.camera.frames_captured,
+            'frames_dropped': robot.camera.frames_dropped,
+            'frames_stale': robot.camera.frames_stale,
+        },
+        'drive': {
+            'writes': robot.drive.writes,
+            'suppressed': robot.drive.suppressed,
+        },
+        'servo_bus': {
+            'transactions': robot.pan_tilt.bus.transactions,
+            'skipped': robot.pan_tilt.bus.skipped,
+            'bus_time': robot.pan_tilt.bus.bus_time,
+        },
+        'registry': registry.stats(),
+    }
+
+    # Dead-reckoning estimate, and its error against the simulated ground truth
+    odometry = robot.odometry
+    counters['odometry'] = {
+        'updates': odometry.updates,
+        'x': round(odometry.pose.x, 3),
+        'y': round(odometry.pose.y, 3),
+        'theta': round(odometry.pose.theta, 3),
+    }
+    world = getattr(robot.backend, 'world', None)
+    if world is not None:
+        counters['odometry']['error'] = round(math.hypot(odometry.pose.x - world.x, odometry.pose.y - world.y), 4)
+
+    if supervisor.inference is not None:
+        counters['inference'] = {
+            'frames_processed': supervisor.inference.frames_processed,
+            'frames_skipped': supervisor.inference.frames_skipped,
+            'failures': supervisor.inference.failures,
+        }
+
+    if supervisor.models is not None:
+        counters['models'] = {
+            'frames_processed': supervisor.models.frames_processed,
+            'frames_skipped': supervisor.models.frames_skipped,
+            'failures': supervisor.models.failures,
+            'alternate': supervisor.models.alternate,
+        }
+
+    controller = supervisor.current_controller
+    tracker = getattr(controller, 'tracker', None)
+    if tracker is not None:
+        counters['tracker'] = {
+            'detector_runs': tracker.detector_runs,
+            'tracker_runs': tracker.tracker_runs,
+        }
+    gate = getattr(controller, 'gate', None)
+    if gate is not None:
+        counters['gate'] = {
+            'passed': gate.passed,
+            'redundant': gate.redundant,
+            'blurred': gate.blurred,
+        }
+    roi = getattr(controller, 'roi', None)
+    if roi is not None:
+        counters['roi'] = {
+            'roi_runs': roi.roi_runs,
+            'full_runs': roi.full_runs,
+            'roi_misses': roi.roi_misses,
+        }
+
+    return counters
+
+
+def run_ticks(scheduler: Scheduler, control: Task, ticks: int, stop: threading.Event) -> None:
+    """
+    Runs the main loop until its control task has run a number of times.
+
+    Args:
+        scheduler (Scheduler): The supervisor's main loop.
+        control (Task): The control task of the loop.
+        ticks (int): Number of control ticks to run.
+        stop (threading.Event): Event ending the loop early (e.g. ESC pressed in the GUI).
+    """
+    end = control.runs + ticks
+    while control.runs < end and not stop.is_set():
+        delay = scheduler.run_pending()
+        if delay > 0:
+            clock.sleep(delay)
+
+
+def run(args: argparse.Namespace) -> dict:
+    """
+    Runs the main loop on simulated hardware and measures it.
+
+    The loop is driven through the same scheduler tasks and inference worker as
+    `Supervisor.main`, counting runs of its control task as ticks.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+
+    Returns:
+        dict: Configuration, loop rates, per-stage latencies, task timing and subsystem counters.
+    """
+    backend = SimBackend(
+        video=args.video, virtual_time=not args.realTime, lockstep=args.lockstep, motion_blur=args.motionBlur
+    )
+    robot = Robot(
+        backend=backend, tracking=args.tracking, roi=args.roi, predict=args.predict, scan_pause=args.scanPause,
+        gui=args.gui, multi_model=args.multiModel, num_threads=args.numThreads, use_edgetpu=args.enableEdgeTPU,
+    )
+    supervisor = robot.supervisor
+    supervisor.target_object = args.target
+    supervisor.command = args.command
+
+    scheduler = supervisor.build_scheduler()
+    control = next(task for task in scheduler.tasks if task.name == 'control')
+
+    # Warm up (controller switch, model loads, first detections) without profiling
+    scheduler.start()
+    run_ticks(scheduler, control, args.warmup, supervisor.shutdown)
+
+    profiler = StageProfiler()
+    supervisor.profiler = profiler
+
+    scheduler.start()  # Measure from a fresh release, without the warmup's task statistics
+    start_clock = clock.monotonic()
+    start_wall = time.perf_counter()
+    run_ticks(scheduler, control, args.ticks, supervisor.shutdown)
+
+    elapsed_clock = clock.monotonic() - start_clock
+    elapsed_wall = time.perf_counter() - start_wall
+    supervisor.profiler = None
+    tasks = scheduler.stats()
+
+    if supervisor.inference is not None:
+        supervisor.inference.stop()
+    if supervisor.models is not None:
+        supervisor.models.stop()
+
+    summary = profiler.summary()
+    return {
+        'config': {
+            'ticks': args.ticks,
+            'command': args.command,
+            'target': args.target,
+            'video': args.video,
+            'lockstep': args.lockstep,
+            'tracking': args.tracking,
+            'roi': args.roi,
+            'predict': args.predict,
+            'scan_pause': args.scanPause,
+            'motion_blur': args.motionBlur,
+            'multi_model': args.multiModel,
+            'gui': args.gui,
+            'real_time': args.realTime,
+            'num_threads': args.numThreads,
+            'edgetpu': args.enableEdgeTPU,
+        },
+        'loop_hz': control.runs / elapsed_clock if elapsed_clock > 0 else 0.0,  # On the robot's clock
+        'compute_hz': control.runs / elapsed_wall if elapsed_wall > 0 else 0.0,  # On the wall clock
+        'stages': {stage: summary[stage] for stage in STAGES if stage in summary},
+        'tasks': tasks,
+        'counters': collect_counters(robot),
+    }
+
+
+def print_report(results: dict) -> None:
+    """
+    Prints a human-readable summary of the benchmark results.
+
+    Args:
+        results (dict): Results as returned by `run`.
+    """
+    print(f"loop: {results['loop_hz']:.1f} Hz (clock), {results['compute_hz']:.1f} Hz (wall)")
+    print(f"{'stage':<12}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)")
+    for stage, stats in results['stages'].items():
+        print(
+            f"{stage:<12}{stats['count']:>8}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}"
+            f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}{stats['max_ms']:>10.3f}"
+        )
+    print(f"{'task':<12}{'rate':>8}{'runs':>8}{'misses':>8}{'jitter':>10}{'max':>10}  (Hz, ms)")
+    for task, stats in results['tasks'].items():
+        print(
+            f"{task:<12}{stats['rate']:>8.1f}{stats['runs']:>8}{stats['misses']:>8}"
+            f"{stats['jitter_mean'] * 1000:>10.3f}{stats['jitter_max'] * 1000:>10.3f}"
+        )
+    for group, counters in results['counters'].items():
+        values = ', '.join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+                           for key, value in counters.items())
+        print(f"{group}: {values}")
+
+
+def main() -> None:
+    """Runs the benchmark and reports the results."""
+    args = parse_arguments()
+    results = run(args)
+
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
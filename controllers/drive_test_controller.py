@@ -1,6 +1,6 @@
 import math
-import time
 from controllers.pid import PID
+import utils.clock as clock
 
 
 class DriveTestController:
@@ -26,7 +26,7 @@ class DriveTestController:
         self.drive_pid.initialize()
 
         # Store the start time for potential time-based movement tests
-        self.start_time: float = time.time()
+        self.start_time: float = clock.monotonic()
 
     def __del__(self) -> None:
         """
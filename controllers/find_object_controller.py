@@ -1,13 +1,21 @@
-import cv2
 import math
 import threading
-import time
-
-from aiymakerkit import vision
-from aiymakerkit import utils
+from typing import Optional
 
 # Local imports
 import data.models as models
+from controllers.motion import STOP, MotionScheduler, Waypoint
+from hardware.camera import Frame
+from inference.quality import STILL_OMEGA, FrameGate
+from inference.registry import registry
+from utils.pose import normalize_angle
+
+# Scan settings
+SCAN_SPEED: float = 1.5  # Angular speed (rad/s) of a continuous scanning turn
+PAUSE_SCAN_SPEED: float = 3.0  # Angular speed (rad/s) between pauses (frames in motion are skipped anyway)
+PAUSE_STEP: float = math.radians(45)  # Heading change between pauses (less than the camera's field of view)
+PAUSE_TIME: float = 0.25  # Time (seconds) the robot holds still at each pause
+MOTION_WINDOW: float = 0.05  # Time (seconds) over which the camera's rotation at capture is measured
 
 
 class FindObjectController:
@@ -31,104 +39,164 @@ class FindObjectController:
         if self.supervisor.has_vision:
             # Initialize the detector based on the target object
             if self.supervisor.target_object == "face":
-                self.detector = vision.Detector(models.FACE_DETECTION_MODEL)
+                self.model: str = models.FACE_DETECTION_MODEL
                 self.labels = None
                 self.threshold: float = 0.1  # Lower threshold for face detection
             else:
-                self.detector = vision.Detector(models.OBJECT_DETECTION_MODEL)
-                self.labels = utils.read_labels_from_metadata(models.OBJECT_DETECTION_MODEL)
+                self.model: str = models.OBJECT_DETECTION_MODEL
+                self.labels = registry.labels(models.OBJECT_DETECTION_MODEL)
                 self.threshold: float = 0.4  # Higher threshold for general object detection
 
-            # Set up scanning thread for continuous object searching
+            self.detector = registry.detector(self.model)  # Shared detector (loaded once)
+
+            # Skip blurred and redundant frames while scanning (and, when pausing, all frames in motion);
+            # the gate needs the frames, so the detector runs here even in multi-model mode
+            self.gate = FrameGate(max_omega=STILL_OMEGA if self.supervisor.scan_pause else math.inf)
+            self.shared_detections: bool = False
+
+            # Scan for the object on a timer thread until it is detected
             self.detection = threading.Event()
-            self.scanning_thread = threading.Thread(target=self.scan_drive, daemon=True)
-            self.scanning_thread.start()
+            self.scanner = MotionScheduler(self.supervisor)
+            if self.supervisor.scan_pause:
+                plan = self.scan_drive(PAUSE_SCAN_SPEED, pause_step=PAUSE_STEP)
+            else:
+                plan = self.scan_drive(SCAN_SPEED)
+            self.scanner.start(plan, repeat=True, final=STOP)
 
     def __del__(self) -> None:
         """
         Ensures the robot stops moving when the controller is deleted.
         """
+        scanner = getattr(self, 'scanner', None)
+        if scanner is not None:
+            scanner.cancel()
         with self.supervisor._lock:
             self.supervisor.omega = 0  # Stop angular velocity
             self.supervisor.v = 0  # Stop linear velocity
 
+    def select(self, objects: list) -> list:
+        """
+        Keeps the objects matching the target with a high enough score.
+
+        Args:
+            objects (list): Objects detected by the controller's model.
+
+        Returns:
+            list: The target objects.
+        """
+        objects = [o for o in objects if o.score >= self.threshold]
+
+        # Filter detected objects to match the target object (if not detecting faces)
+        if self.supervisor.target_object != "face":
+            objects = [o for o in objects if self.labels.get(o.id) == self.supervisor.target_object]
+
+        return objects
+
+    def detect(self, frame: Frame) -> list:
+        """
+        Runs the detector on a frame and keeps only objects matching the target.
+
+        Frames that are blurred by the scanning motion, or show what the last inspected
+        frame showed, are skipped (see `inference.quality.FrameGate`).
+
+        Args:
+            frame (Frame): The camera frame to run detection on.
+
+        Returns:
+            list: The detected target objects (empty for skipped frames).
+        """
+        # Camera direction at capture, and its rotation rate just before (from the odometry)
+        heading = self._camera_heading(frame.timestamp)
+        omega = normalize_angle(heading - self._camera_heading(frame.timestamp - MOTION_WINDOW)) / MOTION_WINDOW
+
+        if not self.gate.accept(frame.image, frame.timestamp, heading, omega):
+            return []
+
+        return self.select(self.detector.get_objects(frame.image, threshold=self.threshold))
+
+    def _camera_heading(self, timestamp: float) -> float:
+        """
+        Returns the direction of the camera (radians) at a given time.
+        """
+        robot = self.supervisor.robot
+        pose = robot.odometry.pose_at(timestamp)
+        heading = pose.theta if pose is not None else 0.0
+        pan, _ = robot.pan_tilt.angles_at(timestamp)
+        return heading + math.radians(pan)
+
     def update(self) -> None:
         """
         Runs object detection on the latest camera frame and updates the robot's behavior.
         """
         if self.supervisor.has_vision:
-            # Run the object detector on the current camera frame
-            objects = self.detector.get_objects(self.supervisor.image, threshold=self.threshold)
-
-            # Filter detected objects to match the target object (if not detecting faces)
-            if self.supervisor.target_object != "face":
-                objects = [o for o in objects if self.labels.get(o.id) == self.supervisor.target_object]
+            # Get target objects in the current camera frame
+            objects = self.supervisor.get_objects(self.detect)
 
             if objects:
-                # Object detected, set detection flag
+                # Object detected, set detection flag and stop scanning at once
                 self.detection.set()
+                self.scanner.cancel()
+
+                # Draw bounding boxes and labels on the image (only if the frame is shown)
+                if self.supervisor.overlay:
+                    from aiymakerkit import vision  # Robot-only dependency, imported when drawing
 
-                # Draw bounding boxes and labels on the image
-                vision.draw_objects(self.supervisor.image, objects, self.labels)
+                    vision.draw_objects(self.supervisor.image, objects, self.labels)
 
-    def scan_pan_tilt(self, scan_speed: float = 0.5) -> None:
+    def scan_pan_tilt(self, scan_speed: float = 0.5) -> list[Waypoint]:
         """
-        Scans the environment by moving the pan-tilt mechanism in a sweeping motion.
+        Plans a sweeping scan with the pan-tilt mechanism.
+
+        The camera sweeps the pan range in steps, once per tilt angle, reversing the pan
+        direction on every row and the tilt order on every pass (play it with `repeat`).
 
         Args:
-            scan_speed (float): Delay time (in seconds) between pan/tilt adjustments.
+            scan_speed (float): Time (in seconds) spent at each pan/tilt position.
+
+        Returns:
+            list[Waypoint]: One full pass of the scan.
         """
         tilt_angles = list(range(0, 60, 30))  # Tilt angles from 0° to 60°
         pan_angles = list(range(-90, 91, 30))  # Pan angles from -90° to 90°
 
-        # Perform a continuous scanning motion
-        while True:
+        waypoints = []
+        for _ in range(2):  # The pattern repeats after two passes
             for tilt in tilt_angles:
-                if self.detection.is_set():
-                    return
-                with self.supervisor._lock:
-                    self.supervisor.tilt = tilt
-
-                for pan in pan_angles:
-                    time.sleep(scan_speed)
-                    if self.detection.is_set():
-                        return
-                    with self.supervisor._lock:
-                        self.supervisor.pan = pan
-
-                # Reverse pan angle order for next cycle
+                waypoints.extend(Waypoint(scan_speed, pan=pan, tilt=tilt) for pan in pan_angles)
+
+                # Reverse pan angle order for the next row
                 pan_angles.reverse()
             tilt_angles.reverse()
 
-    def scan_drive(self, scan_speed: float = 1.5) -> None:
+        return waypoints
+
+    def scan_drive(
+        self,
+        scan_speed: float = SCAN_SPEED,
+        pause_step: Optional[float] = None,
+        pause_time: float = PAUSE_TIME,
+    ) -> list[Waypoint]:
         """
-        Rotates the robot in place while scanning for an object.
+        Plans a scan rotating the robot in place.
 
         Args:
             scan_speed (float): Angular speed (rad/s) of the robot while scanning.
+            pause_step (Optional[float], optional): Turn in steps of this angle (radians) and hold still
+                                                    after each, so the camera captures sharp frames.
+                                                    Defaults to None (turn continuously).
+            pause_time (float, optional): Time (seconds) held at each pause. Defaults to `PAUSE_TIME`.
+
+        Returns:
+            list[Waypoint]: One full 360° turn with the camera level (play it with `repeat`).
         """
-        tilt_angles = [0]  # Keep tilt at 0° while scanning
         turn_time: float = (2 * math.pi) / scan_speed  # Time for a full 360° turn
-
-        # Start turning in place
-        with self.supervisor._lock:
-            self.supervisor.omega = scan_speed
-
-        # Perform a continuous scanning motion
-        while True:
-            for tilt in tilt_angles:
-                if self.detection.is_set():
-                    return
-                with self.supervisor._lock:
-                    self.supervisor.tilt = tilt
-
-                # Rotate for a full 360° turn
-                start_time = time.time()
-                while (time.time() - start_time) < turn_time:
-                    if self.detection.is_set():
-                        with self.supervisor._lock:
-                            self.supervisor.omega = 0  # Stop rotation
-                        return
-
-            # Reverse tilt angles for next cycle
-            tilt_angles.reverse()
\ No newline at end of file
+        if not pause_step:
+            return [Waypoint(turn_time, tilt=0, omega=scan_speed)]
+
+        # Turn and pause at evenly spaced headings
+        steps = max(round(2 * math.pi / pause_step), 1)
+        waypoints = []
+        for _ in range(steps):
+            waypoints.append(Waypoint(turn_time / steps, tilt=0, omega=scan_speed))
+            waypoints.append(Waypoint(pause_time, omega=0.0))
+        return waypoints
@@ -0,0 +1,143 @@
+import threading
+from typing import NamedTuple, Optional, Sequence
+
+# Local imports
+import utils.clock as clock
+from utils.metrics import metrics
+
+
+class Waypoint(NamedTuple):
+    """
+    A motion primitive: setpoints applied to the supervisor and held for a time.
+
+    Setpoints left as None keep their current value.
+    """
+
+    duration: float  # Time the setpoints are held (seconds)
+    pan: Optional[float] = None  # Pan angle (degrees)
+    tilt: Optional[float] = None  # Tilt angle (degrees)
+    v: Optional[float] = None  # Translational velocity (m/s)
+    omega: Optional[float] = None  # Angular velocity (rad/s)
+
+
+# Waypoint stopping the drive (the gimbal stays where it is)
+STOP = Waypoint(0.0, v=0.0, omega=0.0)
+
+
+class MotionScheduler:
+    """
+    Plays sequences of timed waypoints (pan sweeps, tilt steps, in-place turns) on one timer thread.
+
+    Between waypoints the thread blocks on a condition variable until the next deadline
+    on the process clock, so a running plan costs no CPU, and `cancel` wakes it at once:
+    the plan stops without waiting for the current waypoint to run out.
+    """
+
+    def __init__(self, supervisor) -> None:
+        """
+        Initializes the scheduler without a plan.
+
+        Args:
+            supervisor: The Supervisor whose motion setpoints are driven.
+        """
+        self.supervisor = supervisor
+        self._condition = threading.Condition()
+        self._cancelled: bool = False
+        self._thread: Optional[threading.Thread] = None
+        self._waypoints = metrics.counter('motion.waypoints')
+
+    @property
+    def running(self) -> bool:
+        """Returns whether a plan is being played."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, waypoints: Sequence[Waypoint], repeat: bool = False, final: Optional[Waypoint] = None) -> None:
+        """
+        Plays a plan, replacing the current one.
+
+        Args:
+            waypoints (Sequence[Waypoint]): The waypoints, in order.
+            repeat (bool, optional): Start over after the last waypoint until cancelled. Defaults to False.
+            final (Optional[Waypoint], optional): Setpoints applied once the plan ends or is cancelled
+                                                  (e.g. `STOP`). Defaults to None.
+        """
+        self.cancel()
+        self.join()
+
+        self._cancelled = False
+        self._thread = threading.Thread(
+            target=self._run, args=(tuple(waypoints), repeat, final), name="motion", daemon=True
+        )
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """
+        Stops the current plan immediately (its `final` waypoint is still applied).
+        """
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the current plan to end.
+
+        Args:
+            timeout (Optional[float], optional): Longest wait (in seconds). Defaults to None (no limit).
+
+        Returns:
+            bool: True if no plan is running anymore.
+        """
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return not self.running
+
+    def _apply(self, waypoint: Waypoint) -> None:
+        """
+        Writes the setpoints of a waypoint to the supervisor.
+        """
+        with self.supervisor._lock:
+            if waypoint.pan is not None:
+                self.supervisor.pan = waypoint.pan
+            if waypoint.tilt is not None:
+                self.supervisor.tilt = waypoint.tilt
+            if waypoint.v is not None:
+                self.supervisor.v = waypoint.v
+            if waypoint.omega is not None:
+                self.supervisor.omega = waypoint.omega
+
+    def _hold(self, duration: float) -> bool:
+        """
+        Blocks until a waypoint's time has passed on the process clock.
+
+        Returns:
+            bool: False if the plan was cancelled in the meantime.
+        """
+        deadline = clock.monotonic() + duration
+        with self._condition:
+            while not self._cancelled:
+                remaining = deadline - clock.monotonic()
+                if remaining <= 0:
+                    return True
+                clock.wait(self._condition, remaining)
+            return False
+
+    def _run(self, waypoints: Sequence[Waypoint], repeat: bool, final: Optional[Waypoint]) -> None:
+        """
+        Timer thread: applies each waypoint and holds it until its deadline or cancellation.
+        """
+        try:
+            while waypoints:
+                for waypoint in waypoints:
+                    if self._cancelled:
+                        return
+                    self._apply(waypoint)
+                    self._waypoints.inc()
+                    if not self._hold(waypoint.duration):
+                        return
+                if not repeat:
+                    return
+        finally:
+            if final is not None:
+                self._apply(final)
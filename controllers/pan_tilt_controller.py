@@ -1,12 +1,15 @@
 import cv2
-from aiymakerkit import vision, utils
 
 # Local imports
 import data.models as models
+import utils.clock as clock
+from inference.registry import registry
 from controllers.pid import PID
+from controllers.target_detection import TargetDetection
+from hardware.pan_tilt import PAN_ANGLES, TILT_ANGLES
 
 
-class PanTiltController:
+class PanTiltController(TargetDetection):
     """
     A controller for adjusting the robot's pan-tilt mechanism to track objects.
 
@@ -32,19 +35,21 @@ class PanTiltController:
 
             # Initialize object detection model based on target type
             if self.supervisor.target_object == "face":
-                self.detector = vision.Detector(models.FACE_DETECTION_MODEL)
+                self.model: str = models.FACE_DETECTION_MODEL
                 self.labels = None
                 self.threshold: float = 0.1  # Lower threshold for face detection
             else:
-                self.detector = vision.Detector(models.OBJECT_DETECTION_MODEL)
-                self.labels = utils.read_labels_from_metadata(models.OBJECT_DETECTION_MODEL)
+                self.model: str = models.OBJECT_DETECTION_MODEL
+                self.labels = registry.labels(models.OBJECT_DETECTION_MODEL)
                 self.threshold: float = 0.4  # Higher threshold for object detection
 
-            # Initialize PID controllers for pan and tilt adjustments
-            self.pan_pid = PID(kP=0.035, kI=0.0004, kD=0.0001)
+            self.init_detection(W, H)
+
+            # Initialize PID controllers for pan and tilt adjustments (bounded to the servo travel)
+            self.pan_pid = PID(kP=0.035, kI=0.0004, kD=0.0001, output_limits=PAN_ANGLES)
             self.pan_pid.initialize(offset=self.supervisor.pan)
 
-            self.tilt_pid = PID(kP=0.06, kI=0.0006, kD=0.0002)
+            self.tilt_pid = PID(kP=0.06, kI=0.0006, kD=0.0002, output_limits=TILT_ANGLES)
             self.tilt_pid.initialize(offset=self.supervisor.tilt)
 
     def update(self) -> None:
@@ -55,30 +60,38 @@ class PanTiltController:
         with the target's position in the frame.
         """
         if self.supervisor.has_vision:
-            # Run object detection on the current camera frame
-            objects = self.detector.get_objects(self.supervisor.image, threshold=self.threshold)
-
-            # Filter detected objects to match the target object (if not detecting faces)
-            if self.supervisor.target_object != "face":
-                objects = [o for o in objects if self.labels.get(o.id) == self.supervisor.target_object]
+            # Get target objects in the current camera frame
+            objects = self.supervisor.get_objects(self.detect, self.select)
 
             if objects:
-                # Draw bounding boxes and labels on the image
-                vision.draw_objects(self.supervisor.image, objects, self.labels)
+                # Draw bounding boxes and labels on the image (only if the frame is shown)
+                if self.supervisor.overlay:
+                    from aiymakerkit import vision  # Robot-only dependency, imported when drawing
+
+                    vision.draw_objects(self.supervisor.image, objects, self.labels)
 
                 # Extract bounding box coordinates of the first detected object
                 (x_min, y_min, x_max, y_max) = objects[0].bbox
-                obj_x: int = int((x_min + x_max) / 2.0)  # Compute object's center X-coordinate
-                obj_y: int = int((y_min + y_max) / 2.0)  # Compute object's center Y-coordinate
+                obj_x: float = int((x_min + x_max) / 2.0)  # Compute object's center X-coordinate
+                obj_y: float = int((y_min + y_max) / 2.0)  # Compute object's center Y-coordinate
+
+                # Project the object into the current camera view (latency compensation)
+                if self.predictor is not None:
+                    detections = self.supervisor.detections
+                    obj_x, obj_y = self.predictor.predict(
+                        obj_x, obj_y, detections.timestamp, detections.seq, clock.monotonic()
+                    )
 
                 # Compute tracking errors and update PID controllers
-                pan_error: int = self.center_x - obj_x  # Horizontal offset from center
+                pan_error: float = self.center_x - obj_x  # Horizontal offset from center
                 self.supervisor.pan = self.pan_pid.update(pan_error)  # Adjust pan angle
 
-                tilt_error: int = self.center_y - obj_y  # Vertical offset from center
+                tilt_error: float = self.center_y - obj_y  # Vertical offset from center
                 self.supervisor.tilt = self.tilt_pid.update(tilt_error)  # Adjust tilt angle
 
             else:
                 # If no objects were detected, reset pan and tilt adjustments
+                if self.predictor is not None:
+                    self.predictor.reset()
                 self.supervisor.pan = self.pan_pid.update(0)
                 self.supervisor.tilt = self.tilt_pid.update(0)
\ No newline at end of file
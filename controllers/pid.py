@@ -1,4 +1,9 @@
-import time
+import math
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import utils.clock as clock
 
 
 class PID:
@@ -6,10 +11,29 @@ class PID:
     Implements a simple PID (Proportional-Integral-Derivative) controller.
 
     The PID controller adjusts a control variable based on proportional, integral,
-    and derivative terms calculated from error values over time.
+    and derivative terms calculated from error values over time. The output and the
+    integral term can be bounded; while the output is saturated the integral stops
+    growing in the saturating direction (anti-windup). The derivative term can be
+    low-pass filtered, and a fixed time step can replace clock readings.
     """
 
-    def __init__(self, kP: float = 1.0, kI: float = 0.0, kD: float = 0.0) -> None:
+    __slots__ = (
+        'kP', 'kI', 'kD', 'dt', 'output_limits', 'derivative_filter', 'time_fn',
+        '_integral_low', '_integral_high',
+        'currTime', 'prevTime', 'prevError', 'cP', 'cI', 'cD',
+    )
+
+    def __init__(
+        self,
+        kP: float = 1.0,
+        kI: float = 0.0,
+        kD: float = 0.0,
+        dt: Optional[float] = None,
+        output_limits: Optional[Tuple[float, float]] = None,
+        integral_limits: Optional[Tuple[float, float]] = None,
+        derivative_filter: float = 1.0,
+        time_fn: Callable[[], float] = clock.monotonic,
+    ) -> None:
         """
         Initializes the PID controller with given gain values.
 
@@ -17,10 +41,34 @@ class PID:
             kP (float, optional): Proportional gain. Defaults to 1.0.
             kI (float, optional): Integral gain. Defaults to 0.0.
             kD (float, optional): Derivative gain. Defaults to 0.0.
+            dt (Optional[float], optional): Fixed time step (in seconds) used instead of the clock.
+                                            Defaults to None (measure the elapsed time).
+            output_limits (Optional[Tuple[float, float]], optional): Minimum and maximum output.
+                                                                     Defaults to None (unbounded).
+            integral_limits (Optional[Tuple[float, float]], optional): Minimum and maximum contribution
+                                                                       of the integral term to the output.
+                                                                       Defaults to `output_limits`.
+            derivative_filter (float, optional): Smoothing factor of the derivative low-pass filter
+                                                 (0-1, 1 disables filtering). Defaults to 1.0.
+            time_fn (Callable[[], float], optional): Monotonic time source (in seconds).
+                                                     Defaults to `utils.clock.monotonic`.
         """
         self.kP: float = kP  # Proportional gain
         self.kI: float = kI  # Integral gain
         self.kD: float = kD  # Derivative gain
+        self.dt: Optional[float] = dt  # Fixed time step
+        self.output_limits: Tuple[float, float] = output_limits or (-math.inf, math.inf)
+        self.derivative_filter: float = derivative_filter
+        self.time_fn: Callable[[], float] = time_fn
+
+        # Bounds of the accumulated error, so that kI * cI stays within the integral limits
+        low, high = integral_limits or self.output_limits
+        if kI != 0:
+            low, high = sorted((low / kI, high / kI))
+        self._integral_low: float = low
+        self._integral_high: float = high
+
+        self.initialize()
 
     def initialize(self, offset: float = 0.0) -> None:
         """
@@ -30,7 +78,7 @@ class PID:
             offset (float, optional): Initial offset value for integral term. Defaults to 0.0.
         """
         # Initialize time tracking
-        self.currTime: float = time.time()
+        self.currTime: float = self.time_fn() if self.dt is None else 0.0
         self.prevTime: float = self.currTime
 
         # Initialize previous error
@@ -41,41 +89,211 @@ class PID:
         self.cI: float = (offset / self.kI) if self.kI > 0 else 0.0  # Integral term
         self.cD: float = 0.0  # Derivative term
 
-    def update(self, error: float, sleep: float = 0.0) -> float:
+    def update(self, error: float) -> float:
         """
         Updates the PID controller with a new error value and computes the control output.
 
         Args:
             error (float): The current error value.
-            sleep (float, optional): Optional delay before computing the update (in seconds). Defaults to 0.0.
 
         Returns:
             float: The computed control output based on PID calculations.
         """
-        # Pause for the specified duration (if any)
-        time.sleep(sleep)
-
-        # Capture the current time and compute time difference
-        self.currTime = time.time()
-        deltaTime: float = self.currTime - self.prevTime
-
-        # Compute change in error
-        deltaError: float = error - self.prevError
+        # Advance time by the fixed step or by the measured elapsed time
+        if self.dt is None:
+            self.currTime = self.time_fn()
+            deltaTime: float = self.currTime - self.prevTime
+        else:
+            deltaTime = self.dt
+            self.currTime = self.prevTime + deltaTime
 
         # Compute PID terms
         self.cP = error  # Proportional term
-        self.cI += error * deltaTime  # Integral term
 
-        # Compute derivative term (avoid division by zero)
-        self.cD = (deltaError / deltaTime) if deltaTime > 0 else 0.0
+        # Integral term (bounded)
+        integral = self.cI + error * deltaTime
+        integral = min(max(integral, self._integral_low), self._integral_high)
+
+        # Derivative term (avoid division by zero), low-pass filtered
+        if deltaTime > 0:
+            self.cD += self.derivative_filter * ((error - self.prevError) / deltaTime - self.cD)
 
         # Save previous time and error for the next update
         self.prevTime = self.currTime
         self.prevError = error
 
-        # Compute and return the control output
-        return sum([
-            self.kP * self.cP,
-            self.kI * self.cI,
-            self.kD * self.cD
-        ])
\ No newline at end of file
+        # Compute the control output
+        output = self.kP * self.cP + self.kI * integral + self.kD * self.cD
+
+        # Saturate the output; don't integrate further into the saturation (anti-windup)
+        low, high = self.output_limits
+        if output > high:
+            output = high
+            if error * self.kI > 0:
+                integral = self.cI
+        elif output < low:
+            output = low
+            if error * self.kI < 0:
+                integral = self.cI
+
+        self.cI = integral
+        return output
+
+
+class PIDBank:
+    """
+    Steps several independent PID controllers (e.g. pan, tilt and turn) together.
+
+    The per-axis state lives in NumPy arrays and every update works in preallocated
+    buffers, so stepping the bank allocates nothing. It behaves like one `PID` per axis
+    sharing a single clock reading. The fixed NumPy call overhead only pays off for many
+    axes (e.g. batched simulations); for a handful of axes the scalar `PID` is cheaper.
+    """
+
+    def __init__(
+        self,
+        kP: Sequence[float],
+        kI: Union[float, Sequence[float]] = 0.0,
+        kD: Union[float, Sequence[float]] = 0.0,
+        dt: Optional[float] = None,
+        output_limits: Optional[Sequence[Tuple[float, float]]] = None,
+        integral_limits: Optional[Sequence[Tuple[float, float]]] = None,
+        derivative_filter: Union[float, Sequence[float]] = 1.0,
+        time_fn: Callable[[], float] = clock.monotonic,
+    ) -> None:
+        """
+        Initializes the bank with one controller per gain in `kP`.
+
+        Args:
+            kP (Sequence[float]): Proportional gain of each axis.
+            kI (Union[float, Sequence[float]], optional): Integral gains. Defaults to 0.0.
+            kD (Union[float, Sequence[float]], optional): Derivative gains. Defaults to 0.0.
+            dt (Optional[float], optional): Fixed time step (in seconds) used instead of the clock.
+                                            Defaults to None (measure the elapsed time).
+            output_limits (Optional[Sequence[Tuple[float, float]]], optional): Minimum and maximum output
+                                                                               of each axis. Defaults to None.
+            integral_limits (Optional[Sequence[Tuple[float, float]]], optional): Minimum and maximum integral
+                                                                                 contribution of each axis.
+                                                                                 Defaults to `output_limits`.
+            derivative_filter (Union[float, Sequence[float]], optional): Derivative smoothing factors
+                                                                         (0-1, 1 disables filtering).
+                                                                         Defaults to 1.0.
+            time_fn (Callable[[], float], optional): Monotonic time source (in seconds).
+                                                     Defaults to `utils.clock.monotonic`.
+        """
+        self.kP: np.ndarray = np.array(kP, dtype=np.float64)
+        n = self.kP.size
+        self.kI: np.ndarray = np.broadcast_to(np.asarray(kI, dtype=np.float64), n).copy()
+        self.kD: np.ndarray = np.broadcast_to(np.asarray(kD, dtype=np.float64), n).copy()
+        self.derivative_filter: np.ndarray = np.broadcast_to(
+            np.asarray(derivative_filter, dtype=np.float64), n
+        ).copy()
+        self.dt: Optional[float] = dt
+        self.time_fn: Callable[[], float] = time_fn
+
+        # Output bounds and integral bounds (in accumulated-error units, as in `PID`)
+        limits = np.array(output_limits, dtype=np.float64).reshape(n, 2) if output_limits is not None \
+            else np.tile((-np.inf, np.inf), (n, 1))
+        self.output_low: np.ndarray = limits[:, 0].copy()
+        self.output_high: np.ndarray = limits[:, 1].copy()
+
+        bounds = np.array(integral_limits, dtype=np.float64).reshape(n, 2) if integral_limits is not None \
+            else limits.copy()
+        nonzero = self.kI != 0
+        bounds[nonzero] /= self.kI[nonzero, None]
+        bounds.sort(axis=1)
+        self._integral_low: np.ndarray = bounds[:, 0].copy()
+        self._integral_high: np.ndarray = bounds[:, 1].copy()
+
+        # Per-axis state and preallocated work buffers
+        self.prevError: np.ndarray = np.zeros(n)
+        self.cP: np.ndarray = np.zeros(n)
+        self.cI: np.ndarray = np.zeros(n)
+        self.cD: np.ndarray = np.zeros(n)
+        self.output: np.ndarray = np.zeros(n)
+        self._integral: np.ndarray = np.zeros(n)
+        self._tmp: np.ndarray = np.zeros(n)
+        self._mask: np.ndarray = np.zeros(n, dtype=bool)
+        self._sign: np.ndarray = np.zeros(n, dtype=bool)
+        self._saturated: np.ndarray = np.zeros(n, dtype=bool)
+
+        self.initialize()
+
+    def __len__(self) -> int:
+        return self.kP.size
+
+    def initialize(self, offset: Union[float, Sequence[float]] = 0.0) -> None:
+        """
+        Resets the state of all axes.
+
+        Args:
+            offset (Union[float, Sequence[float]], optional): Initial output offset of each axis,
+                                                              held by the integral term. Defaults to 0.0.
+        """
+        self.currTime: float = self.time_fn() if self.dt is None else 0.0
+        self.prevTime: float = self.currTime
+
+        self.prevError.fill(0.0)
+        self.cP.fill(0.0)
+        self.cD.fill(0.0)
+        self.cI.fill(0.0)
+        np.divide(offset, self.kI, out=self.cI, where=self.kI > 0)
+
+    def update(self, errors: Union[np.ndarray, Sequence[float]]) -> np.ndarray:
+        """
+        Updates all axes with new error values and computes their control outputs.
+
+        Args:
+            errors (Union[np.ndarray, Sequence[float]]): The current error of each axis.
+
+        Returns:
+            np.ndarray: The control output of each axis. The array is reused by the next update.
+        """
+        if self.dt is None:
+            self.currTime = self.time_fn()
+            deltaTime: float = self.currTime - self.prevTime
+        else:
+            deltaTime = self.dt
+            self.currTime = self.prevTime + deltaTime
+
+        error, tmp, integral, output = self.cP, self._tmp, self._integral, self.output
+        np.copyto(error, errors)  # Proportional term
+
+        # Integral term (bounded)
+        np.multiply(error, deltaTime, out=tmp)
+        np.add(self.cI, tmp, out=integral)
+        np.clip(integral, self._integral_low, self._integral_high, out=integral)
+
+        # Derivative term, low-pass filtered
+        if deltaTime > 0:
+            np.subtract(error, self.prevError, out=tmp)
+            tmp /= deltaTime
+            tmp -= self.cD
+            tmp *= self.derivative_filter
+            self.cD += tmp
+
+        self.prevTime = self.currTime
+        np.copyto(self.prevError, error)
+
+        # Compute the control output
+        np.multiply(self.kP, error, out=output)
+        np.multiply(self.kI, integral, out=tmp)
+        output += tmp
+        np.multiply(self.kD, self.cD, out=tmp)
+        output += tmp
+
+        # Don't integrate further into a saturated output (anti-windup)
+        saturated, mask, sign = self._saturated, self._mask, self._sign
+        np.multiply(error, self.kI, out=tmp)
+        np.greater(output, self.output_high, out=saturated)
+        np.greater(tmp, 0, out=sign)
+        saturated &= sign
+        np.less(output, self.output_low, out=mask)
+        np.less(tmp, 0, out=sign)
+        mask &= sign
+        saturated |= mask
+        np.copyto(integral, self.cI, where=saturated)
+        np.copyto(self.cI, integral)
+
+        np.clip(output, self.output_low, self.output_high, out=output)
+        return output
@@ -0,0 +1,136 @@
+import cv2
+
+# Local imports
+import data.models as models
+from inference.registry import registry
+from controllers.pid import PID
+from hardware.camera import Frame
+from hardware.pan_tilt import TILT_ANGLES
+from inference.pose import HEAD, HIPS, SHOULDERS, KeypointSmoother, center
+
+
+class PoseTrackController:
+    """
+    A controller for following a person using pose estimation.
+
+    MoveNet finds the person's keypoints, which are smoothed over time. The robot
+    turns towards the torso center, tilts the camera towards the head and keeps its
+    distance by the apparent torso length, which is steadier than the area of a
+    detection box (it doesn't change with arm poses or partial occlusion of the legs).
+    """
+
+    def __init__(self, supervisor) -> None:
+        """
+        Initializes the PoseTrackController.
+
+        Args:
+            supervisor: The Supervisor instance managing the robot's state.
+        """
+        self.supervisor = supervisor
+        self.name: str = "Pose Track"
+
+        if self.supervisor.has_vision:
+            # Get image dimensions
+            self.image_height: int = self.supervisor.image.shape[0]
+            self.image_width: int = self.supervisor.image.shape[1]
+            self.center_x: int = self.image_width // 2  # X-coordinate of image center
+            self.center_y: int = self.image_height // 2  # Y-coordinate of image center
+
+            # Initialize pose estimation model
+            self.model: str = models.MOVENET_MODEL
+            self.estimator = registry.pose_estimator(self.model)  # Shared estimator (loaded once)
+            self.threshold: float = 0.2  # Minimum mean keypoint score of a pose
+            self.goal_size: float = 0.35  # Target torso length relative to the frame height
+            self.supervisor.tilt = 30  # Adjust tilt for body tracking
+
+            # Keypoint smoothing (applied once per new pose, on its capture time)
+            self.smoother = KeypointSmoother()
+            self._seq: int = -1
+
+            # Initialize PID controllers for turning and tilting
+            self.turn_pid = PID(kP=0.003, kI=0.00000, kD=0.00000)
+            self.turn_pid.initialize(offset=self.supervisor.omega)
+
+            self.tilt_pid = PID(kP=0.06, kI=0.0006, kD=0.0002, output_limits=TILT_ANGLES)
+            self.tilt_pid.initialize(offset=self.supervisor.tilt)
+
+    def detect(self, frame: Frame) -> list:
+        """
+        Estimates the pose of the person in a frame.
+
+        Args:
+            frame (Frame): The camera frame to run pose estimation on.
+
+        Returns:
+            list: The pose as a one-element list, or an empty list.
+        """
+        return self.estimator.get_objects(frame.image, threshold=self.threshold)
+
+    def update(self) -> None:
+        """
+        Updates the robot's movement to follow the person.
+
+        The robot will adjust its tilt and velocity to keep the person's torso
+        at the center of the frame at the goal distance.
+        """
+        if self.supervisor.has_vision:
+            # Get the pose in the current camera frame
+            poses = self.supervisor.get_objects(self.detect)
+
+            if poses:
+                # Smooth each new pose once, on the capture time of its frame
+                detections = self.supervisor.detections
+                if detections.seq != self._seq:
+                    self._seq = detections.seq
+                    self.smoother.update(poses[0].keypoints, detections.timestamp)
+                keypoints = self.smoother.keypoints
+
+                shoulders = center(keypoints, SHOULDERS)
+                hips = center(keypoints, HIPS)
+                head = center(keypoints, HEAD)
+                torso = center(keypoints, SHOULDERS + HIPS)
+
+                # Draw the pose box and keypoints (only if the frame is shown)
+                if self.supervisor.overlay:
+                    from aiymakerkit import vision  # Robot-only dependency, imported when drawing
+
+                    vision.draw_objects(self.supervisor.image, poses)
+                    for x, y, score in keypoints:
+                        if score >= self.smoother.threshold:
+                            cv2.circle(self.supervisor.image, (int(x), int(y)), 3, (0, 255, 255), -1)
+
+                if torso is None and head is None:
+                    self._stop()
+                    return
+
+                # Turn towards the torso (or the head if the torso is out of view)
+                obj_x, _ = torso if torso is not None else head
+                turn_error: float = self.center_x - obj_x  # Horizontal offset from center
+                self.supervisor.omega = self.turn_pid.update(turn_error)  # Adjust turning
+
+                # Tilt towards the head (or the shoulders if the head is out of view)
+                _, obj_y = head if head is not None else (shoulders or torso)
+                tilt_error: float = self.center_y - obj_y  # Vertical offset from center
+                self.supervisor.tilt = self.tilt_pid.update(tilt_error)  # Adjust tilting
+
+                # Compute drive error from the torso length (hold still without a full torso)
+                if shoulders is not None and hips is not None:
+                    torso_size: float = abs(hips[1] - shoulders[1]) / self.image_height
+                    drive_error: float = 1 - min(torso_size / self.goal_size, 1)
+                else:
+                    drive_error = 0.0
+
+                # Compute velocity adjustment (speed decreases with larger omega)
+                drive_max: float = 0.4  # Maximum velocity (m/s)
+                self.supervisor.v = (drive_error * drive_max) / (abs(self.supervisor.omega) + 1) ** 0.5
+
+            else:
+                self._stop()
+
+    def _stop(self) -> None:
+        """
+        Resets movements while no person is visible.
+        """
+        self.supervisor.omega = self.turn_pid.update(0)
+        self.supervisor.tilt = self.tilt_pid.update(0)
+        self.supervisor.v = 0  # Stop moving forward
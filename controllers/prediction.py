@@ -0,0 +1,140 @@
+import math
+from typing import Optional, Tuple
+
+# Local imports
+from hardware.camera import CAMERA_HFOV, CAMERA_VFOV
+from utils.pose import normalize_angle
+
+# Prediction settings
+RATE_SMOOTHING: float = 0.3  # Weight of a new measurement in the target's angular rate estimate (0-1)
+MAX_TARGET_RATE: float = 2.0  # Largest believed target angular rate (rad/s)
+MAX_HORIZON: float = 0.3  # Longest time the target is extrapolated over (seconds)
+MAX_GAP: float = 0.5  # Measurements further apart than this (seconds) restart the rate estimate
+MAX_BEARING: float = math.radians(80)  # Projections are clamped to this angle off the camera axis
+
+
+class TargetPredictor:
+    """
+    Projects a target seen in an older camera frame into the current camera view.
+
+    Detections describe where the target was when their frame was captured, tens of
+    milliseconds ago; since then the robot has turned and the gimbal has moved. The
+    target's pixel position is turned into a bearing and elevation relative to the
+    robot's heading and gimbal angles at capture time (looked up in the odometry and
+    pan-tilt histories), advanced by a constant angular velocity model of the target,
+    and projected back into the camera at its current orientation. Controllers compute
+    their errors from the projected position, so the camera's own motion no longer
+    shows up as delayed target motion.
+
+    Only rotations are compensated: the target's distance is unknown, so the robot's
+    translation over the latency is ignored (it barely moves the bearing of a target
+    more than a short distance away).
+    """
+
+    def __init__(
+        self,
+        robot,
+        image_width: int,
+        image_height: int,
+        hfov: float = CAMERA_HFOV,
+        vfov: float = CAMERA_VFOV,
+        velocity: bool = True,
+    ) -> None:
+        """
+        Initializes the predictor without a target.
+
+        Args:
+            robot: The robot, whose odometry and pan-tilt histories are used.
+            image_width (int): Width of the camera frames (pixels).
+            image_height (int): Height of the camera frames (pixels).
+            hfov (float, optional): Horizontal field of view (radians). Defaults to `CAMERA_HFOV`.
+            vfov (float, optional): Vertical field of view (radians). Defaults to `CAMERA_VFOV`.
+            velocity (bool, optional): Extrapolate the target's own motion. Defaults to True.
+        """
+        self.robot = robot
+        self.velocity: bool = velocity
+
+        # Pinhole camera model
+        self.center_x: float = image_width / 2
+        self.center_y: float = image_height / 2
+        self.fx: float = self.center_x / math.tan(hfov / 2)  # Focal length (pixels)
+        self.fy: float = self.center_y / math.tan(vfov / 2)
+
+        # Target state: direction at the last measurement (radians) and angular rate (rad/s)
+        self.bearing: float = 0.0  # Relative to the odometry frame, positive to the left
+        self.elevation: float = 0.0  # Relative to the robot's base, positive up
+        self.bearing_rate: float = 0.0
+        self.elevation_rate: float = 0.0
+        self._timestamp: Optional[float] = None
+        self._seq: int = -1
+
+    def reset(self) -> None:
+        """
+        Forgets the target.
+        """
+        self.bearing_rate = 0.0
+        self.elevation_rate = 0.0
+        self._timestamp = None
+        self._seq = -1
+
+    def _camera(self, timestamp: Optional[float]) -> Tuple[float, float]:
+        """
+        Returns the camera's bearing and elevation (radians) at a time, or now if it is None.
+        """
+        if timestamp is None:
+            heading = self.robot.odometry.pose.theta
+            pan, tilt = self.robot.pan, self.robot.tilt
+        else:
+            pose = self.robot.odometry.pose_at(timestamp)
+            heading = pose.theta if pose is not None else self.robot.odometry.pose.theta
+            pan, tilt = self.robot.pan_tilt.angles_at(timestamp)
+        return heading + math.radians(pan), math.radians(tilt)
+
+    def _measure(self, x: float, y: float, timestamp: float, seq: int) -> None:
+        """
+        Updates the target's direction and angular rate from a new detection.
+        """
+        camera_bearing, camera_elevation = self._camera(timestamp)
+        bearing = normalize_angle(camera_bearing + math.atan((self.center_x - x) / self.fx))
+        elevation = camera_elevation + math.atan((self.center_y - y) / self.fy)
+
+        dt = timestamp - self._timestamp if self._timestamp is not None else 0.0
+        if self.velocity and 0 < dt <= MAX_GAP:
+            bearing_rate = normalize_angle(bearing - self.bearing) / dt
+            elevation_rate = (elevation - self.elevation) / dt
+            self.bearing_rate += RATE_SMOOTHING * (bearing_rate - self.bearing_rate)
+            self.elevation_rate += RATE_SMOOTHING * (elevation_rate - self.elevation_rate)
+            self.bearing_rate = max(min(self.bearing_rate, MAX_TARGET_RATE), -MAX_TARGET_RATE)
+            self.elevation_rate = max(min(self.elevation_rate, MAX_TARGET_RATE), -MAX_TARGET_RATE)
+        elif dt > MAX_GAP or self._timestamp is None:
+            self.bearing_rate = self.elevation_rate = 0.0  # New (or long lost) target
+
+        self.bearing, self.elevation = bearing, elevation
+        self._timestamp, self._seq = timestamp, seq
+
+    def predict(self, x: float, y: float, timestamp: float, seq: int, now: float) -> Tuple[float, float]:
+        """
+        Returns where a detected target appears in the current camera view.
+
+        Args:
+            x (float): Target X-coordinate in its frame (pixels).
+            y (float): Target Y-coordinate in its frame (pixels).
+            timestamp (float): Capture time of the frame (seconds).
+            seq (int): Sequence number of the frame (each frame updates the target model once).
+            now (float): Current time (seconds).
+
+        Returns:
+            Tuple[float, float]: The predicted (x, y) position in the current view (pixels).
+        """
+        if seq != self._seq:
+            self._measure(x, y, timestamp, seq)
+
+        # Advance the target, then express it relative to the current camera direction
+        horizon = min(max(now - timestamp, 0.0), MAX_HORIZON)
+        camera_bearing, camera_elevation = self._camera(None)
+        bearing = normalize_angle(self.bearing + self.bearing_rate * horizon - camera_bearing)
+        elevation = self.elevation + self.elevation_rate * horizon - camera_elevation
+
+        bearing = max(min(bearing, MAX_BEARING), -MAX_BEARING)
+        elevation = max(min(elevation, MAX_BEARING), -MAX_BEARING)
+        return self.center_x - self.fx * math.tan(bearing), self.center_y - self.fy * math.tan(elevation)
@@ -0,0 +1,100 @@
+import numpy as np
+
+# Local imports
+from controllers.prediction import TargetPredictor
+from hardware.camera import Frame
+from inference.registry import registry
+from inference.roi import RoiDetector
+from inference.tracker import DetectThenTrack
+
+
+class TargetDetection:
+    """
+    Detection of a single target, shared by the controllers that keep it in view.
+
+    Controllers using it set `supervisor`, `model`, `labels` and `threshold` and then call
+    `init_detection`, which loads the shared detector and sets up the optional tracker,
+    region of interest and latency compensation the supervisor was configured with.
+    Their `update` passes `detect` and `select` to `Supervisor.get_objects`.
+    """
+
+    def init_detection(self, image_width: int, image_height: int) -> None:
+        """
+        Loads the detector and sets up tracking, ROI search and prediction as configured.
+
+        Args:
+            image_width (int): Width of the camera frames (pixels).
+            image_height (int): Height of the camera frames (pixels).
+        """
+        self.detector = registry.detector(self.model)  # Shared detector (loaded once)
+
+        # Optionally track the target between detector runs
+        self.tracker = DetectThenTrack() if self.supervisor.tracking else None
+
+        # Optionally search around the last known target before the full frame
+        self.roi = RoiDetector() if self.supervisor.roi else None
+
+        # Optionally steer by where the target is now rather than where it was in the frame
+        self.predictor = None
+        if self.supervisor.predict:
+            self.predictor = TargetPredictor(self.supervisor.robot, image_width, image_height)
+
+    def detect(self, frame: Frame) -> list:
+        """
+        Returns the target objects in a frame, tracking them between detector runs if enabled.
+
+        Args:
+            frame (Frame): The camera frame to run detection on.
+
+        Returns:
+            list: The detected or tracked target objects.
+        """
+        if self.tracker is not None:
+            return self.tracker.update(frame.image, self._run_detector)
+
+        return self._run_detector(frame.image)
+
+    def _run_detector(self, image: np.ndarray) -> list:
+        """
+        Runs the detector, around the last known target if ROI mode is enabled.
+
+        Args:
+            image (np.ndarray): The camera frame to run detection on.
+
+        Returns:
+            list: The detected target objects.
+        """
+        if self.roi is not None:
+            return self.roi.update(image, self._get_objects)
+
+        return self._get_objects(image)
+
+    def select(self, objects: list) -> list:
+        """
+        Keeps the objects matching the target with a high enough score.
+
+        Args:
+            objects (list): Objects detected by the controller's model.
+
+        Returns:
+            list: The target objects.
+        """
+        objects = [o for o in objects if o.score >= self.threshold]
+
+        # Filter detected objects to match the target object (if not detecting faces)
+        if self.supervisor.target_object != "face":
+            objects = [o for o in objects if self.labels.get(o.id) == self.supervisor.target_object]
+
+        return objects
+
+    def _get_objects(self, image: np.ndarray) -> list:
+        """
+        Runs the detector on an image and keeps only objects matching the target.
+
+        Args:
+            image (np.ndarray): The camera frame to run detection on.
+
+        Returns:
+            list: The detected target objects.
+        """
+        return self.select(self.detector.get_objects(image, threshold=self.threshold))
@@ -1,12 +1,15 @@
 import cv2
-from aiymakerkit import vision, utils
 
 # Local imports
 import data.models as models
+import utils.clock as clock
+from inference.registry import registry
 from controllers.pid import PID
+from controllers.target_detection import TargetDetection
+from hardware.pan_tilt import TILT_ANGLES
 
 
-class TrackController:
+class TrackController(TargetDetection):
     """
     A controller for tracking a specified object using computer vision.
 
@@ -34,7 +37,7 @@ class TrackController:
 
             # Initialize object detection model
             self.model: str = models.OBJECT_DETECTION_MODEL
-            self.labels = utils.read_labels_from_metadata(models.OBJECT_DETECTION_MODEL)
+            self.labels = registry.labels(models.OBJECT_DETECTION_MODEL)
 
             # Configure detection parameters based on target object type
             if self.supervisor.target_object == "face":
@@ -50,13 +53,15 @@ class TrackController:
                 self.goal_size: float = 0.3
                 self.threshold: float = 0.4
 
-            self.detector = vision.Detector(self.model)  # Initialize detector
+            self.init_detection(self.image_width, self.image_height)
 
             # Initialize PID controllers for turning and tilting
-            self.turn_pid = PID(kP=0.003, kI=0.00000, kD=0.00000)
+            # (without the detection delay in the loop, turning tolerates twice the gain)
+            turn_kP: float = 0.006 if self.predictor is not None else 0.003
+            self.turn_pid = PID(kP=turn_kP, kI=0.00000, kD=0.00000)
             self.turn_pid.initialize(offset=self.supervisor.omega)
 
-            self.tilt_pid = PID(kP=0.06, kI=0.0006, kD=0.0002)
+            self.tilt_pid = PID(kP=0.06, kI=0.0006, kD=0.0002, output_limits=TILT_ANGLES)
             self.tilt_pid.initialize(offset=self.supervisor.tilt)
 
     def update(self) -> None:
@@ -67,28 +72,34 @@ class TrackController:
         object at the center of the frame.
         """
         if self.supervisor.has_vision:
-            # Run object detection
-            objects = self.detector.get_objects(self.supervisor.image, threshold=self.threshold)
-
-            # Filter objects based on the target object type
-            if self.supervisor.target_object != "face":
-                objects = [o for o in objects if self.labels.get(o.id) == self.supervisor.target_object]
+            # Get target objects in the current camera frame
+            objects = self.supervisor.get_objects(self.detect, self.select)
 
             if objects:
-                # Draw bounding boxes and labels on the detected objects
-                vision.draw_objects(self.supervisor.image, objects, self.labels)
+                # Draw bounding boxes and labels on the detected objects (only if the frame is shown)
+                if self.supervisor.overlay:
+                    from aiymakerkit import vision  # Robot-only dependency, imported when drawing
+
+                    vision.draw_objects(self.supervisor.image, objects, self.labels)
 
                 # Extract bounding box coordinates of the first detected object
                 (x_min, y_min, x_max, y_max) = objects[0].bbox
-                obj_x: int = int((x_min + x_max) / 2.0)  # Center X-coordinate of object
-                obj_y: int = int((y_min + y_max) / 2.0)  # Center Y-coordinate of object
+                obj_x: float = int((x_min + x_max) / 2.0)  # Center X-coordinate of object
+                obj_y: float = int((y_min + y_max) / 2.0)  # Center Y-coordinate of object
                 obj_size: float = (x_max - x_min) * (y_max - y_min)  # Object area
 
+                # Project the object into the current camera view (latency compensation)
+                if self.predictor is not None:
+                    detections = self.supervisor.detections
+                    obj_x, obj_y = self.predictor.predict(
+                        obj_x, obj_y, detections.timestamp, detections.seq, clock.monotonic()
+                    )
+
                 # Compute tracking errors for pan and tilt
-                turn_error: int = self.center_x - obj_x  # Horizontal offset from center
+                turn_error: float = self.center_x - obj_x  # Horizontal offset from center
                 self.supervisor.omega = self.turn_pid.update(turn_error)  # Adjust turning
 
-                tilt_error: int = self.center_y - obj_y  # Vertical offset from center
+                tilt_error: float = self.center_y - obj_y  # Vertical offset from center
                 self.supervisor.tilt = self.tilt_pid.update(tilt_error)  # Adjust tilting
 
                 # Compute drive error (distance adjustment based on object size)
@@ -100,6 +111,8 @@ class TrackController:
 
             else:
                 # If no objects are found, reset movements
+                if self.predictor is not None:
+                    self.predictor.reset()
                 self.supervisor.omega = self.turn_pid.update(0)
                 self.supervisor.tilt = self.tilt_pid.update(0)
                 self.supervisor.v = 0  # Stop moving forward
\ No newline at end of file
@@ -0,0 +1,71 @@
+from typing import Tuple
+
+import cv2
+
+from hardware.camera import Camera
+
+
+class PiBackend:
+    """
+    Creates the robot's real hardware drivers.
+
+    Drivers are imported lazily so that other backends (see `hardware.sim`) can run
+    on machines without the Raspberry Pi libraries installed.
+    """
+
+    name: str = "pi"
+
+    def prepare(self) -> None:
+        """
+        Sets up process-wide state before the robot creates its hardware. Nothing to do on the robot.
+        """
+
+    def motor(self, motor_pins: Tuple[int, int, int]):
+        """
+        Creates a DC motor driven through the Raspberry Pi GPIO.
+
+        Args:
+            motor_pins (Tuple[int, int, int]): GPIO pin numbers (enable, in1, in2).
+        """
+        from hardware.motor import Motor
+        return Motor(motor_pins)
+
+    def servo_kit(self):
+        """
+        Creates the PCA9685 servo driver.
+        """
+        from adafruit_servokit import ServoKit
+        return ServoKit(channels=16, frequency=50)
+
+    def display(self):
+        """
+        Creates the SSD1306 OLED display.
+        """
+        from hardware.display import Display
+        return Display()
+
+    def camera(self, camera_id: int, width: int, height: int, max_age: float):
+        """
+        Opens the V4L2 camera and starts its background frame grabber.
+
+        Args:
+            camera_id (int): The camera id to be passed to OpenCV.
+            width (int): Requested frame width (pixels).
+            height (int): Requested frame height (pixels).
+            max_age (float): Frames older than this (seconds) are treated as missing.
+
+        Returns:
+            Tuple[cv2.VideoCapture, Camera]: The capture device and its frame grabber.
+        """
+        cap = cv2.VideoCapture(camera_id)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+        camera = Camera(cap, max_age=max_age)
+        camera.start()
+        return cap, camera
+
+    def attach(self, robot) -> None:
+        """
+        Hook called once the robot has been built. Nothing to do on the robot.
+        """
@@ -0,0 +1,255 @@
+import math
+import threading
+from typing import NamedTuple, Optional
+
+import cv2
+import numpy as np
+
+import utils.clock as clock
+from utils.metrics import metrics
+
+# Camera field of view (Raspberry Pi camera v2)
+CAMERA_HFOV: float = math.radians(62.2)  # Horizontal field of view
+CAMERA_VFOV: float = math.radians(48.8)  # Vertical field of view
+
+# Number of preallocated frame buffers (one being written, one ready, one being read)
+NUM_BUFFERS: int = 3
+
+# Delay before retrying after a failed grab (seconds)
+RETRY_DELAY: float = 0.01
+
+
+class Frame(NamedTuple):
+    """
+    A captured camera frame together with its capture metadata.
+    """
+
+    ok: bool  # Whether the frame was captured successfully
+    image: Optional[np.ndarray]  # Frame pixels (owned by the camera's buffer pool)
+    timestamp: float  # Capture time on the process clock (seconds)
+    seq: int  # Sequence number of the frame since the grabber started
+
+    @property
+    def age(self) -> float:
+        """Returns the time elapsed since the frame was captured (seconds)."""
+        return clock.monotonic() - self.timestamp
+
+
+# Placeholder returned before the first frame has been captured
+NO_FRAME = Frame(False, None, 0.0, -1)
+
+
+class Camera:
+    """
+    Grabs frames from a capture device on a dedicated background thread.
+
+    Frames are read into a small pool of preallocated buffers using triple buffering:
+    the grabber always writes into a free buffer, publishes it as the newest frame and
+    never touches the buffer currently handed out to the consumer. Frames that are
+    overwritten before being consumed are counted as dropped.
+    """
+
+    def __init__(self, cap, max_age: float = 0.1) -> None:
+        """
+        Initializes the camera grabber.
+
+        Args:
+            cap: An opened capture source exposing `read`, `isOpened` and `release`
+                 (e.g. `cv2.VideoCapture`).
+            max_age (float, optional): Maximum age (in seconds) of a frame returned by `read`.
+                                       Defaults to 0.1.
+        """
+        self.cap = cap
+        self.max_age: float = max_age
+
+        # Frame buffer pool, allocated lazily once the frame shape is known
+        self._buffers: list[Optional[np.ndarray]] = [None] * NUM_BUFFERS
+        self._write_idx: int = 0  # Buffer the grabber is filling
+        self._ready_idx: int = 1  # Buffer holding the newest unread frame
+        self._read_idx: int = 2  # Buffer currently handed out to the consumer
+
+        # Metadata of the newest and the last handed-out frame
+        self._ready: Frame = NO_FRAME
+        self._current: Frame = NO_FRAME
+        self._has_new: bool = False
+
+        # Statistics
+        self.frames_captured: int = 0  # Frames successfully grabbed
+        self.frames_dropped: int = 0  # Frames overwritten before being read
+        self.frames_stale: int = 0  # Reads that found only frames older than max_age
+        self._captured = metrics.counter('camera.frames_captured')
+        self._dropped = metrics.counter('camera.frames_dropped')
+        self._stale = metrics.counter('camera.frames_stale')
+
+        # Threading primitives
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __del__(self) -> None:
+        """
+        Stops the grabber thread when the object is deleted.
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Starts the background grabber thread.
+        """
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._grab_loop, name="camera", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background grabber thread and waits for it to exit.
+        """
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def release(self) -> None:
+        """
+        Stops the grabber and releases the underlying capture device.
+        """
+        self.stop()
+        self.cap.release()
+
+    def isOpened(self) -> bool:
+        """
+        Returns whether the underlying capture device is open.
+        """
+        return self.cap.isOpened()
+
+    @property
+    def fps(self) -> float:
+        """Returns the frame rate reported by the capture device (0 if unknown)."""
+        get = getattr(self.cap, 'get', None)
+        return get(cv2.CAP_PROP_FPS) if get is not None else 0.0
+
+    def _grab_loop(self) -> None:
+        """
+        Continuously grabs frames into the write buffer and publishes them.
+        """
+        seq = 0
+        while not self._stop.is_set():
+            if not self.cap.isOpened():
+                self._stop.wait(RETRY_DELAY)
+                continue
+
+            # Read directly into the preallocated buffer when the shape matches
+            buffer = self._buffers[self._write_idx]
+            ok, image = self.cap.read(buffer) if buffer is not None else self.cap.read()
+            timestamp = clock.monotonic()
+
+            if not ok or image is None:
+                self._stop.wait(RETRY_DELAY)
+                continue
+
+            if image is not buffer:
+                # First frame or shape change: adopt the returned array and size the pool
+                self._buffers[self._write_idx] = image
+                self._allocate(image)
+
+            with self._cond:
+                if self._has_new:
+                    self.frames_dropped += 1  # The previous frame was never read
+                    self._dropped.inc()
+
+                # Publish the freshly written buffer as the newest frame
+                self._write_idx, self._ready_idx = self._ready_idx, self._write_idx
+                self._ready = Frame(True, self._buffers[self._ready_idx], timestamp, seq)
+                self._has_new = True
+                self.frames_captured += 1
+                self._captured.inc()
+                self._cond.notify_all()
+
+            seq += 1
+
+    def _allocate(self, image: np.ndarray) -> None:
+        """
+        Allocates the remaining pool buffers to match the shape of a captured frame.
+
+        Args:
+            image (np.ndarray): A captured frame defining the buffer shape and type.
+        """
+        with self._cond:
+            for i in range(NUM_BUFFERS):
+                if i == self._write_idx:
+                    continue
+                if i == self._read_idx and self._current.ok:
+                    continue  # Still in use by the consumer; replaced on its next swap
+                buffer = self._buffers[i]
+                if buffer is None or buffer.shape != image.shape or buffer.dtype != image.dtype:
+                    self._buffers[i] = np.empty_like(image)
+
+    @property
+    def current(self) -> Frame:
+        """Returns the frame most recently handed out by `latest` or `read`."""
+        return self._current
+
+    def wait_ready(self, timeout: float) -> bool:
+        """
+        Waits until the first frame has been captured, without consuming it.
+
+        Args:
+            timeout (float): Maximum time to wait (in seconds).
+
+        Returns:
+            bool: True if a frame is available.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._ready.ok or self._stop.is_set(), timeout) and self._ready.ok
+
+    def latest(self, timeout: Optional[float] = None) -> Frame:
+        """
+        Returns the newest captured frame, waiting for one if none is available yet.
+
+        The returned image stays valid until the next call to `latest` or `read`.
+
+        Args:
+            timeout (Optional[float], optional): Maximum time to wait for a new frame (in seconds).
+                                                 Defaults to `max_age`.
+
+        Returns:
+            Frame: The newest frame, or the previously returned frame if no new one arrived in time.
+        """
+        if timeout is None:
+            timeout = self.max_age
+
+        with self._cond:
+            if not self._has_new:
+                self._cond.wait_for(lambda: self._has_new or self._stop.is_set(), timeout)
+
+            if self._has_new:
+                # Hand out the ready buffer and take back the previously read one
+                self._read_idx, self._ready_idx = self._ready_idx, self._read_idx
+                self._current = self._ready
+                self._has_new = False
+
+            return self._current
+
+    def read(self) -> tuple[bool, Optional[np.ndarray]]:
+        """
+        Returns the newest frame in the same form as `cv2.VideoCapture.read`.
+
+        Frames older than `max_age` are reported as unsuccessful reads.
+
+        Returns:
+            tuple[bool, Optional[np.ndarray]]: Success flag and the frame image.
+        """
+        frame = self.latest()
+
+        if frame.ok and frame.age > self.max_age:
+            self.frames_stale += 1
+            self._stale.inc()
+            return False, frame.image
+
+        return frame.ok, frame.image
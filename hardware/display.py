@@ -1,8 +1,12 @@
+import threading
+import time
+from collections import OrderedDict
 from luma.core.interface.serial import i2c
-from luma.core.render import canvas
 from luma.oled.device import ssd1306
-from PIL import ImageFont
-from typing import Dict
+from PIL import Image, ImageDraw, ImageFont
+from typing import Dict, Optional, Tuple
+
+from utils.metrics import metrics
 
 # Default font for display text
 DEFAULT_FONT: ImageFont.FreeTypeFont = ImageFont.truetype("FreeSans.ttf", 10)
@@ -12,36 +16,161 @@ LEFT_MARGIN: int = 5  # Margin from the left edge
 TOP_MARGIN: int = 5  # Margin from the top edge
 LINE_HEIGHT: int = 12  # Spacing between lines of text
 
+# Refresh settings
+MAX_REFRESH_HZ: float = 2.0  # Maximum rate of I2C frame pushes
+TEXT_CACHE_SIZE: int = 32  # Number of rendered text bitmaps kept
+
 
 class Display:
     """
     Handles interactions with an SSD1306 OLED display.
+
+    Rendering and the I2C transfer run on a background writer thread. `update` only
+    queues the text, unchanged text is skipped, the refresh rate is capped at
+    `max_refresh_hz`, and rendered line bitmaps are cached between frames.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_refresh_hz: float = MAX_REFRESH_HZ) -> None:
         """
-        Initializes the SSD1306 display using I2C communication.
+        Initializes the SSD1306 display using I2C communication and starts the writer thread.
+
+        Args:
+            max_refresh_hz (float, optional): Maximum number of frames pushed per second.
+                                              Defaults to `MAX_REFRESH_HZ`.
         """
         serial = i2c(port=1, address=0x3C)  # Initialize I2C communication
         self.device = ssd1306(serial)  # Create the SSD1306 display object
+        self.min_interval: float = 1.0 / max_refresh_hz  # Minimum time between frame pushes
+
+        # Reusable frame buffer and cache of rendered text lines
+        self._frame = Image.new(self.device.mode, self.device.size)
+        self._draw = ImageDraw.Draw(self._frame)
+        self._text_cache: "OrderedDict[Tuple[str, ImageFont.FreeTypeFont], Image.Image]" = OrderedDict()
+
+        # Latest requested content and the content last queued
+        self._pending: Optional[Tuple[Tuple[str, ...], ImageFont.FreeTypeFont]] = None
+        self._last_queued: Optional[Tuple[Tuple[str, ...], ImageFont.FreeTypeFont]] = None
+
+        # Statistics
+        self.frames_written: int = 0  # Frames pushed over I2C
+        self.updates_skipped: int = 0  # Updates dropped because the text did not change
+        self._frames_written = metrics.counter('display.frames_written')
+        self._updates_skipped = metrics.counter('display.updates_skipped')
+        self._write_time = metrics.histogram('display_write')
+
+        # Writer thread
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="display", daemon=True)
+        self._thread.start()
+
+    def __del__(self) -> None:
+        """
+        Stops the writer thread when the object is deleted.
+        """
+        self.stop()
+
+    def stop(self) -> None:
+        """
+        Stops the writer thread and waits for it to exit.
+        """
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
 
     def update(self, text: Dict[str, str], font: ImageFont.FreeTypeFont = DEFAULT_FONT) -> None:
         """
-        Updates the display with the provided text.
+        Queues the provided text for display. Returns immediately.
 
         Args:
             text (Dict[str, str]): Dictionary where keys are labels and values are text strings to display.
             font (ImageFont.FreeTypeFont, optional): Font to use for rendering the text. Defaults to `DEFAULT_FONT`.
         """
-        with canvas(self.device) as draw:
-            # Clear the screen by drawing a black rectangle
-            draw.rectangle(self.device.bounding_box, outline="white", fill="black")
-
-            # Display each line of text at the correct vertical position
-            for i, key in enumerate(text.keys()):
-                draw.text(
-                    (LEFT_MARGIN, TOP_MARGIN + i * LINE_HEIGHT),
-                    text[key],
-                    font=font,
-                    fill="white",
-                )
\ No newline at end of file
+        content = (tuple(text.values()), font)
+
+        with self._cond:
+            if content == self._last_queued:
+                self.updates_skipped += 1
+                self._updates_skipped.inc()
+                return
+
+            self._pending = content
+            self._last_queued = content
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        """
+        Renders queued text and pushes it to the display, at most `1 / min_interval` times per second.
+        """
+        last_write: float = 0.0
+
+        while not self._stop.is_set():
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._stop.is_set())
+                if self._stop.is_set():
+                    return
+
+            # Cap the refresh rate; text queued meanwhile is coalesced into one frame
+            delay = last_write + self.min_interval - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                return
+
+            with self._cond:
+                lines, font = self._pending
+                self._pending = None
+
+            start_time = time.perf_counter()
+            self._render(lines, font)
+            self.device.display(self._frame)
+            self._write_time.observe(time.perf_counter() - start_time)
+            last_write = time.monotonic()
+            self.frames_written += 1
+            self._frames_written.inc()
+
+    def _render(self, lines: Tuple[str, ...], font: ImageFont.FreeTypeFont) -> None:
+        """
+        Draws the border and text lines into the reusable frame buffer.
+
+        Args:
+            lines (Tuple[str, ...]): Text lines to draw.
+            font (ImageFont.FreeTypeFont): Font to render the text with.
+        """
+        # Clear the screen by drawing a black rectangle
+        self._draw.rectangle(self.device.bounding_box, outline="white", fill="black")
+
+        # Display each line of text at the correct vertical position
+        for i, line in enumerate(lines):
+            bitmap = self._text_bitmap(line, font)
+            x, y = LEFT_MARGIN, TOP_MARGIN + i * LINE_HEIGHT
+            self._frame.paste("white", (x, y, x + bitmap.width, y + bitmap.height), bitmap)
+
+    def _text_bitmap(self, line: str, font: ImageFont.FreeTypeFont) -> Image.Image:
+        """
+        Returns a cached 1-bit mask of a rendered text line, clipped to the display width.
+
+        Args:
+            line (str): The text to render.
+            font (ImageFont.FreeTypeFont): Font to render the text with.
+
+        Returns:
+            Image.Image: The rendered text mask.
+        """
+        key = (line, font)
+        bitmap = self._text_cache.get(key)
+        if bitmap is not None:
+            self._text_cache.move_to_end(key)
+            return bitmap
+
+        _, _, right, bottom = font.getbbox(line)
+        width = max(min(right, self.device.width - LEFT_MARGIN), 1)
+        bitmap = Image.new("1", (width, max(bottom, 1)))
+        ImageDraw.Draw(bitmap).text((0, 0), line, font=font, fill="white")
+
+        self._text_cache[key] = bitmap
+        while len(self._text_cache) > TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+
+        return bitmap
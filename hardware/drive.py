@@ -1,4 +1,8 @@
 import utils.drive
+from hardware.motor import MotorPair
+
+# Scaling factor to convert from computed wheel velocity (rad/s) to motor input speed (duty cycle %)
+SCALING_FACTOR: float = 4.43 * 2  # Empirical factor for motor speed calibration
 
 
 class FourWheelDiffDrive:
@@ -21,6 +25,10 @@ class FourWheelDiffDrive:
         self.R: float = self.robot.wheel_radius  # Wheel radius (m)
         self.T: float = self.robot.wheel_track  # Distance between wheels (m)
 
+        # Left and right motor pairs, each driven as a single unit
+        self.left = MotorPair(self.robot.lf_motor, self.robot.lb_motor)
+        self.right = MotorPair(self.robot.rf_motor, self.robot.rb_motor)
+
         # Motor speed defaults (rad/s)
         self.lf_motor_r: float = 0.0  # Left front wheel speed
         self.rf_motor_r: float = 0.0  # Right front wheel speed
@@ -38,15 +46,32 @@ class FourWheelDiffDrive:
         # Convert unicycle model velocities to differential drive velocities
         v_l, v_r = utils.drive.uni_to_diff(v, omega, self.R, self.T)
 
-        # Scaling factor to convert from computed velocity to motor input speed
-        SCALING_FACTOR: float = 4.43 * 2  # Empirical factor for motor speed calibration
-
         # Compute motor speeds
         r_l: float = v_l * SCALING_FACTOR  # Left wheel speed (scaled)
         r_r: float = v_r * SCALING_FACTOR  # Right wheel speed (scaled)
 
-        # Apply computed speeds to all four motors
-        self.robot.lf_motor.run(r_l)  # Left front motor
-        self.robot.rf_motor.run(r_r)  # Right front motor
-        self.robot.lb_motor.run(r_l)  # Left back motor
-        self.robot.rb_motor.run(r_r)  # Right back motor
\ No newline at end of file
+        # Apply computed speeds to both motor pairs (unchanged speeds are not written)
+        self.left.run(r_l)  # Left front and back motors
+        self.right.run(r_r)  # Right front and back motors
+
+    def wheel_speeds(self) -> tuple[float, float]:
+        """
+        Returns the wheel speeds currently applied to the motors.
+
+        Unlike the requested speeds, these include the motors' range limit and deadband,
+        so they are what the wheels were actually commanded to do.
+
+        Returns:
+            tuple[float, float]: Left and right wheel speeds (rad/s).
+        """
+        return self.left.speed / SCALING_FACTOR, self.right.speed / SCALING_FACTOR
+
+    @property
+    def writes(self) -> int:
+        """Returns the number of PWM and GPIO calls issued to all motors."""
+        return self.left.writes + self.right.writes
+
+    @property
+    def suppressed(self) -> int:
+        """Returns the number of pair commands skipped because the state did not change."""
+        return self.left.suppressed + self.right.suppressed
\ No newline at end of file
@@ -1,46 +1,88 @@
-import RPi.GPIO as gpio
-from typing import Tuple
+from types import ModuleType
+from typing import Optional, Tuple
+
+from utils.metrics import metrics
+
+# Speed changes (in duty cycle percent) smaller than this are not written to the hardware
+DEADBAND: float = 0.5
 
 
 class Motor:
     """
     Controls a DC motor using PWM via the Raspberry Pi GPIO.
 
-    Supports forward, backward, and stop operations with speed control.
+    Supports forward, backward, and stop operations with speed control. The last
+    applied state is cached so that unchanged commands don't touch the GPIO.
     """
 
-    def __init__(self, motor_pins: Tuple[int, int, int]) -> None:
+    def __init__(
+        self,
+        motor_pins: Tuple[int, int, int],
+        deadband: float = DEADBAND,
+        gpio: Optional[ModuleType] = None,
+    ) -> None:
         """
         Initializes the motor and sets up the GPIO pins.
 
         Args:
             motor_pins (Tuple[int, int, int]): Tuple containing the GPIO pin numbers (enable, in1, in2).
+            deadband (float, optional): Smallest speed change that is written. Defaults to `DEADBAND`.
+            gpio (Optional[ModuleType], optional): GPIO implementation with the `RPi.GPIO` interface.
+                                                   Defaults to `RPi.GPIO`.
         """
+        if gpio is None:
+            import RPi.GPIO as gpio  # Only available on the Raspberry Pi
+        self.gpio = gpio
+
         # Assign pin numbers
         self.enable: int = motor_pins[0]  # PWM enable pin
         self.in1: int = motor_pins[1]  # Direction control pin 1
         self.in2: int = motor_pins[2]  # Direction control pin 2
 
         # Set up GPIO
-        gpio.setmode(gpio.BCM)  # Use Broadcom pin numbering
-        gpio.setup(self.in1, gpio.OUT)
-        gpio.setup(self.in2, gpio.OUT)
-        gpio.setup(self.enable, gpio.OUT)
+        self.gpio.setmode(self.gpio.BCM)  # Use Broadcom pin numbering
+        self.gpio.setup(self.in1, self.gpio.OUT)
+        self.gpio.setup(self.in2, self.gpio.OUT)
+        self.gpio.setup(self.enable, self.gpio.OUT)
 
         # Default motor state: stopped
-        gpio.output(self.in1, gpio.LOW)
-        gpio.output(self.in2, gpio.LOW)
+        self.gpio.output(self.in1, self.gpio.LOW)
+        self.gpio.output(self.in2, self.gpio.LOW)
 
         # Initialize PWM for speed control
-        self.pwm = gpio.PWM(self.enable, 1000)  # 1 kHz PWM frequency
+        self.pwm = self.gpio.PWM(self.enable, 1000)  # 1 kHz PWM frequency
         self.pwm.start(0)  # Start with 0% duty cycle (motor off)
 
+        # Last applied state
+        self.deadband: float = deadband
+        self.speed: float = 0.0  # Last applied speed
+        self.direction: int = 0  # Last applied direction (1 forward, -1 backward, 0 stopped)
+
+        # Statistics
+        self.writes: int = 0  # PWM and GPIO calls issued
+        self.suppressed: int = 0  # Commands skipped because the state did not change
+        self._writes = metrics.counter('motor.writes')
+        self._suppressed = metrics.counter('motor.suppressed')
+
     def __del__(self) -> None:
         """
         Cleans up GPIO resources when the object is deleted.
         """
         self.pwm.stop()  # Stop PWM
-        gpio.cleanup()  # Reset GPIO settings
+        self.gpio.cleanup()  # Reset GPIO settings
+
+    def needs_write(self, speed: float) -> bool:
+        """
+        Checks whether a speed differs enough from the applied state to be written.
+
+        Args:
+            speed (float): Requested speed percentage (already constrained).
+
+        Returns:
+            bool: True if the direction changes or the speed moves by at least the deadband.
+        """
+        direction = (speed > 0) - (speed < 0)
+        return direction != self.direction or abs(speed - self.speed) >= self.deadband
 
     def run(self, speed: float) -> None:
         """
@@ -55,18 +97,96 @@ class Motor:
         # Constrain speed within valid range
         speed = max(min(speed, 100.0), -100.0)
 
+        if not self.needs_write(speed):
+            self.suppressed += 1
+            self._suppressed.inc()
+            return
+
+        self.apply(speed)
+
+    def apply(self, speed: float) -> None:
+        """
+        Writes a speed to the hardware, issuing only the PWM and GPIO calls that change state.
+
+        Args:
+            speed (float): Speed percentage (-100.0 to 100.0).
+        """
+        speed = max(min(speed, 100.0), -100.0)
+        direction = (speed > 0) - (speed < 0)
+
+        writes = 0
+
         # Adjust PWM duty cycle to control motor speed
-        self.pwm.ChangeDutyCycle(abs(speed))
-
-        if speed == 0:
-            # Stop motor
-            gpio.output(self.in1, gpio.LOW)
-            gpio.output(self.in2, gpio.LOW)
-        elif speed > 0:
-            # Move forward
-            gpio.output(self.in1, gpio.HIGH)
-            gpio.output(self.in2, gpio.LOW)
-        else:
-            # Move backward
-            gpio.output(self.in1, gpio.LOW)
-            gpio.output(self.in2, gpio.HIGH)
\ No newline at end of file
+        if abs(speed) != abs(self.speed):
+            self.pwm.ChangeDutyCycle(abs(speed))
+            writes += 1
+
+        if direction != self.direction:
+            if direction == 0:
+                # Stop motor
+                self.gpio.output(self.in1, self.gpio.LOW)
+                self.gpio.output(self.in2, self.gpio.LOW)
+            elif direction > 0:
+                # Move forward
+                self.gpio.output(self.in1, self.gpio.HIGH)
+                self.gpio.output(self.in2, self.gpio.LOW)
+            else:
+                # Move backward
+                self.gpio.output(self.in1, self.gpio.LOW)
+                self.gpio.output(self.in2, self.gpio.HIGH)
+            writes += 2
+
+        if writes:
+            self.writes += writes
+            self._writes.inc(writes)
+
+        self.speed = speed
+        self.direction = direction
+
+
+class MotorPair:
+    """
+    Drives two motors on the same side of the robot as a single unit.
+
+    The deadband check is made once for the pair, so both motors always receive
+    the same command.
+    """
+
+    def __init__(self, front: Motor, back: Motor) -> None:
+        """
+        Initializes the motor pair.
+
+        Args:
+            front (Motor): The front motor.
+            back (Motor): The back motor.
+        """
+        self.motors: Tuple[Motor, Motor] = (front, back)
+        self.suppressed: int = 0  # Commands skipped because the state did not change
+        self._suppressed = metrics.counter('motor_pair.suppressed')
+
+    @property
+    def speed(self) -> float:
+        """Returns the speed percentage last applied to the pair."""
+        return self.motors[0].speed
+
+    @property
+    def writes(self) -> int:
+        """Returns the number of PWM and GPIO calls issued to both motors."""
+        return sum(motor.writes for motor in self.motors)
+
+    def run(self, speed: float) -> None:
+        """
+        Runs both motors at the specified speed.
+
+        Args:
+            speed (float): Speed percentage (-100.0 to 100.0).
+        """
+        speed = max(min(speed, 100.0), -100.0)
+
+        if not any(motor.needs_write(speed) for motor in self.motors):
+            self.suppressed += 1
+            self._suppressed.inc()
+            return
+
+        for motor in self.motors:
+            motor.apply(speed)
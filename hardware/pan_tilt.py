@@ -1,4 +1,15 @@
-from hardware.servo import Servo
+import utils.clock as clock
+from hardware.servo import Servo, ServoBus
+from utils.history import History
+
+# Servo travel (in degrees)
+SERVO_RANGE: int = 180
+PAN_LIMITS: tuple[float, float] = (0, 180)  # Full range
+TILT_LIMITS: tuple[float, float] = (30, 150)  # Limited to avoid overextension
+
+# Reachable `robot.pan` / `robot.tilt` angles relative to the neutral position (tilt is inverted)
+PAN_ANGLES: tuple[float, float] = (PAN_LIMITS[0] - SERVO_RANGE / 2, PAN_LIMITS[1] - SERVO_RANGE / 2)
+TILT_ANGLES: tuple[float, float] = (SERVO_RANGE / 2 - TILT_LIMITS[1], SERVO_RANGE / 2 - TILT_LIMITS[0])
 
 
 class PanTilt:
@@ -19,12 +30,17 @@ class PanTilt:
         self.robot = robot
 
         # Initialize pan servo (channel 0, 0° to 180° range)
-        self.pan_servo = Servo(self.robot.servo_kit, channel=0, pwm_range=180, angle_limits=(0, 180))
-        self.pan_servo.set_angle(0)  # Start at neutral position
+        self.pan_servo = Servo(self.robot.servo_kit, channel=0, actuation_range=SERVO_RANGE, limits=PAN_LIMITS)
 
         # Initialize tilt servo (channel 1, limited to 30°-150° to avoid overextension)
-        self.tilt_servo = Servo(self.robot.servo_kit, channel=1, pwm_range=180, angle_limits=(30, 150))
-        self.tilt_servo.set_angle(0)  # Start at neutral position
+        self.tilt_servo = Servo(self.robot.servo_kit, channel=1, actuation_range=SERVO_RANGE, limits=TILT_LIMITS)
+
+        # Both servos are written together in one I2C burst
+        self.bus = ServoBus(self.robot.servo_kit)
+        self.bus.write((self.pan_servo, self.tilt_servo), (0, 0))  # Start at neutral position
+
+        # Timestamped (pan, tilt) commands, so controllers can look up where the camera pointed
+        self.history = History(columns=2)
 
     def __del__(self) -> None:
         """
@@ -54,6 +70,25 @@ class PanTilt:
     def update(self) -> None:
         """
         Updates the pan-tilt servos based on the robot's current pan and tilt angles.
+
+        Both angles are written in a single bus transaction; changes inside the servo
+        deadband are skipped.
+        """
+        # Tilt is inverted to match the physical servo direction (see `tilt`)
+        self.bus.write((self.pan_servo, self.tilt_servo), (self.robot.pan, -self.robot.tilt))
+        self.history.append(clock.monotonic(), self.robot.pan, self.robot.tilt)
+
+    def angles_at(self, timestamp: float) -> tuple[float, float]:
+        """
+        Returns the pan and tilt angles commanded at a given time (e.g. when a frame was captured).
+
+        Args:
+            timestamp (float): The time (seconds).
+
+        Returns:
+            tuple[float, float]: Pan and tilt angles in degrees (neutral before the first update).
         """
-        self.pan(self.robot.pan)
-        self.tilt(self.robot.tilt)
\ No newline at end of file
+        angles = self.history.at(timestamp)
+        if angles is None:
+            return 0.0, 0.0
+        return float(angles[0]), float(angles[1])
\ No newline at end of file
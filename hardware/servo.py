@@ -1,5 +1,17 @@
-from typing import Tuple
-from adafruit_servokit import ServoKit
+import time
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    from adafruit_servokit import ServoKit
+
+# Angle changes (in degrees) smaller than this are not written to the servo
+DEADBAND: float = 0.5
+
+# First PWM register of the PCA9685 (LED0_ON_L); each channel uses 4 consecutive registers
+PCA9685_LED0_ON_L: int = 0x06
+PCA9685_CHANNELS: int = 16
 
 
 class Servo:
@@ -10,7 +22,14 @@ class Servo:
     while enforcing movement constraints.
     """
 
-    def __init__(self, kit: ServoKit, channel: int, actuation_range: int, limits: Tuple[float, float]) -> None:
+    def __init__(
+        self,
+        kit: "ServoKit",
+        channel: int,
+        actuation_range: int,
+        limits: Tuple[float, float],
+        deadband: float = DEADBAND,
+    ) -> None:
         """
         Initializes the servo motor.
 
@@ -19,12 +38,17 @@ class Servo:
             channel (int): The servo channel (0-15).
             actuation_range (int): The full range of motion for the servo (in degrees).
             limits (Tuple[float, float]): Minimum and maximum allowed angles (in degrees).
+            deadband (float, optional): Smallest angle change that is written (in degrees). Defaults to `DEADBAND`.
         """
         self.servo = kit.servo[channel]  # Assign the correct servo channel
+        self.channel: int = channel  # Store the servo channel
         self.range: int = actuation_range  # Store actuation range
         self.limits: Tuple[float, float] = limits  # Store movement limits
+        self.deadband: float = deadband  # Store the write deadband
         self.servo.actuation_range = actuation_range  # Apply actuation range to the servo
         self.curr_angle: float = 0.0  # Initialize the current angle
+        self.written: bool = False  # Whether an angle has been written yet
+        self.skipped: int = 0  # Writes skipped inside the deadband
 
     def __del__(self) -> None:
         """
@@ -32,25 +56,62 @@ class Servo:
         """
         self.servo.angle = None  # Disables the servo
 
-    def set_angle(self, angle: float) -> None:
+    def clamp(self, angle: float) -> float:
         """
-        Sets the servo to a specific angle while enforcing movement limits.
+        Converts a centered angle to a servo angle within the movement limits.
 
         Args:
-            angle (float): Desired servo angle in degrees.
+            angle (float): Desired angle in degrees, relative to the center of the range.
+
+        Returns:
+            float: The servo angle to apply (in degrees).
         """
         # Adjust angle based on actuation range
         angle = angle + self.range / 2
 
         # Ensure the angle remains within defined limits
-        if angle < self.limits[0]:
-            angle = self.limits[0]
-        if angle > self.limits[1]:
-            angle = self.limits[1]
+        return min(max(angle, self.limits[0]), self.limits[1])
+
+    def needs_write(self, angle: float) -> bool:
+        """
+        Checks whether a servo angle differs enough from the applied one to be written.
+
+        Args:
+            angle (float): The servo angle (as returned by `clamp`).
+
+        Returns:
+            bool: True if the angle moves by at least the deadband.
+        """
+        return not self.written or abs(angle - self.curr_angle) >= self.deadband
+
+    def duty_cycle(self, angle: float) -> int:
+        """
+        Converts a servo angle to the 16-bit duty cycle written by the servo library.
+
+        Args:
+            angle (float): The servo angle (in degrees).
+
+        Returns:
+            int: The duty cycle (0-0xFFFF).
+        """
+        return self.servo._min_duty + int(angle / self.range * self.servo._duty_range)
+
+    def set_angle(self, angle: float) -> None:
+        """
+        Sets the servo to a specific angle while enforcing movement limits.
+
+        Args:
+            angle (float): Desired servo angle in degrees.
+        """
+        angle = self.clamp(angle)
+        if not self.needs_write(angle):
+            self.skipped += 1
+            return
 
         # Apply the angle to the servo
         self.servo.angle = angle
         self.curr_angle = angle  # Update current angle state
+        self.written = True
 
     def add_angle(self, angle: float) -> None:
         """
@@ -60,4 +121,94 @@ class Servo:
             angle (float): The amount to adjust the angle by (positive or negative).
         """
         new_angle = self.curr_angle + angle
-        self.set_angle(new_angle)  # Use `set_angle` to apply new value while enforcing limits
\ No newline at end of file
+        self.set_angle(new_angle)  # Use `set_angle` to apply new value while enforcing limits
+
+
+class ServoBus:
+    """
+    Writes several servos on a PCA9685 in a single I2C register burst.
+
+    Servos whose angle change is inside their deadband are left untouched. The
+    remaining servos are written with one auto-increment transfer covering their
+    consecutive channel registers, instead of one transaction per servo.
+    """
+
+    def __init__(self, kit: "ServoKit") -> None:
+        """
+        Initializes the servo bus.
+
+        Args:
+            kit (ServoKit): The Adafruit ServoKit instance driving the servos.
+        """
+        self.pca = getattr(kit, "_pca", None)  # Underlying PCA9685 (None if unavailable)
+        self._buffer = bytearray(1 + 4 * PCA9685_CHANNELS)  # Register address plus channel data
+
+        # Statistics
+        self.transactions: int = 0  # I2C transactions issued
+        self.skipped: int = 0  # Servo writes skipped inside the deadband
+        self.bus_time: float = 0.0  # Total time spent writing to the bus (seconds)
+        self._transactions = metrics.counter('servo.transactions')
+        self._skipped = metrics.counter('servo.skipped')
+        self._write_time = metrics.histogram('servo_write')
+
+    def write(self, servos: Sequence[Servo], angles: Sequence[float]) -> None:
+        """
+        Sets several servos to centered angles, writing only those outside their deadband.
+
+        Args:
+            servos (Sequence[Servo]): The servos to set.
+            angles (Sequence[float]): Desired angles in degrees, relative to the center of each range.
+        """
+        pending = []
+        for servo, angle in zip(servos, angles):
+            angle = servo.clamp(angle)
+            if servo.needs_write(angle):
+                pending.append((servo, angle))
+            else:
+                self.skipped += 1
+                self._skipped.inc()
+
+        if not pending:
+            return
+
+        start_time = time.perf_counter()
+        transactions = self.transactions
+
+        channels = sorted(servo.channel for servo, _ in pending)
+        if self.pca is not None and channels[-1] - channels[0] == len(channels) - 1:
+            self._write_burst(pending, channels[0])
+        else:
+            # Channels are not consecutive (or no direct bus access): write one by one
+            for servo, angle in pending:
+                servo.servo.angle = angle
+                self.transactions += 1
+
+        for servo, angle in pending:
+            servo.curr_angle = angle
+            servo.written = True
+
+        elapsed = time.perf_counter() - start_time
+        self.bus_time += elapsed
+        self._write_time.observe(elapsed)
+        self._transactions.inc(self.transactions - transactions)
+
+    def _write_burst(self, pending: Sequence[Tuple[Servo, float]], first_channel: int) -> None:
+        """
+        Writes consecutive servo channels in one auto-increment register transfer.
+
+        Args:
+            pending (Sequence[Tuple[Servo, float]]): Servos and the servo angles to write.
+            first_channel (int): The lowest channel among the servos.
+        """
+        buffer = self._buffer
+        buffer[0] = PCA9685_LED0_ON_L + 4 * first_channel
+
+        for servo, angle in pending:
+            # Same 16-bit to 12-bit conversion as the PCA9685 driver: ON = 0, OFF = duty
+            duty = (servo.duty_cycle(angle) + 1) >> 4
+            offset = 1 + 4 * (servo.channel - first_channel)
+            buffer[offset:offset + 4] = bytes((0, 0, duty & 0xFF, (duty >> 8) & 0x0F))
+
+        with self.pca.i2c_device as i2c:
+            i2c.write(buffer, end=1 + 4 * len(pending))
+        self.transactions += 1
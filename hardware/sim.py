@@ -0,0 +1,603 @@
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+import data.models as models
+import utils.clock as clock
+import utils.drive
+from hardware.camera import CAMERA_HFOV, CAMERA_VFOV, Frame, NO_FRAME
+from hardware.drive import SCALING_FACTOR
+from inference.objects import BBox, Object
+from utils.metrics import metrics
+from utils.recorder import ReplayCapture, is_log
+
+# Simulated camera settings
+SIM_FPS: float = 30.0  # Frame rate of the synthetic scene
+CAMERA_EXPOSURE: float = 0.02  # Exposure time of a frame, for motion blur (seconds)
+
+# Synthetic scene settings
+TARGET_COLOR: Tuple[int, int, int] = (0, 255, 0)  # BGR color of the target (found by `SimDetector`)
+TARGET_WIDTH: float = 0.4  # Physical target width (m)
+TARGET_HEIGHT: float = 0.5  # Physical target height (m)
+TARGET_DISTANCE: float = 1.5  # Initial distance from the robot to the target (m)
+TARGET_MIN_DISTANCE: float = 0.8  # The target walks away to stay at least this far from the robot (m)
+TARGET_SWAY: float = 0.3  # Amplitude of the target's side-to-side motion (m)
+TARGET_SWAY_PERIOD: float = 8.0  # Period of the target's side-to-side motion (s)
+
+
+class SimPWM:
+    """
+    Software PWM channel of `SimGPIO`, recording its duty cycle.
+    """
+
+    def __init__(self, gpio: "SimGPIO", pin: int, frequency: float) -> None:
+        self.gpio = gpio
+        self.pin = pin
+        self.frequency = frequency
+
+    def start(self, duty_cycle: float) -> None:
+        self.gpio.duty[self.pin] = duty_cycle
+
+    def ChangeDutyCycle(self, duty_cycle: float) -> None:
+        self.gpio.duty[self.pin] = duty_cycle
+
+    def stop(self) -> None:
+        self.gpio.duty[self.pin] = 0.0
+
+
+class SimGPIO:
+    """
+    In-memory stand-in for the `RPi.GPIO` module, recording pin levels and PWM duty cycles.
+    """
+
+    BCM: int = 11
+    OUT: int = 0
+    LOW: int = 0
+    HIGH: int = 1
+
+    def __init__(self) -> None:
+        """
+        Initializes all pins low.
+        """
+        self.levels: Dict[int, int] = {}  # Output level per pin
+        self.duty: Dict[int, float] = {}  # PWM duty cycle per pin (percent)
+        self.writes: int = 0  # Output and PWM calls issued
+
+    def setmode(self, mode: int) -> None:
+        pass
+
+    def setup(self, pin: int, mode: int) -> None:
+        self.levels.setdefault(pin, self.LOW)
+
+    def output(self, pin: int, level: int) -> None:
+        self.levels[pin] = level
+        self.writes += 1
+
+    def PWM(self, pin: int, frequency: float) -> SimPWM:
+        return SimPWM(self, pin, frequency)
+
+    def cleanup(self) -> None:
+        pass
+
+    def wheel_speed(self, motor_pins: Tuple[int, int, int]) -> float:
+        """
+        Returns the wheel speed (rad/s) commanded to the motor on the given pins.
+
+        Args:
+            motor_pins (Tuple[int, int, int]): GPIO pin numbers (enable, in1, in2).
+        """
+        enable, in1, in2 = motor_pins
+        direction = self.levels.get(in1, 0) - self.levels.get(in2, 0)
+        return direction * self.duty.get(enable, 0.0) / SCALING_FACTOR
+
+
+class SimServo:
+    """
+    Stand-in for an `adafruit_motor` servo, recording its angle.
+    """
+
+    def __init__(self) -> None:
+        self.actuation_range: int = 180
+        self.angle: Optional[float] = None
+        self._min_duty: int = int(750 * 50 / 1e6 * 0xFFFF)  # Same pulse range as the real driver
+        self._duty_range: int = int(2250 * 50 / 1e6 * 0xFFFF) - self._min_duty
+
+
+class SimServoKit:
+    """
+    Stand-in for `adafruit_servokit.ServoKit` (no direct PCA9685 access, so writes go per servo).
+    """
+
+    def __init__(self, channels: int = 16) -> None:
+        self.servo: List[SimServo] = [SimServo() for _ in range(channels)]
+
+
+class SimDisplay:
+    """
+    Stand-in for the OLED display, keeping the last shown text.
+    """
+
+    def __init__(self) -> None:
+        self.text: Dict[str, str] = {}
+        self.frames_written: int = 0
+
+    def update(self, text: Dict[str, str], font=None) -> None:
+        if text != self.text:
+            self.text = dict(text)
+            self.frames_written += 1
+
+    def stop(self) -> None:
+        pass
+
+
+class SimWorld:
+    """
+    Kinematic model of the robot and a single target, integrated on the process clock.
+
+    The robot's heading and position follow the wheel speeds commanded through the
+    simulated GPIO; the camera direction follows the simulated pan-tilt servos.
+    """
+
+    def __init__(self, gpio: SimGPIO, kit: SimServoKit) -> None:
+        """
+        Initializes the world with the target straight ahead.
+
+        Args:
+            gpio (SimGPIO): Simulated GPIO driving the motors.
+            kit (SimServoKit): Simulated servo kit driving the pan-tilt.
+        """
+        self.gpio = gpio
+        self.kit = kit
+        self.robot = None  # Robot whose wheel geometry is simulated
+        self.left_pins: Tuple[int, int, int] = (0, 0, 0)  # Pins of a left motor
+        self.right_pins: Tuple[int, int, int] = (0, 0, 0)  # Pins of a right motor
+
+        # Robot state: position (m) and heading (rad)
+        self.x: float = 0.0
+        self.y: float = 0.0
+        self.theta: float = 0.0
+        self.omega: float = 0.0  # Angular velocity (rad/s)
+
+        # Exposure time smearing the rendered scene while the robot turns (0 disables motion blur)
+        self.exposure: float = 0.0
+
+        # Target position (m)
+        self.target_x: float = TARGET_DISTANCE
+        self.target_y: float = 0.0
+
+        self._start: float = clock.monotonic()
+        self._last: float = self._start
+        self._lock = threading.Lock()
+
+    def advance(self) -> float:
+        """
+        Integrates the robot and target motion up to the current clock time.
+
+        Returns:
+            float: The current time (seconds).
+        """
+        with self._lock:
+            now = clock.monotonic()
+            dt = now - self._last
+            self._last = now
+
+            if self.robot is not None and dt > 0:
+                v_l = self.gpio.wheel_speed(self.left_pins)
+                v_r = self.gpio.wheel_speed(self.right_pins)
+                v, omega = utils.drive.diff_to_uni(v_l, v_r, self.robot.wheel_radius, self.robot.wheel_track)
+
+                self.omega = omega
+                self.theta += omega * dt
+                self.x += v * math.cos(self.theta) * dt
+                self.y += v * math.sin(self.theta) * dt
+
+            # The target sways side to side and walks ahead when the robot approaches
+            self.target_x = max(self.target_x, self.x + TARGET_MIN_DISTANCE)
+            self.target_y = TARGET_SWAY * math.sin(2 * math.pi * (now - self._start) / TARGET_SWAY_PERIOD)
+
+            return now
+
+    def camera_angles(self) -> Tuple[float, float]:
+        """
+        Returns the camera's pan and tilt angles (rad) relative to the robot's heading.
+        """
+        pan, tilt = self.kit.servo[0].angle, self.kit.servo[1].angle
+        pan = math.radians(pan - 90.0) if pan is not None else 0.0
+        tilt = math.radians(90.0 - tilt) if tilt is not None else 0.0  # Tilt servo is inverted
+        return pan, tilt
+
+    def render(self, image: np.ndarray) -> None:
+        """
+        Draws the scene as seen by the camera into an image.
+
+        Args:
+            image (np.ndarray): BGR image to draw into.
+        """
+        height, width = image.shape[:2]
+        image[:] = (60, 60, 60)
+        image[height // 2:] = (90, 80, 70)  # Floor
+
+        # Target bearing and elevation relative to the camera axis
+        dx, dy = self.target_x - self.x, self.target_y - self.y
+        distance = max(math.hypot(dx, dy), 0.1)
+        pan, tilt = self.camera_angles()
+        bearing = math.atan2(dy, dx) - self.theta - pan
+        bearing = math.atan2(math.sin(bearing), math.cos(bearing))
+        elevation = -tilt
+
+        # Pinhole projection (image x grows to the right, bearing grows to the left)
+        fx = (width / 2) / math.tan(CAMERA_HFOV / 2)
+        fy = (height / 2) / math.tan(CAMERA_VFOV / 2)
+        if abs(bearing) >= math.pi / 2:
+            return  # Behind the camera
+
+        cx = width / 2 - fx * math.tan(bearing)
+        cy = height / 2 - fy * math.tan(elevation)
+        half_w = fx * TARGET_WIDTH / distance / 2
+        half_h = fy * TARGET_HEIGHT / distance / 2
+
+        x_min, y_min = int(cx - half_w), int(cy - half_h)
+        x_max, y_max = int(cx + half_w), int(cy + half_h)
+        cv2.rectangle(image, (x_min, y_min), (x_max, y_max), TARGET_COLOR, cv2.FILLED)
+
+        # Checker texture so optical-flow trackers have features to follow
+        step = max(int(half_w / 3), 2)
+        for i, x in enumerate(range(x_min, x_max, step)):
+            for j, y in enumerate(range(y_min, y_max, step)):
+                if (i + j) % 2:
+                    cv2.rectangle(image, (x, y), (x + step // 2, y + step // 2), (0, 0, 0), cv2.FILLED)
+
+        # Horizontal smear from the robot's rotation during the exposure
+        blur = int(abs(self.omega) * self.exposure * fx)
+        if blur >= 2:
+            cv2.blur(image, (blur, 1), dst=image)
+
+
+class SimCamera:
+    """
+    Synchronous stand-in for `hardware.camera.Camera`, producing frames on the process clock.
+
+    Frames come from a video file or recorder log (looped) or from the synthetic `SimWorld`
+    scene. A new frame becomes available every 1 / fps seconds of clock time; frames the
+    consumer does not ask for in time are counted as dropped. In lockstep mode every frame
+    is delivered exactly once instead, so replays are deterministic.
+    """
+
+    def __init__(
+        self,
+        world: SimWorld,
+        width: int,
+        height: int,
+        max_age: float,
+        video: Optional[str] = None,
+        fps: float = SIM_FPS,
+        lockstep: bool = False,
+    ) -> None:
+        """
+        Initializes the simulated camera.
+
+        Args:
+            world (SimWorld): The world rendered when no video is given.
+            width (int): Frame width (pixels).
+            height (int): Frame height (pixels).
+            max_age (float): Frames older than this (seconds) are treated as missing.
+            video (Optional[str], optional): Path of a video file or recorder log to play back.
+                                             Defaults to None.
+            fps (float, optional): Frame rate of the synthetic scene. Defaults to `SIM_FPS`.
+            lockstep (bool, optional): Deliver the next frame on every call, never skipping any.
+                                       Defaults to False.
+        """
+        self.world = world
+        self.max_age: float = max_age
+        self.lockstep: bool = lockstep
+        self.video = open_video(video) if video else None
+        self.fps: float = (self.video.get(cv2.CAP_PROP_FPS) or fps) if self.video else fps
+
+        self._buffers = [np.zeros((height, width, 3), dtype=np.uint8) for _ in range(2)]
+        self._index: int = 0
+        self._start: float = clock.monotonic()
+        self._current: Frame = NO_FRAME
+
+        # Statistics
+        self.frames_captured: int = 0
+        self.frames_dropped: int = 0
+        self.frames_stale: int = 0
+        self._captured = metrics.counter('camera.frames_captured')
+        self._dropped = metrics.counter('camera.frames_dropped')
+        self._stale = metrics.counter('camera.frames_stale')
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def release(self) -> None:
+        if self.video is not None:
+            self.video.release()
+
+    def isOpened(self) -> bool:
+        return self.video is None or self.video.isOpened()
+
+    def wait_ready(self, timeout: float) -> bool:
+        return True
+
+    @property
+    def current(self) -> Frame:
+        """Returns the frame most recently handed out by `latest` or `read`."""
+        return self._current
+
+    def latest(self, timeout: Optional[float] = None) -> Frame:
+        """
+        Returns the newest frame, sleeping on the clock until the next one if none is new.
+
+        Args:
+            timeout (Optional[float], optional): Maximum time to wait for a new frame (in seconds).
+                                                 Defaults to `max_age`.
+
+        Returns:
+            Frame: The newest frame.
+        """
+        if timeout is None:
+            timeout = self.max_age
+
+        seq = int((clock.monotonic() - self._start) * self.fps)
+        if self.lockstep:
+            # Wait (on the clock) for the next frame, however long that takes
+            seq = self._current.seq + 1
+            clock.sleep(self._start + seq / self.fps - clock.monotonic())
+        elif seq <= self._current.seq and timeout > 0:
+            # Wait (on the clock) for the next frame if it arrives in time
+            next_time = self._start + (self._current.seq + 1) / self.fps
+            delay = next_time - clock.monotonic()
+            if delay <= timeout:
+                clock.sleep(delay)
+                seq = self._current.seq + 1
+
+        if seq <= self._current.seq:
+            return self._current
+
+        skipped = seq - self._current.seq - 1 if self._current.ok else 0
+        self.frames_dropped += skipped
+        if skipped:
+            self._dropped.inc(skipped)
+
+        self._index ^= 1
+        image = self._buffers[self._index]
+        if self.video is not None:
+            for _ in range(skipped):
+                self.video.grab()  # Skip frames the consumer was too slow for
+            ok, decoded = self.video.read(image)
+            if not ok:
+                self.video.set(cv2.CAP_PROP_POS_FRAMES, 0)  # Loop the video
+                ok, decoded = self.video.read(image)
+            if ok and decoded is not image:
+                image = self._buffers[self._index] = decoded  # Frame size differs from the buffers
+        else:
+            self.world.advance()
+            self.world.render(image)
+            ok = True
+
+        # A lockstep consumer slower than the frame rate receives frames late, not stale
+        timestamp = self._start + seq / self.fps
+        if self.lockstep:
+            timestamp = max(timestamp, clock.monotonic())
+
+        self._current = Frame(ok, image, timestamp, seq)
+        self.frames_captured += 1
+        self._captured.inc()
+        return self._current
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Returns the newest frame in the same form as `cv2.VideoCapture.read`.
+        """
+        frame = self.latest()
+        if frame.ok and frame.age > self.max_age:
+            self.frames_stale += 1
+            self._stale.inc()
+            return False, frame.image
+        return frame.ok, frame.image
+
+
+class SimDetector:
+    """
+    Detector for the synthetic scene that finds the target by its color.
+
+    It has the same `get_objects` interface as `aiymakerkit.vision.Detector` and works
+    on full frames and crops alike, so the whole control stack can run without a model.
+    """
+
+    def __init__(self, class_id: int = 0) -> None:
+        """
+        Initializes the detector.
+
+        Args:
+            class_id (int, optional): Class id reported for the target. Defaults to 0 ('person' in COCO).
+        """
+        self.class_id: int = class_id
+        self._lower = np.array(TARGET_COLOR, dtype=np.uint8)
+        self._upper = np.array(TARGET_COLOR, dtype=np.uint8)
+
+    def get_objects(self, frame: np.ndarray, threshold: float = 0.01) -> List[Object]:
+        """
+        Returns the target's bounding box if it is visible.
+
+        Args:
+            frame (np.ndarray): BGR image (or crop) to search.
+            threshold (float, optional): Unused; the target is always reported with score 1.0.
+
+        Returns:
+            List[Object]: The target, or an empty list.
+        """
+        mask = cv2.inRange(frame, self._lower, self._upper)
+        points = cv2.findNonZero(mask)
+        if points is None:
+            return []
+
+        x, y, w, h = cv2.boundingRect(points)
+        return [Object(self.class_id, 1.0, BBox(x, y, x + w, y + h))]
+
+
+class SimPoseEstimator(SimDetector):
+    """
+    Pose estimator for the synthetic scene that places the keypoints of a standing person on the target.
+
+    It has the same `get_objects` interface as `inference.pose.PoseEstimator`.
+    """
+
+    # Keypoint positions relative to the target box (x, y), in MoveNet keypoint order
+    LAYOUT: np.ndarray = np.array([
+        (0.50, 0.08), (0.45, 0.06), (0.55, 0.06), (0.40, 0.08), (0.60, 0.08),  # Head
+        (0.25, 0.25), (0.75, 0.25), (0.15, 0.40), (0.85, 0.40), (0.10, 0.55), (0.90, 0.55),  # Arms
+        (0.35, 0.55), (0.65, 0.55), (0.35, 0.75), (0.65, 0.75), (0.35, 0.95), (0.65, 0.95),  # Legs
+    ], dtype=np.float32)
+
+    def get_objects(self, frame: np.ndarray, threshold: float = 0.01) -> list:
+        """
+        Returns the pose of the target if it is visible.
+
+        Args:
+            frame (np.ndarray): BGR image (or crop) to search.
+            threshold (float, optional): Unused; all keypoints are reported with score 0.9.
+
+        Returns:
+            List[Pose]: The pose, or an empty list.
+        """
+        from inference.pose import PERSON_CLASS, Pose
+
+        objects = super().get_objects(frame, threshold)
+        if not objects:
+            return []
+
+        bbox = objects[0].bbox
+        keypoints = np.empty((len(self.LAYOUT), 3), dtype=np.float32)
+        keypoints[:, 0] = bbox.xmin + self.LAYOUT[:, 0] * bbox.width
+        keypoints[:, 1] = bbox.ymin + self.LAYOUT[:, 1] * bbox.height
+        keypoints[:, 2] = 0.9
+        return [Pose(PERSON_CLASS, 0.9, bbox, keypoints)]
+
+
+class SimBackend:
+    """
+    Creates simulated hardware so the Supervisor and all controllers can run on any Linux machine.
+
+    Motors, servos and display are replaced by in-memory models, the camera plays back a
+    video file or recorder log or renders a synthetic scene, and the process clock is replaced by a
+    `VirtualClock` that skips idle time, so runs can go faster than real time.
+    """
+
+    name: str = "sim"
+
+    def __init__(
+        self,
+        video: Optional[str] = None,
+        virtual_time: bool = True,
+        lockstep: bool = False,
+        motion_blur: bool = False,
+    ) -> None:
+        """
+        Initializes the simulation backend.
+
+        Args:
+            video (Optional[str], optional): Path of a video file or recorder log to play back
+                                             instead of the synthetic scene. Defaults to None.
+            virtual_time (bool, optional): Skip idle time using a `VirtualClock`. Defaults to True.
+            lockstep (bool, optional): Deliver every camera frame exactly once, for deterministic
+                                       replays. Defaults to False.
+            motion_blur (bool, optional): Blur the synthetic scene while the robot turns. Defaults to False.
+        """
+        self.video: Optional[str] = video
+        self.virtual_time: bool = virtual_time
+        self.lockstep: bool = lockstep
+        self.motion_blur: bool = motion_blur
+        self.gpio = SimGPIO()
+        self.kit = SimServoKit()
+        self.world: Optional[SimWorld] = None
+
+    def prepare(self) -> None:
+        """
+        Installs the virtual clock and, for the synthetic scene, the color-based detector and pose estimator.
+        """
+        if self.virtual_time:
+            clock.set_clock(clock.VirtualClock())
+
+        self.world = SimWorld(self.gpio, self.kit)
+        if self.motion_blur:
+            self.world.exposure = CAMERA_EXPOSURE
+
+        if self.video is None:
+            from inference.registry import registry
+            registry.loader = lambda model: SimDetector()
+            registry.pose_loader = lambda model: SimPoseEstimator()
+            registry.labels_loader = lambda model: read_labels(models.OBJECT_DETECTION_LABELS)
+
+    def motor(self, motor_pins: Tuple[int, int, int]):
+        """
+        Creates a motor driven through the simulated GPIO.
+        """
+        from hardware.motor import Motor
+        return Motor(motor_pins, gpio=self.gpio)
+
+    def servo_kit(self) -> SimServoKit:
+        """
+        Returns the simulated servo kit.
+        """
+        return self.kit
+
+    def display(self) -> SimDisplay:
+        """
+        Creates the simulated display.
+        """
+        return SimDisplay()
+
+    def camera(self, camera_id: int, width: int, height: int, max_age: float):
+        """
+        Creates the simulated camera.
+
+        Returns:
+            Tuple[SimCamera, SimCamera]: The camera, used both as capture device and frame grabber.
+        """
+        camera = SimCamera(self.world, width, height, max_age, video=self.video, lockstep=self.lockstep)
+        return camera, camera
+
+    def attach(self, robot) -> None:
+        """
+        Connects the world model to the robot's motors and wheel geometry once the robot is built.
+        """
+        self.world.robot = robot
+        self.world.left_pins = (robot.lf_motor.enable, robot.lf_motor.in1, robot.lf_motor.in2)
+        self.world.right_pins = (robot.rf_motor.enable, robot.rf_motor.in1, robot.rf_motor.in2)
+
+
+def open_video(path: str):
+    """
+    Opens a video file or recorder log for playback.
+
+    Args:
+        path (str): Path of the video file or recorder log.
+
+    Returns:
+        cv2.VideoCapture | ReplayCapture: The capture source. Logs are read as fast as requested;
+                                          the camera paces them.
+    """
+    if is_log(path):
+        return ReplayCapture(path, realtime=False)
+    return cv2.VideoCapture(path)
+
+
+def read_labels(path: str) -> Dict[int, str]:
+    """
+    Reads a plain-text label file with one label per line.
+
+    Args:
+        path (str): Path to the label file.
+
+    Returns:
+        Dict[int, str]: Mapping from class id (line number) to label.
+    """
+    with open(path) as f:
+        return {i: line.strip() for i, line in enumerate(f) if line.strip()}
@@ -0,0 +1,167 @@
+import os.path
+from typing import Any, Dict, Optional
+
+from inference.pose import PoseEstimator
+from inference.preprocess import PreprocessedDetector
+from inference.ssd import RawSSDDetector, has_postprocess
+
+# Default number of CPU threads used by the TFLite interpreter when no EdgeTPU is present
+NUM_THREADS: int = 4
+
+# File name suffix of models compiled for the EdgeTPU
+EDGETPU_SUFFIX: str = "_edgetpu.tflite"
+
+
+def cpu_model_path(model: str) -> str:
+    """
+    Returns the path of the CPU build of an EdgeTPU model.
+
+    Coral publishes every compiled model next to its uncompiled original, e.g.
+    `ssd_mobilenet_v2_coco_quant_postprocess_edgetpu.tflite` and
+    `ssd_mobilenet_v2_coco_quant_postprocess.tflite`.
+
+    Args:
+        model (str): Path to a model, compiled for the EdgeTPU or not.
+
+    Returns:
+        str: Path to the model without the EdgeTPU suffix.
+    """
+    if model.endswith(EDGETPU_SUFFIX):
+        return model[:-len(EDGETPU_SUFFIX)] + ".tflite"
+    return model
+
+
+def edgetpu_available() -> bool:
+    """
+    Checks whether an EdgeTPU and its runtime are present.
+
+    Returns:
+        bool: True if pycoral is installed and finds at least one EdgeTPU.
+    """
+    try:
+        from pycoral.utils import edgetpu
+        return len(edgetpu.list_edge_tpus()) > 0
+    except (ImportError, RuntimeError, ValueError, OSError):
+        return False
+
+
+class InferenceBackend:
+    """
+    Creates TFLite interpreters on the EdgeTPU, or on the CPU when there is none.
+
+    The EdgeTPU is probed once, on first use. Without it (or with `use_edgetpu` off),
+    models are loaded from their CPU builds (see `cpu_model_path`) into a multithreaded
+    TFLite interpreter. Callers keep referring to models by their `data.models` paths.
+    """
+
+    def __init__(self, num_threads: int = NUM_THREADS, use_edgetpu: bool = True) -> None:
+        """
+        Initializes the backend.
+
+        Args:
+            num_threads (int, optional): CPU threads used by the interpreter without an EdgeTPU.
+                                         Defaults to `NUM_THREADS`.
+            use_edgetpu (bool, optional): Use the EdgeTPU if one is present. Defaults to True.
+        """
+        self.num_threads: int = num_threads
+        self.use_edgetpu: bool = use_edgetpu
+        self._edgetpu: Optional[bool] = None  # Probe result (None until first use)
+
+    @property
+    def edgetpu(self) -> bool:
+        """Returns True if models run on the EdgeTPU."""
+        if self._edgetpu is None:
+            self._edgetpu = self.use_edgetpu and edgetpu_available()
+        return self._edgetpu
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the device models run on."""
+        return "edgetpu" if self.edgetpu else "cpu"
+
+    def model_path(self, model: str) -> str:
+        """
+        Resolves the model file to load on this backend.
+
+        Args:
+            model (str): Path to the model (see `data.models`).
+
+        Returns:
+            str: Path to the EdgeTPU model, or to its CPU build without an EdgeTPU.
+
+        Raises:
+            FileNotFoundError: If the CPU build of the model is missing.
+        """
+        if self.edgetpu:
+            return model
+
+        path = cpu_model_path(model)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No EdgeTPU found and no CPU build of the model: {path}")
+        return path
+
+    def interpreter(self, model: str) -> Any:
+        """
+        Creates an interpreter for a model with its tensors allocated.
+
+        Args:
+            model (str): Path to the model (see `data.models`).
+
+        Returns:
+            The TFLite interpreter.
+        """
+        path = self.model_path(model)
+
+        if self.edgetpu:
+            from pycoral.utils import edgetpu
+            interpreter = edgetpu.make_interpreter(path)
+        else:
+            try:
+                from tflite_runtime.interpreter import Interpreter
+            except ImportError:
+                from tensorflow.lite import Interpreter
+            interpreter = Interpreter(model_path=path, num_threads=self.num_threads)
+
+        interpreter.allocate_tensors()
+        return interpreter
+
+    def detector(self, model: str) -> PreprocessedDetector:
+        """
+        Loads an SSD detection model.
+
+        Args:
+            model (str): Path to the detection model (see `data.models`).
+
+        Returns:
+            PreprocessedDetector: Detector running on this backend (decoding the raw outputs
+                                  itself if the model lacks the postprocess op).
+        """
+        interpreter = self.interpreter(model)
+        if not has_postprocess(interpreter):
+            return RawSSDDetector(interpreter)
+        return PreprocessedDetector(interpreter)
+
+    def pose_estimator(self, model: str) -> PoseEstimator:
+        """
+        Loads a single-pose MoveNet model.
+
+        Args:
+            model (str): Path to the pose model (see `data.models`).
+
+        Returns:
+            PoseEstimator: Pose estimator running on this backend.
+        """
+        return PoseEstimator(self.interpreter(model))
+
+    def labels(self, model: str) -> Dict[int, str]:
+        """
+        Reads the label map embedded in a model's metadata.
+
+        Args:
+            model (str): Path to the model (see `data.models`).
+
+        Returns:
+            Dict[int, str]: Mapping from class id to label.
+        """
+        from aiymakerkit import utils
+        return utils.read_labels_from_metadata(self.model_path(model))
@@ -0,0 +1,150 @@
+import os.path
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from hardware.camera import Frame
+from inference.registry import registry
+from inference.worker import Detections, InferenceWorker, NO_DETECTIONS
+from utils.metrics import metrics
+
+# Score threshold the shared detections are computed with; controllers filter further
+# with their own (higher) thresholds
+MIN_THRESHOLD: float = 0.1
+
+
+def detection_task(model: str, threshold: float = MIN_THRESHOLD) -> Callable[[np.ndarray], list]:
+    """
+    Creates a task running a detection model (see `inference.registry`) on a full frame.
+
+    Args:
+        model (str): Path to the detection model.
+        threshold (float, optional): Minimum detection score. Defaults to `MIN_THRESHOLD`.
+
+    Returns:
+        Callable[[np.ndarray], list]: Function mapping an image to the detected objects.
+    """
+    detector = registry.detector(model)
+    return lambda image: detector.get_objects(image, threshold=threshold)
+
+
+class MultiModelWorker(InferenceWorker):
+    """
+    Runs several models on the same camera frames and keeps the latest result of each.
+
+    Every model publishes its own `Detections`, stamped with its source frame, so a
+    controller switching between targets (e.g. 'track face' and 'track person') finds
+    fresh results without loading or swapping a model. The models either run
+    concurrently on a thread pool (the interpreters release the GIL while invoking),
+    or take turns on successive frames, which suits a single EdgeTPU shared by all
+    models.
+    """
+
+    def __init__(
+        self,
+        tasks: Dict[str, Callable[[np.ndarray], list]],
+        alternate: Optional[bool] = None,
+    ) -> None:
+        """
+        Initializes the worker without starting it.
+
+        Args:
+            tasks (Dict[str, Callable[[np.ndarray], list]]): Task of each model, keyed by model path
+                                                              (see `detection_task`).
+            alternate (Optional[bool], optional): Run one model per frame, in turn, instead of all
+                                                  models concurrently. Defaults to None (alternate
+                                                  when the models share an EdgeTPU).
+        """
+        super().__init__()
+        self.tasks: Dict[str, Callable[[np.ndarray], list]] = dict(tasks)
+        self.models: Tuple[str, ...] = tuple(self.tasks)
+        self.alternate: bool = registry.backend.edgetpu if alternate is None else alternate
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        if not self.alternate and len(self.models) > 1:
+            self._pool = ThreadPoolExecutor(max_workers=len(self.models), thread_name_prefix="model")
+        self._next: int = 0  # Next model to run when alternating
+
+        # Latest result of each model
+        self._results: Dict[str, Detections] = {model: NO_DETECTIONS for model in self.models}
+        self._runs = {
+            model: metrics.counter(f'inference.runs.{os.path.splitext(os.path.basename(model))[0]}')
+            for model in self.models
+        }
+
+        self.set_task(self.detect_all)
+
+    def stop(self) -> None:
+        """
+        Stops the worker thread and its thread pool.
+        """
+        super().stop()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def detect_all(self, frame: Frame) -> Dict[str, Tuple[list, float]]:
+        """
+        Runs the models on a frame: all of them, or the next one in turn when alternating.
+
+        Args:
+            frame (Frame): The camera frame.
+
+        Returns:
+            Dict[str, Tuple[list, float]]: Objects and run time (seconds) of each model that ran.
+        """
+        if self.alternate:
+            model = self.models[self._next]
+            self._next = (self._next + 1) % len(self.models)
+            return {model: self._run_model(model, frame.image)}
+
+        if self._pool is None:
+            return {model: self._run_model(model, frame.image) for model in self.models}
+
+        futures = [(model, self._pool.submit(self._run_model, model, frame.image)) for model in self.models]
+        results = {}
+        for model, future in futures:
+            try:
+                results[model] = future.result()
+            except Exception:
+                self._failed(f"Model {model}")  # The other models' results are still published
+        return results
+
+    def _run_model(self, model: str, image: np.ndarray) -> Tuple[list, float]:
+        """
+        Runs a single model and times it.
+        """
+        start_time = time.monotonic()
+        objects = self.tasks[model](image)
+        return objects, time.monotonic() - start_time
+
+    def _publish(self, frame: Frame, results: Dict[str, Tuple[list, float]], latency: float) -> None:
+        """
+        Publishes the result of each model that ran, stamped with the source frame.
+        """
+        for model, (objects, model_latency) in results.items():
+            self._results[model] = Detections(objects, frame.timestamp, frame.seq, model_latency)
+            self._runs[model].inc()
+
+    def latest(self, model: Optional[str] = None) -> Detections:
+        """
+        Returns the most recent result of a model.
+
+        Args:
+            model (Optional[str], optional): Path of the model. Defaults to None (the first model).
+
+        Returns:
+            Detections: The model's latest result (`NO_DETECTIONS` before its first run).
+        """
+        return self._results[model if model is not None else self.models[0]]
+
+    def results(self) -> Dict[str, Detections]:
+        """
+        Returns the most recent result of every model.
+
+        Returns:
+            Dict[str, Detections]: Latest result keyed by model path.
+        """
+        return dict(self._results)
@@ -0,0 +1,108 @@
+from typing import Callable, NamedTuple
+
+
+class BBox(NamedTuple):
+    """
+    An axis-aligned bounding box.
+
+    Has the same fields and methods as `pycoral.adapters.detect.BBox`, so detections built
+    here and by pycoral are interchangeable, without importing pycoral (which is only
+    available on the robot) in the simulator, the recorder or the trackers.
+    """
+
+    xmin: float  # Left edge
+    ymin: float  # Top edge
+    xmax: float  # Right edge
+    ymax: float  # Bottom edge
+
+    @property
+    def width(self) -> float:
+        """Returns the width of the box."""
+        return self.xmax - self.xmin
+
+    @property
+    def height(self) -> float:
+        """Returns the height of the box."""
+        return self.ymax - self.ymin
+
+    @property
+    def area(self) -> float:
+        """Returns the area of the box."""
+        return self.width * self.height
+
+    @property
+    def valid(self) -> bool:
+        """Returns whether the box has a non-negative width and height."""
+        return self.width >= 0 and self.height >= 0
+
+    def scale(self, sx: float, sy: float) -> 'BBox':
+        """
+        Returns the box scaled by a horizontal and vertical factor.
+
+        Args:
+            sx (float): Horizontal scale factor.
+            sy (float): Vertical scale factor.
+
+        Returns:
+            BBox: The scaled box.
+        """
+        return BBox(self.xmin * sx, self.ymin * sy, self.xmax * sx, self.ymax * sy)
+
+    def translate(self, dx: float, dy: float) -> 'BBox':
+        """
+        Returns the box moved by an offset.
+
+        Args:
+            dx (float): Horizontal offset.
+            dy (float): Vertical offset.
+
+        Returns:
+            BBox: The moved box.
+        """
+        return BBox(self.xmin + dx, self.ymin + dy, self.xmax + dx, self.ymax + dy)
+
+    def map(self, f: Callable[[float], float]) -> 'BBox':
+        """
+        Returns the box with a function applied to each coordinate (e.g. `int`).
+
+        Args:
+            f (Callable[[float], float]): The function.
+
+        Returns:
+            BBox: The mapped box.
+        """
+        return BBox(f(self.xmin), f(self.ymin), f(self.xmax), f(self.ymax))
+
+    @staticmethod
+    def intersect(a: 'BBox', b: 'BBox') -> 'BBox':
+        """
+        Returns the intersection of two boxes (invalid if they don't overlap).
+        """
+        return BBox(max(a.xmin, b.xmin), max(a.ymin, b.ymin), min(a.xmax, b.xmax), min(a.ymax, b.ymax))
+
+    @staticmethod
+    def union(a: 'BBox', b: 'BBox') -> 'BBox':
+        """
+        Returns the smallest box containing two boxes.
+        """
+        return BBox(min(a.xmin, b.xmin), min(a.ymin, b.ymin), max(a.xmax, b.xmax), max(a.ymax, b.ymax))
+
+    @staticmethod
+    def iou(a: 'BBox', b: 'BBox') -> float:
+        """
+        Returns the intersection over union of two boxes (0 if they don't overlap).
+        """
+        intersection = BBox.intersect(a, b)
+        if not intersection.valid:
+            return 0.0
+        return intersection.area / (a.area + b.area - intersection.area)
+
+
+class Object(NamedTuple):
+    """
+    A detected object, with the same fields as `pycoral.adapters.detect.Object`.
+    """
+
+    id: int  # Class id
+    score: float  # Detection score (0-1)
+    bbox: BBox  # Bounding box (frame pixels)
@@ -0,0 +1,227 @@
+import math
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from inference.objects import BBox
+from inference.preprocess import PreprocessedDetector, Preprocessor
+
+# MoveNet keypoints, in output order
+KEYPOINTS: Tuple[str, ...] = (
+    'nose', 'left_eye', 'right_eye', 'left_ear', 'right_ear',
+    'left_shoulder', 'right_shoulder', 'left_elbow', 'right_elbow', 'left_wrist', 'right_wrist',
+    'left_hip', 'right_hip', 'left_knee', 'right_knee', 'left_ankle', 'right_ankle',
+)
+HEAD: Tuple[int, ...] = (0, 1, 2, 3, 4)  # Nose, eyes and ears
+SHOULDERS: Tuple[int, ...] = (5, 6)
+HIPS: Tuple[int, ...] = (11, 12)
+
+# Pose settings
+KEYPOINT_THRESHOLD: float = 0.3  # Keypoints scoring lower than this are treated as not visible
+PERSON_CLASS: int = 0  # Class id reported for poses ('person' in COCO)
+
+# One Euro filter settings (see `KeypointSmoother`)
+MIN_CUTOFF: float = 1.0  # Cutoff frequency of a still keypoint (Hz)
+BETA: float = 0.05  # Cutoff increase per pixel/second of keypoint speed
+DERIVATIVE_CUTOFF: float = 1.0  # Cutoff frequency of the speed estimate (Hz)
+SMOOTHER_TIMEOUT: float = 0.5  # Keypoints unseen for longer than this (seconds) restart unfiltered
+
+
+class Pose(NamedTuple):
+    """
+    A single-person pose, usable wherever detected objects are (same id, score and bbox fields).
+    """
+
+    id: int  # Class id (always `PERSON_CLASS`)
+    score: float  # Mean keypoint score
+    bbox: BBox  # Bounding box of the visible keypoints (frame pixels)
+    keypoints: np.ndarray  # Keypoints of shape (17, 3) as (x, y, score), x and y in frame pixels
+
+
+class PoseEstimator(PreprocessedDetector):
+    """
+    Runs a single-pose MoveNet model and returns the pose as a one-element object list.
+
+    Has the same `get_objects` interface as the detectors, so the supervisor's inference
+    worker (and the recorder) handle poses unchanged.
+    """
+
+    def __init__(
+        self,
+        interpreter: Any,
+        preprocessor: Optional[Preprocessor] = None,
+        keypoint_threshold: float = KEYPOINT_THRESHOLD,
+    ) -> None:
+        """
+        Initializes the estimator.
+
+        Args:
+            interpreter: TFLite interpreter of a single-pose MoveNet model, with its tensors allocated.
+            preprocessor (Optional[Preprocessor], optional): Frame preprocessing. Defaults to a
+                                                             new `Preprocessor`.
+            keypoint_threshold (float, optional): Minimum score of a visible keypoint.
+                                                  Defaults to `KEYPOINT_THRESHOLD`.
+        """
+        super().__init__(interpreter, preprocessor)
+        self.keypoint_threshold: float = keypoint_threshold
+        self._output = interpreter.get_output_details()[0]
+        _, height, width, _ = interpreter.get_input_details()[0]['shape']
+        self.input_size: Tuple[int, int] = (int(width), int(height))
+
+    def decode(self, scale: Tuple[float, float], threshold: float) -> List[Pose]:
+        """
+        Reads the pose of the person from the keypoint output (called with the lock held).
+
+        Args:
+            scale (Tuple[float, float]): Horizontal and vertical scale from frame to tensor pixels.
+            threshold (float): Minimum mean keypoint score.
+
+        Returns:
+            List[Pose]: The pose, or an empty list if no keypoint is visible.
+        """
+        scale_x, scale_y = scale
+
+        # Output of shape (1, 1, 17, 3) as normalized (y, x, score)
+        raw = self.interpreter.tensor(self._output['index'])()[0, 0]
+        output = raw.astype(np.float32)
+        del raw
+        scale, zero_point = self._output['quantization']
+        if scale != 0:
+            output -= zero_point
+            output *= scale
+
+        # Model coordinates to frame pixels
+        width, height = self.input_size
+        keypoints = np.empty((len(output), 3), dtype=np.float32)
+        keypoints[:, 0] = output[:, 1] * (width / scale_x)
+        keypoints[:, 1] = output[:, 0] * (height / scale_y)
+        keypoints[:, 2] = output[:, 2]
+
+        visible = keypoints[:, 2] >= self.keypoint_threshold
+        score = float(keypoints[:, 2].mean())
+        if score < threshold or not visible.any():
+            return []
+
+        x, y = keypoints[visible, 0], keypoints[visible, 1]
+        bbox = BBox(int(x.min()), int(y.min()), int(x.max()), int(y.max()))
+        return [Pose(PERSON_CLASS, score, bbox, keypoints)]
+
+
+class KeypointSmoother:
+    """
+    Smooths keypoint positions over time with a One Euro filter per coordinate.
+
+    The filter's cutoff frequency rises with the keypoint's speed: still keypoints are
+    smoothed heavily (no jitter), moving ones lightly (little lag). Keypoints below the
+    score threshold keep their last filtered position, and keypoints unseen for longer
+    than `timeout` restart from their next measurement.
+    """
+
+    def __init__(
+        self,
+        num_keypoints: int = len(KEYPOINTS),
+        min_cutoff: float = MIN_CUTOFF,
+        beta: float = BETA,
+        d_cutoff: float = DERIVATIVE_CUTOFF,
+        threshold: float = KEYPOINT_THRESHOLD,
+        timeout: float = SMOOTHER_TIMEOUT,
+    ) -> None:
+        """
+        Initializes the smoother without state.
+
+        Args:
+            num_keypoints (int, optional): Number of keypoints. Defaults to 17.
+            min_cutoff (float, optional): Cutoff frequency of a still keypoint (Hz). Defaults to `MIN_CUTOFF`.
+            beta (float, optional): Cutoff increase per unit of speed. Defaults to `BETA`.
+            d_cutoff (float, optional): Cutoff frequency of the speed estimate (Hz). Defaults to `DERIVATIVE_CUTOFF`.
+            threshold (float, optional): Minimum score of a measured keypoint. Defaults to `KEYPOINT_THRESHOLD`.
+            timeout (float, optional): Time (seconds) after which unseen keypoints restart.
+                                       Defaults to `SMOOTHER_TIMEOUT`.
+        """
+        self.min_cutoff: float = min_cutoff
+        self.beta: float = beta
+        self.d_cutoff: float = d_cutoff
+        self.threshold: float = threshold
+        self.timeout: float = timeout
+
+        # Filter state per keypoint
+        self.keypoints: np.ndarray = np.zeros((num_keypoints, 3), dtype=np.float32)  # Filtered (x, y, score)
+        self._speed: np.ndarray = np.zeros((num_keypoints, 2), dtype=np.float32)
+        self._last_seen: np.ndarray = np.full(num_keypoints, -math.inf)
+        self._time: Optional[float] = None
+
+    def reset(self) -> None:
+        """
+        Forgets all keypoints.
+        """
+        self.keypoints.fill(0.0)
+        self._speed.fill(0.0)
+        self._last_seen.fill(-math.inf)
+        self._time = None
+
+    def update(self, keypoints: np.ndarray, timestamp: float) -> np.ndarray:
+        """
+        Filters a new measurement.
+
+        Args:
+            keypoints (np.ndarray): Measured keypoints of shape (N, 3) as (x, y, score).
+            timestamp (float): Capture time of the measurement (seconds).
+
+        Returns:
+            np.ndarray: Filtered keypoints of shape (N, 3) as (x, y, score). The array is
+                        updated in place by later calls.
+        """
+        dt = timestamp - self._time if self._time is not None else 0.0
+        self._time = timestamp
+
+        seen = keypoints[:, 2] >= self.threshold
+        fresh = seen & (timestamp - self._last_seen > self.timeout)  # (Re)appearing keypoints
+        tracked = seen & ~fresh
+
+        if dt > 0 and tracked.any():
+            position = keypoints[tracked, :2]
+            previous = self.keypoints[tracked, :2]
+
+            # Smoothed speed, then a speed-dependent cutoff for the position
+            speed = (position - previous) / dt
+            speed = self._speed[tracked] + self._alpha(self.d_cutoff, dt) * (speed - self._speed[tracked])
+            cutoff = self.min_cutoff + self.beta * np.abs(speed)
+            self.keypoints[tracked, :2] = previous + self._alpha(cutoff, dt) * (position - previous)
+            self._speed[tracked] = speed
+
+        self.keypoints[fresh, :2] = keypoints[fresh, :2]
+        self._speed[fresh] = 0.0
+        self.keypoints[:, 2] = np.where(seen, keypoints[:, 2], 0.0)
+        self._last_seen[seen] = timestamp
+        return self.keypoints
+
+    @staticmethod
+    def _alpha(cutoff, dt: float):
+        """
+        Returns the smoothing factor of a first-order low-pass filter.
+        """
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+
+def center(
+    keypoints: np.ndarray,
+    indices: Tuple[int, ...],
+    threshold: float = KEYPOINT_THRESHOLD,
+) -> Optional[Tuple[float, float]]:
+    """
+    Returns the mean position of the visible keypoints of a group.
+
+    Args:
+        keypoints (np.ndarray): Keypoints of shape (N, 3) as (x, y, score).
+        indices (Tuple[int, ...]): Keypoints of the group (e.g. `HEAD`).
+        threshold (float, optional): Minimum score of a visible keypoint. Defaults to `KEYPOINT_THRESHOLD`.
+
+    Returns:
+        Optional[Tuple[float, float]]: The (x, y) center, or None if no keypoint of the group is visible.
+    """
+    group = keypoints[list(indices)]
+    visible = group[group[:, 2] >= threshold]
+    if len(visible) == 0:
+        return None
+    return float(visible[:, 0].mean()), float(visible[:, 1].mean())
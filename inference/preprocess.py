@@ -0,0 +1,198 @@
+import threading
+from typing import Any, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Interpolation used to scale frames to the model input
+INTERPOLATION: int = cv2.INTER_LINEAR
+
+# Normalization of float model inputs: (pixel - mean) / std maps pixels to [-1, 1]
+INPUT_MEAN: float = 127.5
+INPUT_STD: float = 127.5
+
+
+def input_size(interpreter: Any) -> Tuple[int, int]:
+    """
+    Returns the input size of a model (as `pycoral.adapters.common.input_size`).
+
+    Args:
+        interpreter: TFLite interpreter of the model.
+
+    Returns:
+        Tuple[int, int]: Width and height of the input tensor.
+    """
+    _, height, width, _ = interpreter.get_input_details()[0]['shape']
+    return int(width), int(height)
+
+
+def input_tensor(interpreter: Any) -> np.ndarray:
+    """
+    Returns a view of a model's input tensor (as `pycoral.adapters.common.input_tensor`).
+
+    Args:
+        interpreter: TFLite interpreter of the model, with its tensors allocated.
+
+    Returns:
+        np.ndarray: The tensor of shape (height, width, channels), written in place.
+    """
+    return interpreter.tensor(interpreter.get_input_details()[0]['index'])()[0]
+
+
+class Preprocessor:
+    """
+    Scales, mirrors and color-converts camera frames straight into a model's input tensor.
+
+    Frames are resized with their aspect ratio preserved into the top-left corner of the
+    tensor, like `pycoral.adapters.common.set_resized_input`, but every step writes into
+    a preallocated buffer or the tensor itself. The zero padding is only rewritten when
+    the scaled size changes, instead of clearing the whole tensor on every frame.
+    """
+
+    def __init__(self, flip: bool = False, swap_rb: bool = True, interpolation: int = INTERPOLATION) -> None:
+        """
+        Initializes the preprocessor.
+
+        Args:
+            flip (bool, optional): Mirror frames horizontally. Defaults to False.
+            swap_rb (bool, optional): Convert BGR camera frames to the RGB order the models expect.
+                                      Defaults to True.
+            interpolation (int, optional): OpenCV interpolation flag. Defaults to `INTERPOLATION`.
+        """
+        self.flip: bool = flip
+        self.swap_rb: bool = swap_rb
+        self.interpolation: int = interpolation
+
+        # Scratch buffers at the scaled size (allocated on first use and on size changes)
+        self._resized: Optional[np.ndarray] = None
+        self._flipped: Optional[np.ndarray] = None
+        self._size: Optional[Tuple[int, int]] = None  # Scaled (width, height) last written
+
+    def __call__(self, image: np.ndarray, tensor: np.ndarray) -> Tuple[float, float]:
+        """
+        Writes a frame into an input tensor.
+
+        Args:
+            image (np.ndarray): BGR frame (or crop) of shape (height, width, 3).
+            tensor (np.ndarray): uint8 input tensor of shape (height, width, 3).
+
+        Returns:
+            Tuple[float, float]: Horizontal and vertical scale from frame to tensor pixels.
+        """
+        height, width = image.shape[:2]
+        tensor_height, tensor_width = tensor.shape[:2]
+        scale = min(tensor_width / width, tensor_height / height)
+        size = (max(int(width * scale), 1), max(int(height * scale), 1))
+
+        if size != self._size:
+            tensor.fill(0)  # Clear the padding left by a different scaled size
+            shape = (size[1], size[0], image.shape[2])
+            self._resized = np.empty(shape, dtype=np.uint8) if self.flip or self.swap_rb else None
+            self._flipped = np.empty(shape, dtype=np.uint8) if self.flip and self.swap_rb else None
+            self._size = size
+
+        region = tensor[:size[1], :size[0]]
+
+        if not (self.flip or self.swap_rb):
+            cv2.resize(image, size, dst=region, interpolation=self.interpolation)
+        else:
+            resized = cv2.resize(image, size, dst=self._resized, interpolation=self.interpolation)
+            if self.flip and self.swap_rb:
+                cv2.flip(resized, 1, dst=self._flipped)
+                cv2.cvtColor(self._flipped, cv2.COLOR_BGR2RGB, dst=region)
+            elif self.flip:
+                cv2.flip(resized, 1, dst=region)
+            else:
+                cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=region)
+
+        return size[0] / width, size[1] / height
+
+
+class PreprocessedDetector:
+    """
+    Runs a detection model with its input written by a `Preprocessor`.
+
+    Has the same `get_objects` interface as `aiymakerkit.vision.Detector`, but skips the
+    intermediate resized copy and the full tensor clear that detector performs on every
+    frame. Quantized (uint8) models are written to directly; float models go through a
+    preallocated uint8 staging buffer and are normalized in place.
+
+    Detectors are shared through the model registry, so several threads may call
+    `get_objects` at once (e.g. the multi-model stage and a controller's own task).
+    The interpreter and the buffers are not thread-safe: each call holds the
+    detector's lock from writing the input to decoding the output. Subclasses decode
+    their outputs in `decode`.
+    """
+
+    def __init__(self, interpreter: Any, preprocessor: Optional[Preprocessor] = None) -> None:
+        """
+        Initializes the detector.
+
+        Args:
+            interpreter: TFLite interpreter of an SSD detection model, with its tensors allocated.
+            preprocessor (Optional[Preprocessor], optional): Frame preprocessing. Defaults to a
+                                                             new `Preprocessor`.
+        """
+        self.interpreter = interpreter
+        self.preprocessor: Preprocessor = preprocessor or Preprocessor()
+        self._lock = threading.Lock()  # Serializes runs of the interpreter
+
+        # Staging buffer for models that don't take uint8 input
+        details = interpreter.get_input_details()[0]
+        self._staging: Optional[np.ndarray] = None
+        if details['dtype'] != np.uint8:
+            self._staging = np.zeros(details['shape'][1:], dtype=np.uint8)
+
+    def invoke(self, frame: np.ndarray) -> Tuple[float, float]:
+        """
+        Writes a frame into the input tensor and runs the model (call with the lock held).
+
+        Args:
+            frame (np.ndarray): BGR frame (or crop) to run the model on.
+
+        Returns:
+            Tuple[float, float]: Horizontal and vertical scale from frame to tensor pixels.
+        """
+        # The tensor view is only held while preprocessing: the interpreter refuses to run
+        # while numpy references to its buffers exist
+        if self._staging is None:
+            scale = self.preprocessor(frame, input_tensor(self.interpreter))
+        else:
+            scale = self.preprocessor(frame, self._staging)
+            tensor = input_tensor(self.interpreter)
+            np.subtract(self._staging, INPUT_MEAN, out=tensor, casting='unsafe')
+            tensor /= INPUT_STD
+            del tensor
+
+        self.interpreter.invoke()
+        return scale
+
+    def get_objects(self, frame: np.ndarray, threshold: float = 0.01) -> list:
+        """
+        Detects objects in a frame.
+
+        Args:
+            frame (np.ndarray): BGR frame (or crop) to run detection on.
+            threshold (float, optional): Minimum detection score. Defaults to 0.01.
+
+        Returns:
+            list: Detected objects with bounding boxes in frame coordinates.
+        """
+        with self._lock:
+            scale = self.invoke(frame)
+            return self.decode(scale, threshold)
+
+    def decode(self, scale: Tuple[float, float], threshold: float) -> list:
+        """
+        Reads the objects from the output tensors of the postprocess op (called with the lock held).
+
+        Args:
+            scale (Tuple[float, float]): Horizontal and vertical scale from frame to tensor pixels.
+            threshold (float): Minimum detection score.
+
+        Returns:
+            list: Detected objects with bounding boxes in frame coordinates.
+        """
+        from pycoral.adapters import detect  # Robot-only dependency, imported for real models
+
+        return detect.get_objects(self.interpreter, threshold, scale)
@@ -0,0 +1,144 @@
+import math
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from utils.metrics import metrics
+from utils.pose import normalize_angle
+
+# Frame gate settings
+GATE_SIZE: Tuple[int, int] = (160, 120)  # Resolution sharpness is measured at (width, height)
+BLUR_RATIO: float = 0.4  # Moving frames less sharp than this fraction of a still frame are blurred
+REFERENCE_DECAY: float = 0.95  # Per still frame decay of the reference sharpness (follows scene changes)
+STILL_OMEGA: float = 0.2  # Below this commanded angular speed (rad/s) frames are taken to be sharp
+MIN_HEADING_STEP: float = math.radians(15)  # Camera rotation between frames worth running the detector on
+MAX_INTERVAL: float = 0.5  # Longest time (seconds) without a detector run, even without rotation
+
+
+class FrameGate:
+    """
+    Decides cheaply whether a frame is worth running the detector on while scanning.
+
+    Two kinds of frames are skipped, but never for longer than `max_interval` in a row.
+    Redundant frames show what the last inspected frame showed: the camera has turned
+    less than `min_heading_step` since. Blurred frames were captured while the robot
+    turned and are much less sharp than recent still frames, by the variance of the
+    Laplacian of a downsampled grayscale copy. Still frames set the reference sharpness;
+    moving frames are only measured while a redundancy check has not already ruled them out.
+    """
+
+    def __init__(
+        self,
+        min_heading_step: float = MIN_HEADING_STEP,
+        max_interval: float = MAX_INTERVAL,
+        blur_ratio: float = BLUR_RATIO,
+        still_omega: float = STILL_OMEGA,
+        max_omega: float = math.inf,
+        size: Tuple[int, int] = GATE_SIZE,
+    ) -> None:
+        """
+        Initializes the gate without history.
+
+        Args:
+            min_heading_step (float, optional): Rotation (radians) after which a frame is new. Defaults
+                                                to `MIN_HEADING_STEP`.
+            max_interval (float, optional): Longest time (seconds) between inspected frames. Defaults
+                                            to `MAX_INTERVAL`.
+            blur_ratio (float, optional): Sharpness of a blurred frame relative to the reference.
+                                          Defaults to `BLUR_RATIO`.
+            still_omega (float, optional): Angular speed (rad/s) below which frames are not checked for
+                                           blur. Defaults to `STILL_OMEGA`.
+            max_omega (float, optional): Frames captured while turning faster than this (rad/s) count as
+                                         blurred without being measured. Defaults to no limit.
+            size (Tuple[int, int], optional): Resolution sharpness is measured at. Defaults to `GATE_SIZE`.
+        """
+        self.min_heading_step: float = min_heading_step
+        self.max_interval: float = max_interval
+        self.blur_ratio: float = blur_ratio
+        self.still_omega: float = still_omega
+        self.max_omega: float = max_omega
+        self.size: Tuple[int, int] = size
+        self.reference: float = 0.0  # Sharpness of recent still frames
+
+        # Scratch buffers, reused for every frame
+        width, height = size
+        self._small: Optional[np.ndarray] = None
+        self._gray = np.empty((height, width), dtype=np.uint8)
+        self._laplacian = np.empty((height, width), dtype=np.float32)
+
+        # Heading and time of the last frame let through
+        self._heading: float = 0.0
+        self._time: float = -math.inf
+
+        # Statistics
+        self.passed: int = 0
+        self.redundant: int = 0
+        self.blurred: int = 0
+        self._passed = metrics.counter('gate.passed')
+        self._redundant = metrics.counter('gate.redundant')
+        self._blurred = metrics.counter('gate.blurred')
+
+    def reset(self) -> None:
+        """
+        Forgets the last inspected frame (the next frame always passes the redundancy check).
+        """
+        self._time = -math.inf
+
+    def sharpness(self, image: np.ndarray) -> float:
+        """
+        Measures the sharpness of a frame as the variance of the Laplacian of a downsampled copy.
+
+        Args:
+            image (np.ndarray): BGR frame.
+
+        Returns:
+            float: The sharpness (higher is sharper; scene dependent).
+        """
+        width, height = self.size
+        if self._small is None or self._small.shape[2] != image.shape[2]:
+            self._small = np.empty((height, width, image.shape[2]), dtype=np.uint8)
+
+        cv2.resize(image, self.size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        cv2.Laplacian(self._gray, cv2.CV_32F, dst=self._laplacian)
+        _, std = cv2.meanStdDev(self._laplacian)
+        return float(std[0, 0]) ** 2
+
+    def accept(self, image: np.ndarray, timestamp: float, heading: float, omega: float) -> bool:
+        """
+        Checks whether a frame should be passed to the detector.
+
+        Args:
+            image (np.ndarray): BGR frame.
+            timestamp (float): Capture time of the frame (seconds).
+            heading (float): Direction of the camera (radians), e.g. robot heading plus pan.
+            omega (float): Commanded angular velocity of the robot (rad/s).
+
+        Returns:
+            bool: True if the detector should run on the frame.
+        """
+        still = abs(omega) < self.still_omega
+        if still:
+            self.reference = max(self.sharpness(image), self.reference * REFERENCE_DECAY)
+
+        # Skip frames only for a while, so the detector runs at least every `max_interval`
+        if timestamp - self._time < self.max_interval:
+            # Redundant: the camera still looks where it looked at the last inspected frame
+            if abs(normalize_angle(heading - self._heading)) < self.min_heading_step:
+                self.redundant += 1
+                self._redundant.inc()
+                return False
+
+            # Blurred: turning too fast, or much less sharp than a recent still frame
+            if abs(omega) > self.max_omega or (
+                not still and self.reference > 0 and self.sharpness(image) < self.blur_ratio * self.reference
+            ):
+                self.blurred += 1
+                self._blurred.inc()
+                return False
+
+        self._heading, self._time = heading, timestamp
+        self.passed += 1
+        self._passed.inc()
+        return True
@@ -0,0 +1,176 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from inference.backend import InferenceBackend
+
+# Maximum number of detectors kept loaded at the same time
+MAX_MODELS: int = 3
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded detectors and label maps.
+
+    Detectors are keyed on their model path (see `data.models`) and shared between
+    controllers, so switching controllers does not reload the model or re-initialize
+    the EdgeTPU. The number of loaded detectors is bounded with LRU eviction.
+    """
+
+    def __init__(self, max_models: int = MAX_MODELS) -> None:
+        """
+        Initializes an empty registry.
+
+        Args:
+            max_models (int, optional): Maximum number of detectors kept loaded. Defaults to `MAX_MODELS`.
+        """
+        self.max_models: int = max_models
+
+        # Device the models run on, and factories for detectors, pose estimators and label maps
+        # (replaceable, e.g. by the simulation backend)
+        self.backend: InferenceBackend = InferenceBackend()
+        self.loader: Callable[[str], Any] = self.backend.detector
+        self.pose_loader: Callable[[str], Any] = self.backend.pose_estimator
+        self.labels_loader: Callable[[str], Dict[int, str]] = self.backend.labels
+
+        # Loaded detectors and parsed label maps, most recently used last
+        self._detectors: "OrderedDict[str, Any]" = OrderedDict()
+        self._labels: Dict[str, Dict[int, str]] = {}
+        self._lock = threading.RLock()
+
+        # Statistics
+        self.hits: int = 0  # Requests served from the cache
+        self.misses: int = 0  # Requests that required loading a model
+        self.evictions: int = 0  # Detectors dropped to respect `max_models`
+        self.load_times: Dict[str, float] = {}  # Last load time per model (seconds)
+
+    def set_backend(self, backend: InferenceBackend) -> None:
+        """
+        Switches the device models run on, unloading the detectors of the previous backend.
+
+        Args:
+            backend (InferenceBackend): The inference backend to load models with.
+        """
+        with self._lock:
+            self.backend = backend
+            self.loader = backend.detector
+            self.pose_loader = backend.pose_estimator
+            self.labels_loader = backend.labels
+            self._detectors.clear()
+            self._labels.clear()
+
+    def detector(self, model: str) -> Any:
+        """
+        Returns the detector for a model, loading it on first use.
+
+        Args:
+            model (str): Path to the detection model.
+
+        Returns:
+            Detector: The shared detector instance.
+        """
+        return self._get(model, self.loader)
+
+    def pose_estimator(self, model: str) -> Any:
+        """
+        Returns the pose estimator for a model, loading it on first use.
+
+        Args:
+            model (str): Path to the pose model (e.g. `data.models.MOVENET_MODEL`).
+
+        Returns:
+            PoseEstimator: The shared pose estimator instance.
+        """
+        return self._get(model, self.pose_loader)
+
+    def _get(self, model: str, loader: Callable[[str], Any]) -> Any:
+        """
+        Returns a cached model instance, loading it with `loader` on a miss.
+        """
+        with self._lock:
+            detector = self._detectors.get(model)
+            if detector is not None:
+                self.hits += 1
+                self._detectors.move_to_end(model)
+                return detector
+
+            self.misses += 1
+            start_time = time.monotonic()
+            detector = loader(model)
+            self.load_times[model] = time.monotonic() - start_time
+
+            self._detectors[model] = detector
+            while len(self._detectors) > self.max_models:
+                self._detectors.popitem(last=False)  # Drop the least recently used detector
+                self.evictions += 1
+
+            return detector
+
+    def labels(self, model: str) -> Dict[int, str]:
+        """
+        Returns the label map embedded in a model's metadata, parsing it on first use.
+
+        Args:
+            model (str): Path to the model containing label metadata.
+
+        Returns:
+            Dict[int, str]: Mapping from class id to label.
+        """
+        with self._lock:
+            labels = self._labels.get(model)
+            if labels is None:
+                labels = self.labels_loader(model)
+                self._labels[model] = labels
+            return labels
+
+    def preload(self, *models: str) -> None:
+        """
+        Loads the given models ahead of time so the first controller switch is fast.
+
+        Args:
+            *models (str): Paths to the detection models to load.
+        """
+        for model in models:
+            self.detector(model)
+
+    def evict(self, model: Optional[str] = None) -> None:
+        """
+        Unloads a single detector, or all detectors if no model is given.
+
+        Args:
+            model (Optional[str], optional): Path of the model to unload. Defaults to None.
+        """
+        with self._lock:
+            if model is None:
+                self._detectors.clear()
+            else:
+                self._detectors.pop(model, None)
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the fraction of detector requests served from the cache."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns cache statistics.
+
+        Returns:
+            Dict[str, Any]: Inference device, loaded models, hit/miss counts, hit rate and load times.
+        """
+        with self._lock:
+            return {
+                'backend': self.backend.name,
+                'loaded': list(self._detectors.keys()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hit_rate,
+                'load_times': dict(self.load_times),
+            }
+
+
+# Shared registry used by all controllers
+registry = ModelRegistry()
@@ -0,0 +1,341 @@
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from inference.objects import BBox, Object
+from inference.preprocess import PreprocessedDetector, Preprocessor, input_size
+
+# Anchor layout of the TF Object Detection API SSD MobileNet models (300x300 input)
+NUM_LAYERS: int = 6  # Feature maps anchors are placed on
+MIN_SCALE: float = 0.2  # Anchor scale on the first feature map
+MAX_SCALE: float = 0.95  # Anchor scale on the last feature map
+ASPECT_RATIOS: Tuple[float, ...] = (1.0, 2.0, 0.5, 3.0, 1.0 / 3.0)
+FEATURE_STRIDES: Tuple[int, ...] = (16, 32, 64, 128, 256, 512)  # Input pixels per feature map cell
+
+# Box coder scale factors (y, x, height, width)
+BOX_SCALES: Tuple[float, float, float, float] = (10.0, 10.0, 5.0, 5.0)
+
+# Post-processing settings (same defaults as the TFLite detection postprocess op)
+IOU_THRESHOLD: float = 0.6  # Boxes overlapping a better box of the same class more than this are dropped
+MAX_DETECTIONS: int = 20  # Maximum number of objects returned per frame
+PRE_NMS_TOP_K: int = 100  # Candidates entering NMS, best scores first
+
+
+def generate_anchors(
+    input_size: Tuple[int, int],
+    num_layers: int = NUM_LAYERS,
+    min_scale: float = MIN_SCALE,
+    max_scale: float = MAX_SCALE,
+    aspect_ratios: Sequence[float] = ASPECT_RATIOS,
+    strides: Sequence[int] = FEATURE_STRIDES,
+) -> np.ndarray:
+    """
+    Generates the SSD anchor boxes of the TF Object Detection API anchor generator.
+
+    Anchors are ordered by feature map, then grid row and column, then aspect ratio,
+    matching the rows of the model's raw box and score tensors (1917 anchors for the
+    300x300 SSD MobileNet models).
+
+    Args:
+        input_size (Tuple[int, int]): Model input (width, height).
+        num_layers (int, optional): Number of feature maps. Defaults to `NUM_LAYERS`.
+        min_scale (float, optional): Anchor scale on the first feature map. Defaults to `MIN_SCALE`.
+        max_scale (float, optional): Anchor scale on the last feature map. Defaults to `MAX_SCALE`.
+        aspect_ratios (Sequence[float], optional): Anchor aspect ratios. Defaults to `ASPECT_RATIOS`.
+        strides (Sequence[int], optional): Feature map strides. Defaults to `FEATURE_STRIDES`.
+
+    Returns:
+        np.ndarray: Anchors of shape (N, 4) as normalized (y_center, x_center, height, width).
+    """
+    width, height = input_size
+
+    def scale(layer: int) -> float:
+        return min_scale + (max_scale - min_scale) * layer / (num_layers - 1) if num_layers > 1 else min_scale
+
+    layers = []
+    for layer, stride in enumerate(strides[:num_layers]):
+        # Per-location anchor shapes (the first layer uses three reduced boxes)
+        if layer == 0:
+            shapes = [(0.1, 1.0), (scale(0), 2.0), (scale(0), 0.5)]
+        else:
+            shapes = [(scale(layer), ratio) for ratio in aspect_ratios]
+            next_scale = scale(layer + 1) if layer < num_layers - 1 else 1.0
+            shapes.append((math.sqrt(scale(layer) * next_scale), 1.0))
+
+        sizes = np.array([(s / math.sqrt(r), s * math.sqrt(r)) for s, r in shapes], dtype=np.float32)
+
+        # Anchor centers on the feature map grid
+        rows, cols = math.ceil(height / stride), math.ceil(width / stride)
+        y, x = np.meshgrid((np.arange(rows) + 0.5) / rows, (np.arange(cols) + 0.5) / cols, indexing='ij')
+        centers = np.stack((y.ravel(), x.ravel()), axis=1).astype(np.float32)
+
+        anchors = np.empty((rows * cols, len(shapes), 4), dtype=np.float32)
+        anchors[:, :, :2] = centers[:, None, :]
+        anchors[:, :, 2:] = sizes[None, :, :]
+        layers.append(anchors.reshape(-1, 4))
+
+    return np.concatenate(layers)
+
+
+def batched_nms(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    classes: np.ndarray,
+    iou_threshold: float = IOU_THRESHOLD,
+    max_detections: int = MAX_DETECTIONS,
+) -> np.ndarray:
+    """
+    Greedy non-maximum suppression of all classes at once.
+
+    Boxes are shifted apart by class so that boxes of different classes never overlap;
+    one suppression pass then handles every class. Each pass compares the best
+    remaining box against all others in a single vectorized step, so the number of
+    passes is bounded by the number of kept boxes.
+
+    Args:
+        boxes (np.ndarray): Boxes of shape (N, 4) as (ymin, xmin, ymax, xmax).
+        scores (np.ndarray): Scores of shape (N,).
+        classes (np.ndarray): Class ids of shape (N,).
+        iou_threshold (float, optional): Maximum overlap with a kept box of the same class.
+                                         Defaults to `IOU_THRESHOLD`.
+        max_detections (int, optional): Maximum number of kept boxes. Defaults to `MAX_DETECTIONS`.
+
+    Returns:
+        np.ndarray: Indices of the kept boxes, best scores first.
+    """
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Shift each class into its own region
+    offset = classes.astype(boxes.dtype) * (boxes.max() - boxes.min() + 1)
+    shifted = boxes + offset[:, None]
+    ymin, xmin, ymax, xmax = shifted.T
+    areas = np.maximum(ymax - ymin, 0) * np.maximum(xmax - xmin, 0)
+
+    order = np.argsort(-scores, kind='stable')
+    keep = []
+    while order.size > 0 and len(keep) < max_detections:
+        best, rest = order[0], order[1:]
+        keep.append(best)
+
+        # Overlap of the best box with all remaining boxes
+        height = np.clip(np.minimum(ymax[best], ymax[rest]) - np.maximum(ymin[best], ymin[rest]), 0, None)
+        width = np.clip(np.minimum(xmax[best], xmax[rest]) - np.maximum(xmin[best], xmin[rest]), 0, None)
+        intersection = height * width
+        iou = intersection / np.maximum(areas[best] + areas[rest] - intersection, 1e-9)
+        order = rest[iou <= iou_threshold]
+
+    return np.array(keep, dtype=np.intp)
+
+
+class SSDDecoder:
+    """
+    Turns the raw box and score tensors of an SSD model into detected objects.
+
+    Replaces the TFLite detection postprocess op: scores are thresholded per class
+    directly on the raw tensor (the threshold is converted to logit and quantized
+    units instead), and only the surviving candidates are dequantized, decoded against
+    their anchors and merged with `batched_nms`. The per-anchor mask is preallocated
+    for the model's anchor and class count.
+    """
+
+    def __init__(
+        self,
+        anchors: np.ndarray,
+        num_classes: int,
+        background: bool = True,
+        box_scales: Tuple[float, float, float, float] = BOX_SCALES,
+        iou_threshold: float = IOU_THRESHOLD,
+        max_detections: int = MAX_DETECTIONS,
+        pre_nms_top_k: int = PRE_NMS_TOP_K,
+        sigmoid: bool = True,
+    ) -> None:
+        """
+        Initializes the decoder.
+
+        Args:
+            anchors (np.ndarray): Anchors of shape (N, 4) (see `generate_anchors`).
+            num_classes (int): Number of score columns, including the background class.
+            background (bool, optional): The first score column is the background class. Defaults to True.
+            box_scales (Tuple[float, float, float, float], optional): Box coder scale factors.
+                                                                      Defaults to `BOX_SCALES`.
+            iou_threshold (float, optional): NMS overlap threshold. Defaults to `IOU_THRESHOLD`.
+            max_detections (int, optional): Maximum objects per frame. Defaults to `MAX_DETECTIONS`.
+            pre_nms_top_k (int, optional): Candidates entering NMS. Defaults to `PRE_NMS_TOP_K`.
+            sigmoid (bool, optional): The model outputs logits rather than probabilities. Defaults to True.
+        """
+        self.anchors: np.ndarray = np.ascontiguousarray(anchors, dtype=np.float32)
+        self.first_class: int = 1 if background else 0
+        self.box_scales: np.ndarray = np.array(box_scales, dtype=np.float32)
+        self.iou_threshold: float = iou_threshold
+        self.max_detections: int = max_detections
+        self.pre_nms_top_k: int = pre_nms_top_k
+        self.sigmoid: bool = sigmoid
+
+        # Threshold mask over all anchors and classes (reused every frame)
+        self._mask: np.ndarray = np.empty((len(self.anchors), num_classes - self.first_class), dtype=bool)
+
+    def _raw_threshold(self, threshold: float, quantization: Tuple[float, int]) -> float:
+        """
+        Converts a score threshold to the units of the raw score tensor.
+        """
+        if self.sigmoid:
+            if threshold <= 0.0:
+                return -math.inf
+            if threshold >= 1.0:
+                return math.inf
+            threshold = math.log(threshold / (1.0 - threshold))  # Sigmoid is monotonic
+
+        scale, zero_point = quantization
+        return threshold / scale + zero_point if scale != 0 else threshold
+
+    def decode(
+        self,
+        raw_boxes: np.ndarray,
+        raw_scores: np.ndarray,
+        threshold: float,
+        box_quantization: Tuple[float, int] = (0.0, 0),
+        score_quantization: Tuple[float, int] = (0.0, 0),
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decodes raw model outputs into boxes, scores and class ids.
+
+        Args:
+            raw_boxes (np.ndarray): Box encodings of shape (N, 4) as (ty, tx, th, tw).
+            raw_scores (np.ndarray): Class scores (logits with `sigmoid`) of shape (N, num_classes).
+            threshold (float): Minimum score.
+            box_quantization (Tuple[float, int], optional): Scale and zero point of the box tensor
+                                                            ((0, 0) for float). Defaults to (0.0, 0).
+            score_quantization (Tuple[float, int], optional): Scale and zero point of the score tensor.
+                                                              Defaults to (0.0, 0).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Normalized boxes (K, 4) as (ymin, xmin, ymax, xmax),
+                                                       scores (K,) and class ids (K,), best first.
+        """
+        # Class-wise thresholding on the raw (possibly quantized) scores, so only the
+        # candidates ever get converted
+        raw_threshold = self._raw_threshold(threshold, score_quantization)
+        np.greater_equal(raw_scores[:, self.first_class:], raw_threshold, out=self._mask)
+        anchor_ids, class_ids = np.nonzero(self._mask)
+        candidate_scores = raw_scores[anchor_ids, class_ids + self.first_class].astype(np.float32)
+
+        # Keep the best candidates only
+        if len(candidate_scores) > self.pre_nms_top_k:
+            top = np.argpartition(-candidate_scores, self.pre_nms_top_k)[:self.pre_nms_top_k]
+            anchor_ids, class_ids, candidate_scores = anchor_ids[top], class_ids[top], candidate_scores[top]
+
+        # Dequantize and convert the surviving scores to probabilities
+        if score_quantization[0] != 0:
+            candidate_scores -= score_quantization[1]
+            candidate_scores *= score_quantization[0]
+        if self.sigmoid:
+            candidate_scores = 1.0 / (1.0 + np.exp(-candidate_scores))
+
+        # Decode the candidate boxes against their anchors
+        encodings = raw_boxes[anchor_ids].astype(np.float32)
+        if box_quantization[0] != 0:
+            encodings -= box_quantization[1]
+            encodings *= box_quantization[0]
+        encodings /= self.box_scales
+
+        anchors = self.anchors[anchor_ids]
+        centers = encodings[:, :2] * anchors[:, 2:] + anchors[:, :2]
+        half_sizes = np.exp(encodings[:, 2:]) * anchors[:, 2:] / 2.0
+        boxes = np.concatenate((centers - half_sizes, centers + half_sizes), axis=1)
+
+        keep = batched_nms(boxes, candidate_scores, class_ids, self.iou_threshold, self.max_detections)
+        return boxes[keep], candidate_scores[keep], class_ids[keep]
+
+
+def _find_outputs(interpreter: Any) -> Tuple[dict, dict]:
+    """
+    Identifies the box and score tensors among a raw SSD model's two outputs.
+    """
+    outputs = interpreter.get_output_details()
+    if len(outputs) != 2:
+        raise ValueError(f"Expected the 2 raw outputs of an SSD model, got {len(outputs)}")
+
+    boxes = next((d for d in outputs if 'box' in d['name'].lower()), None)
+    if boxes is None:
+        boxes = next(d for d in outputs if d['shape'][-1] == 4)
+    scores = next(d for d in outputs if d is not boxes)
+    return boxes, scores
+
+
+def has_postprocess(interpreter: Any) -> bool:
+    """
+    Checks whether a detection model ends in the TFLite detection postprocess op.
+
+    Args:
+        interpreter: TFLite interpreter of an SSD detection model.
+
+    Returns:
+        bool: True if the model outputs boxes, classes, scores and a count (4 tensors).
+    """
+    return len(interpreter.get_output_details()) == 4
+
+
+class RawSSDDetector(PreprocessedDetector):
+    """
+    Runs an SSD model without the postprocess op, decoding its output with `SSDDecoder`.
+
+    Returns the same objects as `PreprocessedDetector`, so controllers can't tell the
+    two apart.
+    """
+
+    def __init__(
+        self,
+        interpreter: Any,
+        decoder: Optional[SSDDecoder] = None,
+        preprocessor: Optional[Preprocessor] = None,
+    ) -> None:
+        """
+        Initializes the detector.
+
+        Args:
+            interpreter: TFLite interpreter of an SSD model with raw box and score outputs,
+                         with its tensors allocated.
+            decoder (Optional[SSDDecoder], optional): Output decoder. Defaults to one with the
+                                                      anchors of `generate_anchors`.
+            preprocessor (Optional[Preprocessor], optional): Frame preprocessing. Defaults to a
+                                                             new `Preprocessor`.
+        """
+        super().__init__(interpreter, preprocessor)
+        self._boxes, self._scores = _find_outputs(interpreter)
+        self.input_size: Tuple[int, int] = input_size(interpreter)
+
+        if decoder is None:
+            decoder = SSDDecoder(generate_anchors(self.input_size), int(self._scores['shape'][-1]))
+        self.decoder: SSDDecoder = decoder
+
+    def decode(self, scale: Tuple[float, float], threshold: float) -> List[Object]:
+        """
+        Decodes the raw box and score outputs into objects (called with the lock held).
+
+        Args:
+            scale (Tuple[float, float]): Horizontal and vertical scale from frame to tensor pixels.
+            threshold (float): Minimum detection score.
+
+        Returns:
+            List[Object]: Detected objects with bounding boxes in frame coordinates.
+        """
+        scale_x, scale_y = scale
+
+        # Decode straight from the output tensor views (the decoder copies what it keeps)
+        boxes, scores, classes = self.decoder.decode(
+            self.interpreter.tensor(self._boxes['index'])()[0],
+            self.interpreter.tensor(self._scores['index'])()[0],
+            threshold,
+            self._boxes['quantization'],
+            self._scores['quantization'],
+        )
+
+        # Normalized model coordinates to frame pixels (as `pycoral.adapters.detect.get_objects`)
+        width, height = self.input_size
+        boxes *= (height / scale_y, width / scale_x, height / scale_y, width / scale_x)
+        return [
+            Object(id=int(class_id), score=float(score), bbox=BBox(xmin, ymin, xmax, ymax).map(int))
+            for (ymin, xmin, ymax, xmax), score, class_id in zip(boxes.tolist(), scores.tolist(), classes.tolist())
+        ]
@@ -0,0 +1,238 @@
+from typing import Callable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from inference.objects import BBox, Object
+
+# Optical flow settings
+MAX_POINTS: int = 40  # Maximum number of feature points tracked inside the box
+MIN_POINTS: int = 6  # Tracking fails with fewer surviving points
+MAX_FB_ERROR: float = 1.5  # Maximum forward-backward error of a valid point (pixels)
+LK_PARAMS: dict = dict(
+    winSize=(15, 15),
+    maxLevel=2,
+    criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03),
+)
+
+
+class FlowTracker:
+    """
+    Propagates a bounding box between frames using sparse Lucas-Kanade optical flow.
+
+    Feature points are picked inside the box, tracked forward and backward, and the
+    box is shifted and scaled by the median motion of the points that survive the
+    forward-backward check.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the tracker without a target.
+        """
+        self.bbox: Optional[BBox] = None  # Current box (float coordinates)
+        self.confidence: float = 0.0  # Fraction of points tracked reliably in the last update
+
+        # Grayscale frames (reused between updates)
+        self._prev_gray: Optional[np.ndarray] = None
+        self._gray: Optional[np.ndarray] = None
+        self._points: Optional[np.ndarray] = None
+
+    def _to_gray(self, image: np.ndarray) -> np.ndarray:
+        """
+        Converts an image to grayscale into the tracker's reusable buffer.
+        """
+        if self._gray is None or self._gray.shape != image.shape[:2]:
+            self._gray = np.empty(image.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self._gray
+
+    def init(self, image: np.ndarray, bbox: BBox) -> bool:
+        """
+        Starts tracking a box in an image.
+
+        Args:
+            image (np.ndarray): The frame the box was detected in.
+            bbox (BBox): The box to track, in pixel coordinates.
+
+        Returns:
+            bool: True if enough feature points were found inside the box.
+        """
+        gray = self._to_gray(image)
+        height, width = gray.shape
+
+        # Restrict feature detection to the box interior
+        x_min, y_min = max(int(bbox.xmin), 0), max(int(bbox.ymin), 0)
+        x_max, y_max = min(int(bbox.xmax), width), min(int(bbox.ymax), height)
+        self.bbox, self.confidence, self._points = None, 0.0, None
+        if x_max - x_min < 2 or y_max - y_min < 2:
+            return False
+
+        points = cv2.goodFeaturesToTrack(
+            gray[y_min:y_max, x_min:x_max], maxCorners=MAX_POINTS, qualityLevel=0.01, minDistance=3
+        )
+        if points is None or len(points) < MIN_POINTS:
+            return False
+
+        points += np.array([x_min, y_min], dtype=np.float32)  # Back to frame coordinates
+        self._points = points
+        self.bbox = BBox(float(bbox.xmin), float(bbox.ymin), float(bbox.xmax), float(bbox.ymax))
+        self.confidence = 1.0
+
+        # Keep this frame as the reference for the next update
+        self._prev_gray, self._gray = gray, self._prev_gray
+        return True
+
+    def update(self, image: np.ndarray) -> Tuple[Optional[BBox], float]:
+        """
+        Moves the tracked box to a new frame.
+
+        Args:
+            image (np.ndarray): The new frame.
+
+        Returns:
+            Tuple[Optional[BBox], float]: The propagated box (None if tracking failed) and
+                                          the tracking confidence (0.0 to 1.0).
+        """
+        if self.bbox is None:
+            return None, 0.0
+
+        gray = self._to_gray(image)
+        if self._prev_gray.shape != gray.shape:
+            self.bbox, self.confidence = None, 0.0
+            return None, 0.0
+
+        # Track points forward, then backward to reject unreliable matches
+        prev_points = self._points
+        next_points, status, _ = cv2.calcOpticalFlowPyrLK(self._prev_gray, gray, prev_points, None, **LK_PARAMS)
+        back_points, back_status, _ = cv2.calcOpticalFlowPyrLK(gray, self._prev_gray, next_points, None, **LK_PARAMS)
+
+        fb_error = np.linalg.norm((prev_points - back_points).reshape(-1, 2), axis=1)
+        valid = (status.ravel() == 1) & (back_status.ravel() == 1) & (fb_error < MAX_FB_ERROR)
+        num_valid = int(np.count_nonzero(valid))
+
+        self.confidence = num_valid / len(prev_points)
+        if num_valid < MIN_POINTS:
+            self.bbox, self.confidence = None, 0.0
+            return None, 0.0
+
+        old = prev_points.reshape(-1, 2)[valid]
+        new = next_points.reshape(-1, 2)[valid]
+
+        # Median translation, and scale from the spread of the points around their median
+        dx, dy = np.median(new - old, axis=0)
+        old_spread = np.median(np.linalg.norm(old - np.median(old, axis=0), axis=1))
+        new_spread = np.median(np.linalg.norm(new - np.median(new, axis=0), axis=1))
+        scale = new_spread / old_spread if old_spread > 0 else 1.0
+
+        cx = (self.bbox.xmin + self.bbox.xmax) / 2.0 + dx
+        cy = (self.bbox.ymin + self.bbox.ymax) / 2.0 + dy
+        half_w = self.bbox.width * scale / 2.0
+        half_h = self.bbox.height * scale / 2.0
+        self.bbox = BBox(cx - half_w, cy - half_h, cx + half_w, cy + half_h)
+
+        # Continue with the surviving points from the new frame
+        self._points = new.reshape(-1, 1, 2)
+        self._prev_gray, self._gray = gray, self._prev_gray
+
+        return self.bbox, self.confidence
+
+
+class DetectThenTrack:
+    """
+    Runs the full detector only every N frames and tracks the target in between.
+
+    The detection interval N adapts to how well the tracker agrees with the detector:
+    it grows while the tracked box stays within `max_error` pixels of the next detection
+    and the tracker is confident, and is halved otherwise. The detector also runs
+    immediately whenever the tracker loses the target.
+    """
+
+    def __init__(
+        self,
+        min_interval: int = 1,
+        max_interval: int = 8,
+        min_confidence: float = 0.5,
+        max_error: float = 20.0,
+    ) -> None:
+        """
+        Initializes the detect-then-track scheduler.
+
+        Args:
+            min_interval (int, optional): Minimum number of frames between detector runs. Defaults to 1.
+            max_interval (int, optional): Maximum number of frames between detector runs. Defaults to 8.
+            min_confidence (float, optional): Tracker confidence below which the detector runs. Defaults to 0.5.
+            max_error (float, optional): Allowed center error between tracker and detector (pixels).
+                                         Defaults to 20.0.
+        """
+        self.min_interval: int = min_interval
+        self.max_interval: int = max_interval
+        self.min_confidence: float = min_confidence
+        self.max_error: float = max_error
+
+        self.tracker = FlowTracker()
+        self.interval: int = min_interval  # Current number of frames between detector runs
+        self._frames_since_detect: int = 0
+        self._target: Optional[Object] = None  # Last detected target (id and score)
+
+        # Statistics
+        self.detector_runs: int = 0  # Frames processed by the detector
+        self.tracker_runs: int = 0  # Frames processed by the tracker only
+
+    def reset(self) -> None:
+        """
+        Drops the current target so the next frame runs the detector.
+        """
+        self._target = None
+        self.interval = self.min_interval
+        self._frames_since_detect = 0
+
+    def update(self, image: np.ndarray, detect: Callable[[np.ndarray], List[Object]]) -> List[Object]:
+        """
+        Returns the target objects in a frame, running the detector only when needed.
+
+        Args:
+            image (np.ndarray): The current frame.
+            detect (Callable[[np.ndarray], List[Object]]): The full detector, returning target objects.
+
+        Returns:
+            List[Object]: The detected or tracked target objects.
+        """
+        if self._target is not None and self._frames_since_detect < self.interval:
+            bbox, confidence = self.tracker.update(image)
+            if bbox is not None and confidence >= self.min_confidence:
+                self._frames_since_detect += 1
+                self.tracker_runs += 1
+                score = self._target.score * confidence
+                return [Object(self._target.id, score, bbox.map(int))]
+
+        return self._detect(image, detect)
+
+    def _detect(self, image: np.ndarray, detect: Callable[[np.ndarray], List[Object]]) -> List[Object]:
+        """
+        Runs the detector, adapts the detection interval and restarts the tracker.
+        """
+        objects = detect(image)
+        self.detector_runs += 1
+        self._frames_since_detect = 0
+
+        if not objects:
+            self.reset()
+            return objects
+
+        target = objects[0]
+        if self._target is not None and self.tracker.bbox is not None:
+            # Compare the tracker's estimate with the detection to adapt the interval
+            tracked, detected = self.tracker.bbox, target.bbox
+            error = np.hypot(
+                (tracked.xmin + tracked.xmax - detected.xmin - detected.xmax) / 2.0,
+                (tracked.ymin + tracked.ymax - detected.ymin - detected.ymax) / 2.0,
+            )
+            if error <= self.max_error and self.tracker.confidence >= self.min_confidence:
+                self.interval = min(self.interval + 1, self.max_interval)
+            else:
+                self.interval = max(self.interval // 2, self.min_interval)
+        elif self._target is not None:
+            self.interval = max(self.interval // 2, self.min_interval)  # Tracker lost the target
+
+        self._target = target if self.tracker.init(image, target.bbox) else None
+        return objects
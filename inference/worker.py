@@ -0,0 +1,210 @@
+import logging
+import math
+import threading
+import time
+import weakref
+from typing import Callable, List, NamedTuple, Optional
+
+import numpy as np
+
+import utils.clock as clock
+from hardware.camera import Frame
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Minimum time (seconds) between logged task failures, so a failing model doesn't flood the log
+FAILURE_LOG_INTERVAL: float = 10.0
+
+
+class Detections(NamedTuple):
+    """
+    Result of running a detection task on a single camera frame.
+    """
+
+    objects: list  # Detected objects, in the detector's output format
+    timestamp: float  # Capture time of the source frame on the process clock (seconds)
+    seq: int  # Sequence number of the source frame
+    latency: float  # Time spent running the detection task (seconds)
+
+    @property
+    def age(self) -> float:
+        """Returns the time elapsed since the source frame was captured (seconds)."""
+        return clock.monotonic() - self.timestamp
+
+
+# Placeholder published before the first detection has completed
+NO_DETECTIONS = Detections([], 0.0, -1, 0.0)
+
+
+class InferenceWorker:
+    """
+    Runs a detection task on its own thread, decoupled from the control loop.
+
+    Frames are submitted by the control loop and copied into a preallocated pending
+    buffer; if the worker is still busy, a newer frame replaces the pending one so
+    the detector always runs on the freshest frame. The latest result is published
+    with the capture timestamp of its source frame. A task raising an exception is
+    counted and logged, and the worker carries on with the next frame.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the worker without a task.
+        """
+        # Double buffer: the pending frame and the frame being processed
+        self._pending: Optional[np.ndarray] = None
+        self._active: Optional[np.ndarray] = None
+        self._pending_frame: Optional[Frame] = None
+
+        # Current task (held weakly so controllers can be released on switch)
+        self._task: Optional[weakref.WeakMethod] = None
+        self._result: Detections = NO_DETECTIONS
+
+        # Statistics
+        self.frames_processed: int = 0  # Frames the task ran on
+        self.frames_skipped: int = 0  # Submitted frames replaced before being processed
+        self.failures: int = 0  # Task runs that raised an exception
+        self._processed = metrics.counter('inference.frames_processed')
+        self._skipped = metrics.counter('inference.frames_skipped')
+        self._failures = metrics.counter('inference.failures')
+        self._failure_logged: float = -math.inf  # Time the last failure was logged
+
+        # Threading primitives
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __del__(self) -> None:
+        """
+        Stops the worker thread when the object is deleted.
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Starts the worker thread.
+        """
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="inference", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the worker thread and waits for it to exit.
+        """
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def set_task(self, task: Optional[Callable[[Frame], List]]) -> None:
+        """
+        Sets the detection task and discards results produced by the previous one.
+
+        Args:
+            task (Optional[Callable[[Frame], List]]): Bound method mapping a frame to a list of
+                                                      objects, or None to idle. The frame it gets
+                                                      carries the worker's copy of the pixels.
+        """
+        with self._cond:
+            self._task = weakref.WeakMethod(task) if task is not None else None
+            self._result = NO_DETECTIONS
+            self._cond.notify_all()
+
+    def submit(self, frame: Frame) -> None:
+        """
+        Queues a frame for detection, replacing any frame still waiting to be processed.
+
+        Args:
+            frame (Frame): The captured frame. Its pixels are copied, so the caller may
+                           draw on the image afterwards.
+        """
+        if not frame.ok or self._task is None:
+            return
+
+        with self._cond:
+            if self._pending is None or self._pending.shape != frame.image.shape:
+                self._pending = np.empty_like(frame.image)
+
+            if self._pending_frame is not None:
+                self.frames_skipped += 1  # The previous pending frame was never processed
+                self._skipped.inc()
+
+            np.copyto(self._pending, frame.image)
+            self._pending_frame = frame
+            self._cond.notify_all()
+
+    def latest(self) -> Detections:
+        """
+        Returns the most recently published detection result.
+        """
+        return self._result
+
+    def _run(self) -> None:
+        """
+        Waits for submitted frames and runs the current task on them.
+        """
+        while not self._stop.is_set():
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending_frame is not None or self._stop.is_set())
+                if self._stop.is_set():
+                    return
+
+                # Swap the pending buffer in for processing
+                self._pending, self._active = self._active, self._pending
+                frame = self._pending_frame
+                self._pending_frame = None
+                task_ref = self._task
+
+            task = task_ref() if task_ref is not None else None
+            if task is None:
+                continue
+
+            try:
+                start_time = time.monotonic()
+                objects = task(frame._replace(image=self._active))
+                latency = time.monotonic() - start_time
+            except Exception:
+                self._failed("Detection task")
+                continue  # A single bad frame or model run must not stop detection for good
+            finally:
+                del task  # Don't keep the controller alive between frames
+
+            with self._cond:
+                if self._task is task_ref:  # Drop results of a task replaced meanwhile
+                    self._publish(frame, objects, latency)
+                    self.frames_processed += 1
+                    self._processed.inc()
+
+    def _failed(self, task: str) -> None:
+        """
+        Counts and logs a task run that raised an exception (call from the exception handler).
+
+        Args:
+            task (str): Description of the task, for the log.
+        """
+        self.failures += 1
+        self._failures.inc()
+
+        now = time.monotonic()
+        if now - self._failure_logged >= FAILURE_LOG_INTERVAL:
+            self._failure_logged = now
+            logger.exception("%s failed (%d failures so far)", task, self.failures)
+
+    def _publish(self, frame: Frame, objects: list, latency: float) -> None:
+        """
+        Publishes the result of the task on a frame (called with the lock held).
+
+        Args:
+            frame (Frame): The source frame.
+            objects (list): The task's result.
+            latency (float): Time spent running the task (seconds).
+        """
+        self._result = Detections(objects, frame.timestamp, frame.seq, latency)
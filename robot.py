@@ -1,17 +1,19 @@
-import cv2
-from adafruit_servokit import ServoKit
-
 # Local imports
 from supervisor import Supervisor
+from hardware.backend import PiBackend
 from hardware.pan_tilt import PanTilt
-from hardware.motor import Motor
 from hardware.drive import FourWheelDiffDrive
-from hardware.display import Display
+from inference.backend import NUM_THREADS, InferenceBackend
+from inference.registry import registry
+from utils.odometry import Odometry
 
 # Camera and frame capture settings
+# (controller gains and the ROI and tracker limits are in pixels, tuned at this size)
 CAMERA_ID: int = 0
 CAPTURE_WIDTH: int = 640
 CAPTURE_HEIGHT: int = 480
+MAX_FRAME_AGE: float = 0.1  # Frames older than this (seconds) are treated as missing
+FIRST_FRAME_TIMEOUT: float = 2.0  # Time to wait for the camera to deliver its first frame (seconds)
 
 # Motor pin configurations (enable, in1, in2)
 LB_MOTOR_PINS: tuple[int, int, int] = (17, 27, 22)
@@ -27,36 +29,85 @@ WHEEL_TRACK: float = 0.136  # Distance between wheels in meters
 class Robot:
     """A self-driving robot that uses computer vision to track and follow people."""
 
-    def __init__(self) -> None:
-        """Initializes the robot's hardware, camera, and control systems."""
+    def __init__(
+        self,
+        backend=None,
+        tracking: bool = False,
+        roi: bool = False,
+        predict: bool = False,
+        scan_pause: bool = False,
+        gui: bool = True,
+        multi_model: bool = False,
+        camera_id: int = CAMERA_ID,
+        frame_width: int = CAPTURE_WIDTH,
+        frame_height: int = CAPTURE_HEIGHT,
+        num_threads: int = NUM_THREADS,
+        use_edgetpu: bool = True,
+    ) -> None:
+        """
+        Initializes the robot's hardware, camera, and control systems.
+
+        Args:
+            backend (optional): Hardware backend creating motors, servos, display and camera.
+                                Defaults to `PiBackend` (the real robot); see `hardware.sim.SimBackend`.
+            tracking (bool, optional): Track targets between detector runs. Defaults to False.
+            roi (bool, optional): Detect around the last known target before the full frame. Defaults to False.
+            predict (bool, optional): Compensate the camera's motion during detection latency. Defaults to False.
+            scan_pause (bool, optional): Pause at heading intervals while scanning for an object. Defaults to False.
+            gui (bool, optional): Show the camera feed in a window. Defaults to True.
+            multi_model (bool, optional): Run all detection models on every frame in the background.
+                                          Defaults to False.
+            camera_id (int, optional): ID of the camera to use. Defaults to `CAMERA_ID`.
+            frame_width (int, optional): Requested capture width. Defaults to `CAPTURE_WIDTH`.
+            frame_height (int, optional): Requested capture height. Defaults to `CAPTURE_HEIGHT`.
+            num_threads (int, optional): CPU threads for inference without an EdgeTPU. Defaults to `NUM_THREADS`.
+            use_edgetpu (bool, optional): Run models on the EdgeTPU if one is present. Defaults to True.
+        """
+        # Inference device (EdgeTPU, or CPU as a fallback)
+        self.inference = InferenceBackend(num_threads=num_threads, use_edgetpu=use_edgetpu)
+        registry.set_backend(self.inference)
+
+        # Hardware backend (real or simulated, may replace the detectors)
+        self.backend = backend if backend is not None else PiBackend()
+        self.backend.prepare()
+
         # Store robot dimensions
         self.wheel_radius: float = WHEEL_RADIUS
         self.wheel_track: float = WHEEL_TRACK
 
         # Initialize motors
-        self.lf_motor = Motor(LF_MOTOR_PINS)
-        self.rf_motor = Motor(RF_MOTOR_PINS)
-        self.lb_motor = Motor(LB_MOTOR_PINS)
-        self.rb_motor = Motor(RB_MOTOR_PINS)
+        self.lf_motor = self.backend.motor(LF_MOTOR_PINS)
+        self.rf_motor = self.backend.motor(RF_MOTOR_PINS)
+        self.lb_motor = self.backend.motor(LB_MOTOR_PINS)
+        self.rb_motor = self.backend.motor(RB_MOTOR_PINS)
 
         # Differential drive system
         self.drive = FourWheelDiffDrive(self)
 
+        # Dead-reckoning pose estimate from the applied wheel speeds (updated by the supervisor)
+        self.odometry = Odometry(self.drive.wheel_speeds, self.wheel_radius, self.wheel_track)
+
         # Servo control for pan-tilt system
-        self.servo_kit = ServoKit(channels=16, frequency=50)
+        self.servo_kit = self.backend.servo_kit()
         self.pan_tilt = PanTilt(self)
 
         # Display setup (for status/output)
-        self.display = Display()
+        self.display = self.backend.display()
 
         # Initialize camera for image capture
-        self.camera_id: int = CAMERA_ID
-        self.cap = cv2.VideoCapture(self.camera_id)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAPTURE_WIDTH)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAPTURE_HEIGHT)
+        # (with a background frame grabber that keeps the control loop off camera I/O)
+        self.camera_id: int = camera_id
+        self.cap, self.camera = self.backend.camera(self.camera_id, frame_width, frame_height, MAX_FRAME_AGE)
+        self.camera.wait_ready(timeout=FIRST_FRAME_TIMEOUT)  # Controllers need the frame size
+
+        # Let the backend hook into the assembled hardware
+        self.backend.attach(self)
 
         # Supervisor (handles AI-based decision-making)
-        self.supervisor = Supervisor(self)
+        self.supervisor = Supervisor(
+            self, tracking=tracking, roi=roi, predict=predict, scan_pause=scan_pause,
+            gui=gui, multi_model=multi_model,
+        )
 
         # Initial movement states
         self.pan: float = 0.0  # Horizontal pan angle
@@ -75,8 +126,11 @@ class Robot:
         # Release pan-tilt system
         del self.pan_tilt
 
-        # Release camera resources
-        self.cap.release()
+        # Stop the display writer
+        self.display.stop()
+
+        # Stop the frame grabber and release camera resources
+        self.camera.release()
 
     def update(self) -> None:
         """Updates the robot's subsystems, including pan-tilt and driving."""
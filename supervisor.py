@@ -2,33 +2,113 @@ import cv2
 import sys
 import threading
 import time
-
-from aiymakerkit import audio
+from contextlib import contextmanager
+from typing import Optional
 
 # Local imports
 import data.models as models
+import utils.clock as clock
+from hardware.camera import NO_FRAME
+from inference.multi import MultiModelWorker, detection_task
+from inference.registry import registry
+from inference.worker import Detections, InferenceWorker, NO_DETECTIONS
+from utils.metrics import metrics
+from utils.scheduler import Scheduler
 from controllers.standby_controller import StandbyController
 from controllers.pan_tilt_controller import PanTiltController
 from controllers.track_controller import TrackController
+from controllers.pose_track_controller import PoseTrackController
 from controllers.find_object_controller import FindObjectController
 from controllers.drive_test_controller import DriveTestController
 
 # Voice command configuration
 VOICE_CONFIDENCE_SCORE: float = 0.5
-SUPPORTED_COMMANDS: tuple[str, ...] = ('wait', 'drive', 'track', 'find', 'goodbye')
+SUPPORTED_COMMANDS: tuple[str, ...] = ('wait', 'drive', 'track', 'follow', 'find', 'goodbye')
+
+# Detection models loaded at startup
+PRELOADED_MODELS: tuple[str, ...] = (models.FACE_DETECTION_MODEL, models.OBJECT_DETECTION_MODEL)
+
+# Task rates of the main loop
+CONTROL_RATE_HZ: float = 100.0  # Controllers and actuation (pan/tilt servos and drive motors)
+ODOMETRY_RATE_HZ: float = 200.0  # Dead-reckoning pose integration
+VISION_RATE_HZ: float = 30.0  # Frame capture, if the camera does not report its frame rate
+DISPLAY_RATE_HZ: float = 2.0  # OLED status display
+STATUS_RATE_HZ: float = 1.0  # Status messages
+
+# Inference settings
+MAX_DETECTION_AGE: float = 0.5  # Detections older than this (seconds) are ignored by controllers
 
 
 class Supervisor:
     """Manages the high-level behavior of the robot, handling vision, control, and commands."""
 
-    def __init__(self, robot) -> None:
+    def __init__(
+        self,
+        robot,
+        tracking: bool = False,
+        roi: bool = False,
+        predict: bool = False,
+        scan_pause: bool = False,
+        gui: bool = True,
+        multi_model: bool = False,
+    ) -> None:
         """
         Initializes the Supervisor, which oversees robot control and state management.
 
         Args:
             robot: The robot instance to be supervised.
+            tracking (bool, optional): Let tracking controllers run the detector only every few frames
+                                       and track the target in between. Defaults to False.
+            roi (bool, optional): Let tracking controllers run the detector on a window around the
+                                  last known target first. Defaults to False.
+            predict (bool, optional): Let tracking controllers project detections into the current
+                                      camera view, compensating the robot's and gimbal's motion since
+                                      the frame was captured. Defaults to False.
+            scan_pause (bool, optional): Let the find controller turn in steps, pausing briefly at each
+                                         heading to capture sharp frames. Defaults to False.
+            gui (bool, optional): Show the camera feed in a window. Without it the loop runs
+                                  headless and skips all drawing unless a preview client
+                                  is watching. Defaults to True.
+            multi_model (bool, optional): Run all preloaded detection models on every frame in the
+                                          background, so controllers read the latest result of their
+                                          model instead of running it. Excludes `tracking` and `roi`,
+                                          which change how the controllers run their model. Defaults
+                                          to False.
+
+        Raises:
+            ValueError: If `multi_model` is combined with `tracking` or `roi`.
         """
+        if multi_model and (tracking or roi):
+            raise ValueError("Multi-model mode runs the detectors on full frames and can't track or use a ROI")
+
         self.robot = robot
+        self.tracking: bool = tracking
+        self.roi: bool = roi
+        self.predict: bool = predict
+        self.scan_pause: bool = scan_pause
+        self.gui: bool = gui
+
+        # Optional MJPEG preview stream (see `utils.preview.PreviewServer`)
+        self.preview = None
+        self.overlay: bool = gui  # Whether the current frame is annotated (controllers draw boxes)
+
+        # Optional per-stage latency profiler (see `utils.profiling.StageProfiler`)
+        self.profiler = None
+
+        # Optional log of frames, detections, commands and actuator state (see `utils.recorder.Recorder`)
+        self._recorder = None
+
+        # Always-on metrics (see `utils.metrics`)
+        self._detection_misses = metrics.counter('detection_misses')
+        self._detections_expired = metrics.counter('detections_expired')
+        self._expired_seq: int = -1  # Frame of the last result counted as expired
+
+        # Multi-rate main loop (see `build_scheduler`) and vision rate bookkeeping for the status
+        self.scheduler: Optional[Scheduler] = None
+        self._frames_seen: int = 0
+        self._status_frames: int = 0
+        self._status_time: float = clock.monotonic()
+        self._overlay_seq: int = -1  # Frame last handed to the overlay
 
         # Threading locks and shutdown flag
         self._lock = threading.RLock()
@@ -42,10 +122,24 @@ class Supervisor:
         self._command: str = 'wait'
         self._target_object: str = ''
 
+        # Load the detection models up front so controller switches don't pay for it
+        registry.preload(*PRELOADED_MODELS)
+
+        # Asynchronous inference stage (started with the main loop, see `build_scheduler`)
+        self.inference: Optional[InferenceWorker] = None
+        self.detections = NO_DETECTIONS  # Detections consumed by the current controller
+
+        # Background stage running all preloaded models (multi-model mode only)
+        self.models: Optional[MultiModelWorker] = None
+        if multi_model:
+            self.models = MultiModelWorker({model: detection_task(model) for model in PRELOADED_MODELS})
+            self.models.start()
+
         # Controller for handling robot behavior
         self._current_controller = StandbyController(self)
 
         # Initialize vision system
+        self.frame = NO_FRAME
         self._update_vision()
 
         # Status messages for display/debugging
@@ -53,8 +147,21 @@ class Supervisor:
             'command': f'Command: {self.command}',
             'target_object': f'Target: {self.target_object}',
             'controller': f'Controller: {self.current_controller.name}',
+            'rate': 'Vision: - fps',
         }
 
+    @property
+    def recorder(self):
+        """Gets the attached recorder (None if not recording)."""
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder) -> None:
+        """Attaches a recorder and logs the current command as its starting point."""
+        self._recorder = recorder
+        if recorder is not None:
+            recorder.command(self.frame.seq, self.command, self.target_object)
+
     @property
     def command(self) -> str:
         """Gets the current command."""
@@ -66,6 +173,8 @@ class Supervisor:
         with self._lock:
             self._command = new_command
         self.status_msg['command'] = f'Command: {self.command}'
+        if self._recorder is not None:
+            self._recorder.command(self.frame.seq, self.command, self.target_object)
 
     @property
     def target_object(self) -> str:
@@ -78,6 +187,8 @@ class Supervisor:
         with self._lock:
             self._target_object = new_target_object
         self.status_msg['target_object'] = f'Target: {self.target_object}'
+        if self._recorder is not None:
+            self._recorder.command(self.frame.seq, self.command, self.target_object)
 
     @property
     def current_controller(self):
@@ -87,14 +198,84 @@ class Supervisor:
     @current_controller.setter
     def current_controller(self, new_controller) -> None:
         """Sets a new controller and updates the status message."""
+        if self.inference is not None:
+            # Detach the old controller's task so its detections are not consumed by the new one
+            self.inference.set_task(self._detection_task(new_controller))
+
         del self._current_controller
         self._current_controller = new_controller
+        self.detections = NO_DETECTIONS  # Don't hand the old controller's detections to the new one
         self.status_msg['controller'] = f'Controller: {self.current_controller.name}'
 
-    def _update_state(self) -> None:
-        """Updates the robot's state, including vision and controller selection."""
-        self._update_vision()  # Update vision system
+    def _reads_models(self, controller) -> bool:
+        """
+        Checks whether a controller takes its detections from the multi-model stage.
+
+        Controllers whose model runs in the stage do, unless they opt out with a false
+        `shared_detections` attribute because their task needs the frames themselves.
+
+        Args:
+            controller: The controller.
+
+        Returns:
+            bool: True if the controller reads the stage's results instead of running its own task.
+        """
+        return (
+            self.models is not None
+            and getattr(controller, 'shared_detections', True)
+            and getattr(controller, 'model', None) in self.models.tasks
+        )
+
+    def _detection_task(self, controller):
+        """
+        Returns the task the inference worker runs for a controller.
+
+        Controllers reading the multi-model stage need no task of their own.
 
+        Args:
+            controller: The controller.
+
+        Returns:
+            The controller's detection task, or None if it has none.
+        """
+        if self._reads_models(controller):
+            return None
+        return getattr(controller, 'detect', None)
+
+    def _start_inference(self) -> None:
+        """Starts the asynchronous inference stage, running the current controller's task."""
+        self.inference = InferenceWorker()
+        self.inference.start()
+        self.inference.set_task(self._detection_task(self.current_controller))
+
+    @contextmanager
+    def _measure(self, stage: str):
+        """
+        Times a loop stage into its metrics histogram (and the profiler, if attached).
+
+        Args:
+            stage (str): Name of the stage.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(stage, time.perf_counter() - start_time)
+
+    def _record(self, stage: str, seconds: float) -> None:
+        """
+        Records the duration of a loop stage.
+
+        Args:
+            stage (str): Name of the stage.
+            seconds (float): Measured duration (in seconds).
+        """
+        metrics.observe(stage, seconds)
+        if self.profiler is not None:
+            self.profiler.record(stage, seconds)
+
+    def _update_state(self) -> None:
+        """Updates the robot's state, including controller selection."""
         with self._lock:
             curr_command = self.command
 
@@ -109,6 +290,8 @@ class Supervisor:
             self.current_controller = PanTiltController(self)
         elif curr_command == 'track' and curr_type != TrackController:
             self.current_controller = TrackController(self)
+        elif curr_command == 'follow' and curr_type != PoseTrackController:
+            self.current_controller = PoseTrackController(self)
         elif curr_command == 'find':
             if curr_type != FindObjectController:
                 self.current_controller = FindObjectController(self)
@@ -118,12 +301,92 @@ class Supervisor:
         elif curr_command == 'drive' and curr_type != DriveTestController:
             self.current_controller = DriveTestController(self)
 
-    def _update_vision(self) -> None:
-        """Captures an image from the robot's camera and updates the vision status."""
-        if self.robot.cap.isOpened():
-            self.has_vision, self.image = self.robot.cap.read()
-        else:
-            self.has_vision = False
+    def _update_vision(self, timeout: Optional[float] = None) -> bool:
+        """
+        Fetches the newest camera frame and updates the vision status.
+
+        Args:
+            timeout (Optional[float], optional): Maximum time to wait for a new frame (in seconds).
+                                                 Defaults to None: up to the camera's maximum frame age.
+
+        Returns:
+            bool: True if a new frame arrived.
+        """
+        if self.robot.camera.isOpened():
+            frame = self.robot.camera.latest(timeout=timeout)
+            self.has_vision = frame.ok and frame.age <= self.robot.camera.max_age
+            self.image = frame.image
+
+            is_new = frame.seq != self.frame.seq
+            if is_new:
+                self._frames_seen += 1
+                if self.inference is not None:
+                    self.inference.submit(frame)  # Hand the new frame to the detector
+                if self.models is not None and self._detection_task(self.current_controller) is None:
+                    self.models.submit(frame)  # Paused while the controller runs a model of its own
+                if self._recorder is not None:
+                    self._recorder.frame(frame)
+
+            self.frame = frame  # Capture timestamp and sequence number
+            return is_new
+
+        self.has_vision = False
+        self.frame = NO_FRAME
+        return False
+
+    def get_objects(self, detect, select=None) -> list:
+        """
+        Returns the objects detected for the current controller.
+
+        This is the latest result the inference worker published for the controller's detection
+        task, which it runs on each new frame. In multi-model mode the latest result of the
+        controller's model is taken from the background stage and narrowed down with `select`
+        (see `_reads_models`).
+
+        Args:
+            detect: The controller's detection task, mapping a `Frame` to a list of objects (run
+                    by the inference worker).
+            select (optional): Function picking the controller's targets from all of the model's
+                               objects (multi-model mode). Defaults to None (keep all).
+
+        Returns:
+            list: The detected objects.
+        """
+        if self._reads_models(self.current_controller):
+            detections = self.models.latest(self.current_controller.model)
+            if detections.seq >= 0 and select is not None:
+                detections = detections._replace(objects=select(detections.objects))
+            return self._consume(detections)
+
+        if self.inference is None:
+            return []  # Main loop not started yet
+
+        return self._consume(self.inference.latest())
+
+    def _consume(self, detections: Detections) -> list:
+        """
+        Hands a result published by a background stage to the current controller.
+
+        Args:
+            detections (Detections): The latest published result.
+
+        Returns:
+            list: The detected objects (empty if the result is too old to steer by).
+        """
+        if detections.seq != self.detections.seq and detections.seq >= 0:
+            self._record('inference', detections.latency)  # New result from the worker
+            if not detections.objects:
+                self._detection_misses.inc()
+            if self._recorder is not None:
+                self._recorder.detections(detections)
+        self.detections = detections
+        if self.detections.age > MAX_DETECTION_AGE:
+            if detections.seq != self._expired_seq:  # Count each result once, however often it is read
+                self._expired_seq = detections.seq
+                self._detections_expired.inc()
+            return []  # Too old to steer by
+
+        return self.detections.objects
 
     def _update_robot(self) -> None:
         """Updates the robot's motion state based on supervisor control."""
@@ -133,11 +396,21 @@ class Supervisor:
             self.robot.v = self.v
             self.robot.omega = self.omega
 
+        if self._recorder is not None:
+            self._recorder.state(self.frame.seq, self.pan, self.tilt, self.v, self.omega)
+
         self.robot.update()  # Apply changes
 
-    def _update_display(self) -> None:
-        """Updates the robot's display with status messages and camera feed."""
-        if self.has_vision:
+    def _begin_overlay(self) -> None:
+        """Decides whether the current frame gets annotated, i.e. whether anyone will see it."""
+        self.overlay = self.gui or (self.preview is not None and self.preview.wants_frame())
+
+    def _update_overlay(self) -> None:
+        """Draws the status messages onto the camera feed and shows it in the GUI window and preview."""
+        if not (self.overlay and self.has_vision):
+            return
+
+        with self._measure('overlay'):
             line_height = 15
             for i, key in enumerate(self.status_msg.keys()):
                 cv2.putText(
@@ -150,27 +423,114 @@ class Supervisor:
                     1,
                 )
 
-            cv2.imshow('robot_vision', self.image)
-            self.robot.display.update(self.status_msg)
+            if self.gui:
+                cv2.imshow('robot_vision', self.image)
+            if self.preview is not None:
+                self.preview.publish(self.image)
 
-    def main(self) -> None:
-        """Main loop for the Supervisor, handling state updates and control execution."""
-        while not self.shutdown.is_set():
+    def _update_display(self) -> None:
+        """Updates the robot's display with the status messages."""
+        if self.has_vision:
+            with self._measure('display'):
+                self.robot.display.update(self.status_msg)
+
+    def _update_status(self) -> None:
+        """Updates the status message showing the rate at which frames are processed."""
+        now = clock.monotonic()
+        elapsed = now - self._status_time
+        if elapsed > 0:
+            fps = (self._frames_seen - self._status_frames) / elapsed
+            self.status_msg['rate'] = f'Vision: {fps:.0f} fps'
+        self._status_frames = self._frames_seen
+        self._status_time = now
+
+    def _capture_task(self) -> None:
+        """Scheduler task: fetches the newest camera frame and hands it to the inference worker."""
+        with self._measure('capture'):
+            self._update_vision(timeout=0)  # Never block the other tasks on the camera
+
+        if self.gui and cv2.waitKey(1) == 27:  # ESC key pressed
+            self.shutdown.set()
+
+    def _control_task(self) -> None:
+        """
+        Scheduler task: updates the current controller from the latest detections.
+
+        Controllers run at the control rate, between camera frames too, so their setpoints
+        follow the robot's motion (see `predict`) rather than the camera. Each frame is
+        annotated and shown once, by the first update after it arrived.
+        """
+        with self._measure('state'):
             self._update_state()  # Update state
+
+        new_frame = self.frame.seq != self._overlay_seq
+        if new_frame:
+            self._overlay_seq = self.frame.seq
+            self._begin_overlay()
+        else:
+            self.overlay = False  # Already shown, don't draw onto it again
+
+        with self._measure('control'):
             self.current_controller.update()  # Apply the current controller
-            self._update_display()  # Update display output
-            self._update_robot()  # Apply robot updates
 
-            if cv2.waitKey(1) == 27:  # ESC key pressed
-                break
+        if new_frame:
+            self._update_overlay()
+
+    def _actuation_task(self) -> None:
+        """Scheduler task: applies the current motion commands to the hardware."""
+        with self._measure('actuation'):
+            self._update_robot()
+
+    def _odometry_task(self) -> None:
+        """Scheduler task: integrates the robot's pose from the applied wheel speeds."""
+        self.robot.odometry.update()
+
+    def build_scheduler(self) -> Scheduler:
+        """
+        Starts the inference worker and sets up the tasks of the main loop.
+
+        Control and actuation run at `CONTROL_RATE_HZ`, odometry at `ODOMETRY_RATE_HZ`, capture
+        at the camera frame rate, the OLED display at `DISPLAY_RATE_HZ` and the status messages
+        at `STATUS_RATE_HZ`. Detection always runs on the inference worker, so no task waits
+        for a model. Used by `main`, and by benchmarks to drive the same loop step by step.
+
+        Returns:
+            Scheduler: The main loop, not started yet.
+        """
+        vision_rate = getattr(self.robot.camera, 'fps', 0.0) or VISION_RATE_HZ
+        if self.inference is None:
+            self._start_inference()
+
+        self.scheduler = Scheduler()
+        self.scheduler.add('control', self._control_task, CONTROL_RATE_HZ)
+        self.scheduler.add('actuation', self._actuation_task, CONTROL_RATE_HZ)
+        self.scheduler.add('odometry', self._odometry_task, ODOMETRY_RATE_HZ)
+        self.scheduler.add('capture', self._capture_task, vision_rate)
+        self.scheduler.add('display', self._update_display, DISPLAY_RATE_HZ)
+        self.scheduler.add('status', self._update_status, STATUS_RATE_HZ)
+        return self.scheduler
+
+    def main(self) -> None:
+        """
+        Main loop for the Supervisor, running each stage at its own rate until shutdown
+        (see `build_scheduler`).
+        """
+        self.build_scheduler().run(self.shutdown)
 
         # Cleanup
-        cv2.destroyAllWindows()
+        if self.inference is not None:
+            self.inference.stop()
+        if self.models is not None:
+            self.models.stop()
+        if self.gui:
+            cv2.destroyAllWindows()
         del self.robot
         sys.exit(1)
 
     def listen_audio(self) -> None:
         """Starts listening for voice commands using an AI-based audio classifier."""
+        from aiymakerkit import audio  # Robot-only dependency, imported when listening
+
         audio.classify_audio(model=models.AUDIO_CLASSIFICATION_MODEL, callback=self.voice_input)
 
     def voice_input(self, label: str, score: float) -> bool:
@@ -2,6 +2,10 @@
 
 import argparse
 from robot import Robot
+from hardware.sim import SimBackend
+from utils.metrics import MetricsServer, SnapshotWriter
+from utils.preview import PreviewServer
+from utils.recorder import Recorder
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -24,7 +28,7 @@ def parse_arguments() -> argparse.Namespace:
     )
     parser.add_argument(
         '--frameWidth',
-        help='Width of the frame to capture from the camera.',
+        help='Width of the frame to capture from the camera (controller gains are tuned at 640x480).',
         type=int,
         default=640
     )
@@ -36,29 +40,142 @@ def parse_arguments() -> argparse.Namespace:
     )
     parser.add_argument(
         '--numThreads',
-        help='Number of CPU threads to use for model inference.',
+        help='Number of CPU threads to use for model inference without an EdgeTPU.',
         type=int,
         default=4
     )
     parser.add_argument(
         '--enableEdgeTPU',
-        help='Enable EdgeTPU acceleration for AI inference.',
+        help='Run models on the EdgeTPU if one is present (otherwise on the CPU).',
+        action=argparse.BooleanOptionalAction,
+        default=True
+    )
+    parser.add_argument(
+        '--tracking',
+        help='Run the detector only every few frames and track the target in between.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--multiModel',
+        help='Run the face and object detectors on every frame in the background (no model swaps; '
+             'not with --tracking or --roi).',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--roi',
+        help='Run the detector on a window around the last known target before the full frame.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--predict',
+        help='Project detections into the current camera view, compensating motion during inference latency.',
         action='store_true'
     )
+    parser.add_argument(
+        '--scanPause',
+        help='While searching for an object, turn in steps and pause at each heading to capture sharp frames.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--headless',
+        help='Run without the camera window and skip all drawing unless a preview client is watching.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--previewPort',
+        help='Stream the annotated camera feed as MJPEG on this port of the loopback interface (0 disables).',
+        type=int,
+        default=0
+    )
+    parser.add_argument(
+        '--simulate',
+        help='Run on simulated hardware with a virtual clock instead of the robot.',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--video',
+        help='Video file or recorder log played back as the camera in simulation (default: synthetic scene).',
+        type=str,
+        default=None
+    )
+    parser.add_argument(
+        '--lockstep',
+        help='In simulation, deliver every camera frame exactly once (deterministic replay).',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--record',
+        help='Record frames, detections, commands and actuator state to this log file.',
+        type=str,
+        default=None
+    )
+    parser.add_argument(
+        '--metricsPort',
+        help='Serve metrics as JSON on this port of the loopback interface (0 disables).',
+        type=int,
+        default=0
+    )
+    parser.add_argument(
+        '--metricsFile',
+        help='Periodically write a metrics snapshot to this JSON file.',
+        type=str,
+        default=None
+    )
+
+    args = parser.parse_args()
 
-    return parser.parse_args()
+    # The shared detections are computed on full frames, independently of the controllers
+    if args.multiModel and (args.tracking or args.roi):
+        parser.error('--multiModel cannot be combined with --tracking or --roi')
+
+    return args
 
 
 def main() -> None:
     """Initializes the robot and starts execution."""
     args = parse_arguments()
 
-    # Create a Robot instance
-    r2 = Robot()
+    # Create a Robot instance on real or simulated hardware
+    backend = SimBackend(video=args.video, lockstep=args.lockstep) if args.simulate else None
+    r2 = Robot(
+        backend=backend,
+        tracking=args.tracking,
+        roi=args.roi,
+        predict=args.predict,
+        scan_pause=args.scanPause,
+        gui=not args.headless,
+        multi_model=args.multiModel,
+        camera_id=args.cameraId,
+        frame_width=args.frameWidth,
+        frame_height=args.frameHeight,
+        num_threads=args.numThreads,
+        use_edgetpu=args.enableEdgeTPU,
+    )
+
+    # Expose the always-on metrics
+    server = MetricsServer(args.metricsPort) if args.metricsPort else None
+    writer = SnapshotWriter(args.metricsFile) if args.metricsFile else None
+    preview = PreviewServer(args.previewPort) if args.previewPort else None
+    r2.supervisor.preview = preview
+    for exporter in (server, writer, preview):
+        if exporter is not None:
+            exporter.start()
+
+    # Record the session for later replay
+    recorder = Recorder(args.record) if args.record else None
+    if recorder is not None:
+        recorder.start()
+        r2.supervisor.recorder = recorder
 
     # Start the robot supervisor loop
     r2.supervisor.execute()
 
+    if recorder is not None:
+        recorder.stop()
+    for exporter in (server, writer, preview):
+        if exporter is not None:
+            exporter.stop()
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
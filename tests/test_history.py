@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+
+from utils.history import History
+
+
+def test_empty():
+    history = History(capacity=4)
+    assert len(history) == 0
+    assert history.latest() is None
+    assert history.at(1.0) is None
+
+
+def test_wraparound_keeps_newest_samples():
+    history = History(capacity=4)
+    for t in range(10):
+        history.append(float(t), 10.0 * t)
+
+    assert len(history) == 4
+    timestamp, values = history.latest()
+    assert timestamp == 9.0
+    np.testing.assert_allclose(values, [90.0])
+
+    # Samples 6 to 9 remain, still ordered and interpolated across the ring seam
+    for t in np.arange(6.0, 9.01, 0.25):
+        np.testing.assert_allclose(history.at(t), [10.0 * t])
+
+
+def test_lookups_outside_the_samples_clamp():
+    history = History(capacity=4)
+    for t in range(10):
+        history.append(float(t), 10.0 * t)
+
+    np.testing.assert_allclose(history.at(0.0), [60.0])  # Before the oldest sample kept
+    np.testing.assert_allclose(history.at(100.0), [90.0])  # After the newest sample
+
+
+def test_interpolation():
+    history = History(capacity=8, columns=2)
+    history.append(1.0, 0.0, 10.0)
+    history.append(3.0, 4.0, 20.0)
+
+    np.testing.assert_allclose(history.at(1.0), [0.0, 10.0])
+    np.testing.assert_allclose(history.at(1.5), [1.0, 12.5])
+    np.testing.assert_allclose(history.at(3.0), [4.0, 20.0])
+
+
+def test_angles_interpolate_the_short_way():
+    history = History(capacity=8, columns=2, angles=(1,))
+    history.append(0.0, 0.0, math.pi - 0.1)
+    history.append(1.0, 0.0, -math.pi + 0.1)
+
+    x, theta = history.at(0.5)
+    assert math.isclose(abs(theta), math.pi, abs_tol=1e-9)  # Across +-pi, not through 0
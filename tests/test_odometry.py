@@ -0,0 +1,53 @@
+import math
+
+from utils.odometry import Odometry
+
+WHEEL_RADIUS = 0.05  # m
+WHEEL_TRACK = 0.2  # m
+
+
+def drive(speeds, steps: int, dt: float) -> Odometry:
+    """Runs odometry with constant wheel speeds (rad/s) from t = 0."""
+    odometry = Odometry(lambda: speeds, WHEEL_RADIUS, WHEEL_TRACK)
+    for i in range(steps + 1):
+        odometry.update(i * dt)
+    return odometry
+
+
+def test_straight_line():
+    odometry = drive((10.0, 10.0), steps=100, dt=0.01)  # 0.5 m/s for 1 s
+
+    assert math.isclose(odometry.pose.x, 0.5, abs_tol=1e-9)
+    assert math.isclose(odometry.pose.y, 0.0, abs_tol=1e-9)
+    assert math.isclose(odometry.pose.theta, 0.0, abs_tol=1e-9)
+
+
+def test_pure_rotation():
+    odometry = drive((-2.0, 2.0), steps=100, dt=0.01)  # 1 rad/s on the spot for 1 s
+
+    assert math.isclose(odometry.pose.x, 0.0, abs_tol=1e-9)
+    assert math.isclose(odometry.pose.y, 0.0, abs_tol=1e-9)
+    assert math.isclose(odometry.pose.theta, 1.0, abs_tol=1e-9)
+
+
+def test_arc_is_exact_for_any_step():
+    # 0.25 m/s at 0.5 rad/s: a circle of radius 0.5 m, half of it in 2 * pi seconds
+    speeds = (4.0, 6.0)
+    duration = 2.0 * math.pi
+    for steps in (1, 7, 100):
+        odometry = drive(speeds, steps, duration / steps)
+
+        assert math.isclose(odometry.pose.x, 0.0, abs_tol=1e-9)
+        assert math.isclose(odometry.pose.y, 1.0, abs_tol=1e-9)
+        assert math.isclose(abs(odometry.pose.theta), math.pi, abs_tol=1e-9)
+
+
+def test_pose_at_and_motion_since():
+    odometry = drive((10.0, 10.0), steps=100, dt=0.01)
+
+    halfway = odometry.pose_at(0.5)
+    assert math.isclose(halfway.x, 0.25, abs_tol=1e-9)
+
+    motion = odometry.motion_since(0.5)
+    assert math.isclose(motion.x, 0.25, abs_tol=1e-9)
+    assert math.isclose(motion.y, 0.0, abs_tol=1e-9)
@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+
+from inference.ssd import SSDDecoder, batched_nms, generate_anchors
+
+
+def logit(p: float) -> float:
+    return math.log(p / (1.0 - p))
+
+
+def test_anchor_count_300x300():
+    anchors = generate_anchors((300, 300))
+    assert anchors.shape == (1917, 4)
+
+
+def test_zero_encoding_decodes_to_anchor():
+    anchors = generate_anchors((300, 300))
+    decoder = SSDDecoder(anchors, num_classes=2)
+
+    raw_boxes = np.zeros((len(anchors), 4), dtype=np.float32)
+    raw_scores = np.full((len(anchors), 2), -10.0, dtype=np.float32)
+    raw_scores[1000, 1] = logit(0.9)
+
+    boxes, scores, classes = decoder.decode(raw_boxes, raw_scores, threshold=0.5)
+
+    y, x, h, w = anchors[1000]
+    np.testing.assert_allclose(boxes, [[y - h / 2, x - w / 2, y + h / 2, x + w / 2]], atol=1e-6)
+    np.testing.assert_allclose(scores, [0.9], atol=1e-6)
+    np.testing.assert_array_equal(classes, [0])  # Background column skipped
+
+
+def test_quantized_threshold_matches_float():
+    anchors = generate_anchors((300, 300))
+    rng = np.random.default_rng(0)
+    box_quantization = (0.05, 128)
+    score_quantization = (0.1, 200)
+
+    raw_boxes = rng.integers(118, 139, size=(len(anchors), 4), dtype=np.uint8)
+    raw_scores = rng.integers(0, 256, size=(len(anchors), 3), dtype=np.uint8)
+    float_boxes = (raw_boxes.astype(np.float32) - box_quantization[1]) * box_quantization[0]
+    float_scores = (raw_scores.astype(np.float32) - score_quantization[1]) * score_quantization[0]
+
+    for threshold in (0.3, 0.5, 0.8, 0.99):
+        # Keep every candidate, so both paths see the same boxes
+        quantized = SSDDecoder(anchors, num_classes=3, pre_nms_top_k=len(anchors) * 3, max_detections=10000)
+        dequantized = SSDDecoder(anchors, num_classes=3, pre_nms_top_k=len(anchors) * 3, max_detections=10000)
+
+        q_boxes, q_scores, q_classes = quantized.decode(
+            raw_boxes, raw_scores, threshold, box_quantization, score_quantization
+        )
+        f_boxes, f_scores, f_classes = dequantized.decode(float_boxes, float_scores, threshold)
+
+        assert len(q_scores) > 0
+        assert (q_scores >= threshold).all()
+        np.testing.assert_array_equal(q_classes, f_classes)
+        np.testing.assert_allclose(q_scores, f_scores, rtol=1e-5)
+        np.testing.assert_allclose(q_boxes, f_boxes, atol=1e-5)
+
+
+def test_batched_nms_per_class():
+    boxes = np.array([
+        [0.10, 0.10, 0.50, 0.50],
+        [0.12, 0.12, 0.52, 0.52],  # Overlaps the first box
+        [0.11, 0.11, 0.51, 0.51],  # Overlaps both, but another class
+    ], dtype=np.float32)
+    scores = np.array([0.9, 0.8, 0.7], dtype=np.float32)
+    classes = np.array([0, 0, 1])
+
+    keep = batched_nms(boxes, scores, classes)
+
+    np.testing.assert_array_equal(keep, [0, 2])
@@ -0,0 +1,156 @@
+import threading
+import time
+from typing import Optional
+
+
+class Clock:
+    """
+    Monotonic wall clock used for all timestamps and pacing in the control stack.
+    """
+
+    def monotonic(self) -> float:
+        """
+        Returns the current time in seconds (arbitrary origin, never goes backwards).
+        """
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Blocks the calling thread for the given duration.
+
+        Args:
+            seconds (float): Time to sleep (in seconds).
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait(self, condition: threading.Condition, timeout: Optional[float] = None) -> bool:
+        """
+        Waits on a condition variable (which the caller holds) until notified or a timeout.
+
+        Callers re-check their deadline on `monotonic` after every wakeup, so waits made
+        with this method also end in time when the clock runs faster than real time.
+
+        Args:
+            condition (threading.Condition): The condition to wait on.
+            timeout (Optional[float], optional): Longest wait (in seconds). Defaults to None (no limit).
+
+        Returns:
+            bool: False if the timeout expired, True otherwise.
+        """
+        return condition.wait(timeout)
+
+
+class VirtualClock(Clock):
+    """
+    Clock that skips idle time, so simulations run faster than real time.
+
+    Time spent computing still advances the clock as usual, but `sleep` returns
+    immediately and moves the clock forward by the requested duration instead.
+    Sleeps from any thread advance the shared virtual time, and wake the threads
+    waiting on a condition through `wait` so they can check their deadlines.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the virtual clock at the current wall-clock time.
+        """
+        self._offset: float = 0.0  # Total idle time skipped (seconds)
+        self._lock = threading.Lock()
+        self._waiters: set = set()  # Conditions waited on through `wait`
+
+    def monotonic(self) -> float:
+        """
+        Returns the current virtual time in seconds.
+        """
+        return time.monotonic() + self._offset
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Advances the virtual time without blocking.
+
+        Args:
+            seconds (float): Time to skip (in seconds).
+        """
+        if seconds > 0:
+            with self._lock:
+                self._offset += seconds
+                waiters = list(self._waiters)
+
+            # Time jumped: let waiting threads check their deadlines
+            for condition in waiters:
+                with condition:
+                    condition.notify_all()
+        time.sleep(0)  # Still yield to other threads
+
+    def wait(self, condition: threading.Condition, timeout: Optional[float] = None) -> bool:
+        """
+        Waits on a condition variable until notified, a timeout or the next advance of the virtual time.
+
+        Args:
+            condition (threading.Condition): The condition to wait on (held by the caller).
+            timeout (Optional[float], optional): Longest wait (in real seconds). Defaults to None (no limit).
+
+        Returns:
+            bool: False if the timeout expired, True otherwise.
+        """
+        with self._lock:
+            self._waiters.add(condition)
+        try:
+            return condition.wait(timeout)
+        finally:
+            with self._lock:
+                self._waiters.discard(condition)
+
+
+# Clock shared by the whole process
+_clock: Clock = Clock()
+
+
+def set_clock(clock: Clock) -> None:
+    """
+    Replaces the process-wide clock (e.g. with a `VirtualClock` for simulation).
+
+    Args:
+        clock (Clock): The clock to use.
+    """
+    global _clock
+    _clock = clock
+
+
+def get_clock() -> Clock:
+    """
+    Returns the process-wide clock.
+    """
+    return _clock
+
+
+def monotonic() -> float:
+    """
+    Returns the current time of the process-wide clock (in seconds).
+    """
+    return _clock.monotonic()
+
+
+def sleep(seconds: float) -> None:
+    """
+    Sleeps on the process-wide clock.
+
+    Args:
+        seconds (float): Time to sleep (in seconds).
+    """
+    _clock.sleep(seconds)
+
+
+def wait(condition: threading.Condition, timeout: Optional[float] = None) -> bool:
+    """
+    Waits on a condition variable (held by the caller) on the process-wide clock.
+
+    Args:
+        condition (threading.Condition): The condition to wait on.
+        timeout (Optional[float], optional): Longest wait (in seconds). Defaults to None (no limit).
+
+    Returns:
+        bool: False if the timeout expired, True otherwise.
+    """
+    return _clock.wait(condition, timeout)
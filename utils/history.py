@@ -0,0 +1,120 @@
+import threading
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.pose import normalize_angle
+
+# Default number of samples kept (2.5 seconds at 200 Hz)
+HISTORY_SIZE: int = 512
+
+
+class History:
+    """
+    Fixed-size ring buffer of timestamped samples with O(log n) lookup by time.
+
+    Every sample is written twice, at its ring slot and one capacity further, so the
+    newest `capacity` samples always form one contiguous, time-ordered slice that
+    `np.searchsorted` can bisect without copying or unwrapping the ring.
+    """
+
+    def __init__(self, capacity: int = HISTORY_SIZE, columns: int = 1, angles: Sequence[int] = ()) -> None:
+        """
+        Initializes an empty history.
+
+        Args:
+            capacity (int, optional): Number of samples kept. Defaults to `HISTORY_SIZE`.
+            columns (int, optional): Number of values per sample. Defaults to 1.
+            angles (Sequence[int], optional): Columns holding angles in radians, which are
+                                              interpolated the short way around. Defaults to ().
+        """
+        self.capacity: int = capacity
+        self.angles: Tuple[int, ...] = tuple(angles)
+        self._times: np.ndarray = np.zeros(2 * capacity)  # Sample times (seconds), mirrored
+        self._values: np.ndarray = np.zeros((2 * capacity, columns))  # Sample values, mirrored
+        self._count: int = 0  # Samples appended so far
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def clear(self) -> None:
+        """
+        Forgets all samples.
+        """
+        with self._lock:
+            self._count = 0
+
+    def append(self, timestamp: float, *values: float) -> None:
+        """
+        Adds the newest sample, overwriting the oldest one once the buffer is full.
+
+        Args:
+            timestamp (float): Time of the sample (seconds, not earlier than the previous sample).
+            *values (float): The sample's values, one per column.
+        """
+        with self._lock:
+            slot = self._count % self.capacity
+            for index in (slot, slot + self.capacity):
+                self._times[index] = timestamp
+                self._values[index] = values
+            self._count += 1
+
+    def _window(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the time-ordered (times, values) views of the stored samples.
+        """
+        if self._count <= self.capacity:
+            start, end = 0, self._count
+        else:
+            start = self._count % self.capacity
+            end = start + self.capacity
+        return self._times[start:end], self._values[start:end]
+
+    def latest(self) -> Optional[Tuple[float, np.ndarray]]:
+        """
+        Returns the newest sample.
+
+        Returns:
+            Optional[Tuple[float, np.ndarray]]: Its time (seconds) and values, or None if the history is empty.
+        """
+        with self._lock:
+            if self._count == 0:
+                return None
+            times, values = self._window()
+            return float(times[-1]), values[-1].copy()
+
+    def at(self, timestamp: float) -> Optional[np.ndarray]:
+        """
+        Returns the values at a given time, interpolated between the two neighbouring samples.
+
+        Times before the oldest or after the newest sample return that sample (the
+        history does not extrapolate).
+
+        Args:
+            timestamp (float): The time (seconds).
+
+        Returns:
+            Optional[np.ndarray]: The values, or None if the history is empty.
+        """
+        with self._lock:
+            if self._count == 0:
+                return None
+            times, values = self._window()
+
+            i = int(np.searchsorted(times, timestamp, side='right'))
+            if i == 0:
+                return values[0].copy()
+            if i == len(times):
+                return values[-1].copy()
+
+            t0, t1 = times[i - 1], times[i]
+            start = values[i - 1].copy()
+            delta = values[i] - start
+
+        for column in self.angles:
+            delta[column] = normalize_angle(delta[column])  # Turn the short way around
+
+        f = (timestamp - t0) / (t1 - t0) if t1 > t0 else 1.0
+        start += f * delta
+        return start
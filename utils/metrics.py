@@ -0,0 +1,333 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Sequence
+
+# Upper bounds of the latency histogram buckets (seconds); an overflow bucket follows the last one
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0
+)
+
+# Quantiles estimated from the histogram buckets in snapshots
+QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+# Metrics endpoint and snapshot file settings
+METRICS_HOST: str = '127.0.0.1'  # Only reachable from the robot itself
+SNAPSHOT_INTERVAL: float = 5.0  # Time between snapshot file writes (seconds)
+
+
+class Counter:
+    """
+    Monotonically increasing event counter.
+    """
+
+    __slots__ = ('value', '_lock')
+
+    def __init__(self) -> None:
+        self.value: int = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """
+        Increments the counter.
+
+        Args:
+            amount (int, optional): Amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """
+    Latency histogram with fixed bucket bounds.
+
+    Recording a sample is a binary search plus a few additions, so histograms can stay
+    enabled in the control loop. Quantiles are estimated from the bucket counts.
+    """
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum', 'max', '_lock')
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """
+        Initializes an empty histogram.
+
+        Args:
+            bounds (Sequence[float], optional): Sorted upper bounds of the buckets (seconds).
+                                                Defaults to `LATENCY_BUCKETS`.
+        """
+        self.bounds: tuple[float, ...] = tuple(bounds)
+        self.counts: list[int] = [0] * (len(self.bounds) + 1)  # Last bucket counts overflows
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Records a sample.
+
+        Args:
+            value (float): The measured duration (in seconds).
+        """
+        i = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile as the upper bound of the bucket containing it.
+
+        Args:
+            q (float): The quantile (0-1).
+
+        Returns:
+            float: The estimated value (in seconds); the maximum for the overflow bucket.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            if total >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the histogram state as plain data.
+
+        Returns:
+            Dict[str, Any]: Sample count, sum, mean, max, estimated quantiles and bucket counts
+                            (keyed by upper bound, 'inf' for the overflow bucket).
+        """
+        with self._lock:
+            counts = list(self.counts)
+            result = {
+                'count': self.count,
+                'sum': self.sum,
+                'mean': self.sum / self.count if self.count else 0.0,
+                'max': self.max,
+            }
+            for q in QUANTILES:
+                result[f'p{round(q * 100)}'] = self.quantile(q)
+
+        result['buckets'] = {**{str(b): c for b, c in zip(self.bounds, counts)}, 'inf': counts[-1]}
+        return result
+
+
+class Metrics:
+    """
+    Process-wide collection of named counters and latency histograms.
+
+    Components look up their metrics once (e.g. in `__init__`) and update them directly
+    in the hot path; creating a metric that already exists returns the existing one.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty collection.
+        """
+        self.start_time: float = time.monotonic()
+        self.counters: Dict[str, Counter] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str) -> Counter:
+        """
+        Returns the counter with the given name, creating it if needed.
+
+        Args:
+            name (str): Name of the counter.
+
+        Returns:
+            Counter: The counter.
+        """
+        counter = self.counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self.counters.setdefault(name, Counter())
+        return counter
+
+    def histogram(self, name: str) -> Histogram:
+        """
+        Returns the latency histogram with the given name, creating it if needed.
+
+        Args:
+            name (str): Name of the histogram.
+
+        Returns:
+            Histogram: The histogram.
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, Histogram())
+        return histogram
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        """
+        Increments a counter by name.
+
+        Args:
+            name (str): Name of the counter.
+            amount (int, optional): Amount to add. Defaults to 1.
+        """
+        self.counter(name).inc(amount)
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Records a latency sample by histogram name.
+
+        Args:
+            name (str): Name of the histogram.
+            value (float): The measured duration (in seconds).
+        """
+        self.histogram(name).observe(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns all metrics as plain (JSON-serializable) data.
+
+        Returns:
+            Dict[str, Any]: Uptime, counter values and histogram snapshots.
+        """
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = dict(self.histograms)
+
+        return {
+            'uptime': time.monotonic() - self.start_time,
+            'counters': {name: counter.value for name, counter in sorted(counters.items())},
+            'latency': {name: histogram.snapshot() for name, histogram in sorted(histograms.items())},
+        }
+
+
+# Shared metrics of the process
+metrics = Metrics()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Serves the metrics snapshot as JSON on GET; every other method is rejected.
+    """
+
+    def do_GET(self) -> None:
+        if self.path not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+
+        body = json.dumps(self.server.metrics.snapshot()).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Keep the console free for the command prompt
+
+
+class MetricsServer:
+    """
+    Read-only HTTP endpoint serving the metrics snapshot on the loopback interface.
+    """
+
+    def __init__(self, port: int, host: str = METRICS_HOST, source: Metrics = metrics) -> None:
+        """
+        Initializes the server without starting it.
+
+        Args:
+            port (int): TCP port to listen on (0 picks a free port).
+            host (str, optional): Address to bind to. Defaults to `METRICS_HOST`.
+            source (Metrics, optional): Metrics to serve. Defaults to the shared `metrics`.
+        """
+        self.server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self.server.daemon_threads = True
+        self.server.metrics = source
+        self.port: int = self.server.server_address[1]
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Starts serving on a background thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.server.serve_forever, name="metrics", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops serving and closes the socket.
+        """
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread = None
+        self.server.server_close()
+
+
+class SnapshotWriter:
+    """
+    Periodically writes the metrics snapshot to a JSON file.
+
+    The file is replaced atomically, so readers never see a partial snapshot.
+    """
+
+    def __init__(self, path: str, interval: float = SNAPSHOT_INTERVAL, source: Metrics = metrics) -> None:
+        """
+        Initializes the writer without starting it.
+
+        Args:
+            path (str): Path of the snapshot file.
+            interval (float, optional): Time between writes (in seconds). Defaults to `SNAPSHOT_INTERVAL`.
+            source (Metrics, optional): Metrics to write. Defaults to the shared `metrics`.
+        """
+        self.path: str = path
+        self.interval: float = interval
+        self.source: Metrics = source
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Starts writing snapshots on a background thread.
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="metrics-snapshot", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the writer after a final snapshot.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def write(self) -> None:
+        """
+        Writes the current snapshot to the file.
+        """
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.source.snapshot(), f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _run(self) -> None:
+        """
+        Writes snapshots until stopped.
+        """
+        while not self._stop.wait(self.interval):
+            self.write()
+        self.write()
@@ -0,0 +1,163 @@
+import math
+from typing import Callable, Optional, Tuple
+
+import utils.clock as clock
+import utils.drive
+from utils.history import HISTORY_SIZE, History
+from utils.pose import Pose
+
+# Odometry settings
+STRAIGHT_OMEGA: float = 1e-6  # Below this angular velocity (rad/s) motion is integrated as a straight line
+
+
+class PoseHistory(History):
+    """
+    History of timestamped (x, y, theta) poses, looked up as `Pose` objects.
+    """
+
+    def __init__(self, capacity: int = HISTORY_SIZE) -> None:
+        """
+        Initializes an empty history.
+
+        Args:
+            capacity (int, optional): Number of poses kept. Defaults to `HISTORY_SIZE`.
+        """
+        super().__init__(capacity, columns=3, angles=(2,))
+
+    def latest(self) -> Optional[Tuple[float, Pose]]:
+        """
+        Returns the newest pose.
+
+        Returns:
+            Optional[Tuple[float, Pose]]: Its time (seconds) and pose, or None if the history is empty.
+        """
+        sample = super().latest()
+        return (sample[0], Pose(*sample[1])) if sample is not None else None
+
+    def at(self, timestamp: float) -> Optional[Pose]:
+        """
+        Returns the pose at a given time, interpolated between the two neighbouring poses.
+
+        Args:
+            timestamp (float): The time (seconds).
+
+        Returns:
+            Optional[Pose]: The pose, or None if the history is empty.
+        """
+        values = super().at(timestamp)
+        return Pose(*values) if values is not None else None
+
+
+class Odometry:
+    """
+    Dead-reckoning pose estimate integrated from the wheel speeds at a fixed rate.
+
+    Each update integrates the speeds held since the previous update along an exact
+    circular arc and records the result in a `PoseHistory`, so controllers can ask
+    where the robot was when a camera frame was captured and how far it has moved
+    (and turned) since. The wheel speeds come from a callable: the commanded speeds
+    of the drive today, measured encoder speeds once the robot has them.
+    """
+
+    def __init__(
+        self,
+        wheel_speeds: Callable[[], Tuple[float, float]],
+        wheel_radius: float,
+        wheel_track: float,
+        history_size: int = HISTORY_SIZE,
+    ) -> None:
+        """
+        Initializes the odometry at the origin.
+
+        Args:
+            wheel_speeds (Callable[[], Tuple[float, float]]): Returns the left and right wheel speeds (rad/s).
+            wheel_radius (float): Wheel radius (m).
+            wheel_track (float): Distance between the wheels (m).
+            history_size (int, optional): Number of poses kept for lookups. Defaults to `HISTORY_SIZE`.
+        """
+        self.wheel_speeds: Callable[[], Tuple[float, float]] = wheel_speeds
+        self.R: float = wheel_radius
+        self.T: float = wheel_track
+
+        self.pose: Pose = Pose(0.0, 0.0, 0.0)  # Current pose estimate
+        self.v: float = 0.0  # Translational velocity since the last update (m/s)
+        self.omega: float = 0.0  # Angular velocity since the last update (rad/s)
+        self.history = PoseHistory(history_size)
+        self.updates: int = 0
+        self._time: Optional[float] = None
+
+    def reset(self, pose: Optional[Pose] = None) -> None:
+        """
+        Restarts the estimate (and its history) from a pose.
+
+        Args:
+            pose (Optional[Pose], optional): The new pose. Defaults to None (the origin).
+        """
+        self.pose = pose if pose is not None else Pose(0.0, 0.0, 0.0)
+        self.history.clear()
+        self._time = None
+
+    def update(self, timestamp: Optional[float] = None) -> Pose:
+        """
+        Integrates the motion since the previous update and samples the wheel speeds for the next one.
+
+        Args:
+            timestamp (Optional[float], optional): Current time (seconds). Defaults to None (the process clock).
+
+        Returns:
+            Pose: The current pose estimate.
+        """
+        now = clock.monotonic() if timestamp is None else timestamp
+
+        if self._time is not None and now > self._time:
+            dt = now - self._time
+            x, y, theta = self.pose.sunpack()
+            dtheta = self.omega * dt
+
+            # Exact arc for constant speeds (straight line when not turning)
+            if abs(self.omega) < STRAIGHT_OMEGA:
+                x += self.v * dt * math.cos(theta)
+                y += self.v * dt * math.sin(theta)
+            else:
+                radius = self.v / self.omega
+                x += radius * (math.sin(theta + dtheta) - math.sin(theta))
+                y -= radius * (math.cos(theta + dtheta) - math.cos(theta))
+            self.pose.supdate(x, y, theta + dtheta)
+
+        if self._time is None or now > self._time:
+            self._time = now
+            self.history.append(now, self.pose.x, self.pose.y, self.pose.theta)
+
+        # Speeds applied from now until the next update
+        v_l, v_r = self.wheel_speeds()
+        self.v, self.omega = utils.drive.diff_to_uni(v_l, v_r, self.R, self.T)
+        self.updates += 1
+        return self.pose
+
+    def pose_at(self, timestamp: float) -> Optional[Pose]:
+        """
+        Returns where the robot was at a given time (e.g. when a frame was captured).
+
+        Args:
+            timestamp (float): The time (seconds).
+
+        Returns:
+            Optional[Pose]: The pose, or None before the first update.
+        """
+        return self.history.at(timestamp)
+
+    def motion_since(self, timestamp: float) -> Pose:
+        """
+        Returns the robot's motion since a given time, relative to its pose at that time.
+
+        Args:
+            timestamp (float): The earlier time (seconds), e.g. the capture time of a frame.
+
+        Returns:
+            Pose: The displacement (m) and rotation (radians, positive to the left) in the
+                  robot's frame at `timestamp`; the identity without history.
+        """
+        then = self.history.at(timestamp)
+        if then is None:
+            return Pose(0.0, 0.0, 0.0)
+        return self.pose.transform_to(then.inverse())
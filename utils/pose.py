@@ -1,15 +1,52 @@
-from typing import Tuple, List
-import math_util
-import linalg
+import math
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+TWO_PI: float = 2.0 * math.pi
+
+
+def normalize_angle(theta: float) -> float:
+    """
+    Wraps an angle to the range [-pi, pi).
+
+    Args:
+        theta (float): The angle (radians).
+
+    Returns:
+        float: The equivalent angle in [-pi, pi).
+    """
+    return (theta + math.pi) % TWO_PI - math.pi
+
+
+def normalize_angles(theta: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Wraps an array of angles to the range [-pi, pi).
+
+    Args:
+        theta (np.ndarray): The angles (radians).
+        out (Optional[np.ndarray], optional): Array the result is written to (may be `theta`).
+                                              Defaults to None (allocate).
+
+    Returns:
+        np.ndarray: The wrapped angles.
+    """
+    out = np.add(theta, math.pi, out=out)
+    np.mod(out, TWO_PI, out=out)
+    out -= math.pi
+    return out
 
 
 class Pose:
     """
     Represents a 2D pose with position (x, y) and orientation (theta).
 
-    Provides methods for pose transformations, inversions, and unpacking.
+    Provides methods for pose transformations, inversions, and unpacking. Scalar poses
+    use plain float math; use `PoseArray` for many poses at once.
     """
 
+    __slots__ = ('x', 'y', 'theta')
+
     def __init__(self, *args: float) -> None:
         """
         Initializes a Pose object with x, y coordinates and an orientation theta.
@@ -20,13 +57,21 @@ class Pose:
         if len(args) != 3:
             raise ValueError("Pose requires exactly three arguments: (x, y, theta)")
 
-        self.x: float = args[0]
-        self.y: float = args[1]
-        self.theta: float = math_util.normalize_angle(args[2])  # Normalize theta to stay within valid range
+        self.x: float = float(args[0])
+        self.y: float = float(args[1])
+        self.theta: float = normalize_angle(float(args[2]))  # Normalize theta to stay within valid range
+
+    def __repr__(self) -> str:
+        return f"Pose({self.x!r}, {self.y!r}, {self.theta!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Pose):
+            return NotImplemented
+        return (self.x, self.y, self.theta) == (other.x, other.y, other.theta)
 
     def transform_to(self, reference_pose: "Pose") -> "Pose":
         """
-        Transforms this pose to a given reference pose.
+        Transforms this pose, given relative to a reference pose, into the reference pose's frame.
 
         Args:
             reference_pose (Pose): The reference pose to transform relative to.
@@ -34,20 +79,12 @@ class Pose:
         Returns:
             Pose: The transformed pose.
         """
-        # Decompose the current and reference pose into vectors and angles
-        rel_vect, rel_theta = self.vunpack()
-        ref_vect, ref_theta = reference_pose.vunpack()
-
-        # Rotate the relative vector by the reference pose's orientation
-        result_vect_d = linalg.rotate_vector(rel_vect, ref_theta)
+        # Rotate the relative position by the reference pose's orientation, then offset it
+        cos_theta, sin_theta = math.cos(reference_pose.theta), math.sin(reference_pose.theta)
+        x = reference_pose.x + cos_theta * self.x - sin_theta * self.y
+        y = reference_pose.y + sin_theta * self.x + cos_theta * self.y
 
-        # Compute the new transformed position
-        result_vect = linalg.add(ref_vect, result_vect_d)
-
-        # Compute the new transformed orientation
-        result_theta = ref_theta + rel_theta
-
-        return Pose(result_vect[0], result_vect[1], result_theta)
+        return Pose(x, y, reference_pose.theta + self.theta)
 
     def inverse(self) -> "Pose":
         """
@@ -57,22 +94,37 @@ class Pose:
             Pose: The pose of the "world" relative to this pose.
         """
         # Invert theta and rotate the position by the negative theta
-        result_theta = -self.theta
-        result_pos = linalg.rotate_vector([-self.x, -self.y], result_theta)
+        cos_theta, sin_theta = math.cos(self.theta), math.sin(self.theta)
+        x = -cos_theta * self.x - sin_theta * self.y
+        y = sin_theta * self.x - cos_theta * self.y
+
+        return Pose(x, y, -self.theta)
+
+    def transform_point(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Maps a point from this pose's frame into the frame the pose is given in.
+
+        Args:
+            x (float): X-coordinate in this pose's frame.
+            y (float): Y-coordinate in this pose's frame.
 
-        return Pose(result_pos[0], result_pos[1], result_theta)
+        Returns:
+            Tuple[float, float]: The point's coordinates.
+        """
+        cos_theta, sin_theta = math.cos(self.theta), math.sin(self.theta)
+        return self.x + cos_theta * x - sin_theta * y, self.y + sin_theta * x + cos_theta * y
 
-    def vupdate(self, vect: List[float], theta: float) -> None:
+    def vupdate(self, vect: Tuple[float, float], theta: float) -> None:
         """
         Updates the pose using a vector (x, y) and an orientation theta.
 
         Args:
-            vect (List[float]): The new position as a vector [x, y].
+            vect (Tuple[float, float]): The new position as a vector (x, y).
             theta (float): The new orientation.
         """
-        self.x = vect[0]
-        self.y = vect[1]
-        self.theta = math_util.normalize_angle(theta)  # Normalize theta
+        self.x = float(vect[0])
+        self.y = float(vect[1])
+        self.theta = normalize_angle(theta)  # Normalize theta
 
     def supdate(self, x: float, y: float, theta: float) -> None:
         """
@@ -83,18 +135,18 @@ class Pose:
             y (float): The new y-coordinate.
             theta (float): The new orientation.
         """
-        self.x = x
-        self.y = y
-        self.theta = math_util.normalize_angle(theta)  # Normalize theta
+        self.x = float(x)
+        self.y = float(y)
+        self.theta = normalize_angle(theta)  # Normalize theta
 
-    def vunpack(self) -> Tuple[List[float], float]:
+    def vunpack(self) -> Tuple[Tuple[float, float], float]:
         """
         Unpacks the pose into its position vector and orientation.
 
         Returns:
-            Tuple[List[float], float]: Position as a vector [x, y] and orientation theta.
+            Tuple[Tuple[float, float], float]: Position as a vector (x, y) and orientation theta.
         """
-        return [self.x, self.y], self.theta
+        return (self.x, self.y), self.theta
 
     def sunpack(self) -> Tuple[float, float, float]:
         """
@@ -105,11 +157,196 @@ class Pose:
         """
         return self.x, self.y, self.theta
 
-    def vposition(self) -> List[float]:
+    def vposition(self) -> Tuple[float, float]:
         """
         Returns the position component of the pose as a vector.
 
         Returns:
-            List[float]: Position as a vector [x, y].
+            Tuple[float, float]: Position as a vector (x, y).
+        """
+        return self.x, self.y
+
+
+class PoseArray:
+    """
+    Many 2D poses stored as one (N, 3) float64 array of (x, y, theta) rows.
+
+    Composition, inversion and point transforms run as single vectorized operations
+    over all poses and broadcast against a single `Pose` or a one-row array. Every
+    operation accepts an `out` array to reuse a buffer instead of allocating.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: Union[np.ndarray, Iterable[Iterable[float]], int], normalize: bool = True) -> None:
+        """
+        Initializes the poses.
+
+        Args:
+            data (Union[np.ndarray, Iterable[Iterable[float]], int]): Rows of (x, y, theta), or a
+                                                                       number of identity poses.
+            normalize (bool, optional): Wrap the angles to [-pi, pi). Defaults to True.
+        """
+        if isinstance(data, (int, np.integer)):
+            self.data: np.ndarray = np.zeros((int(data), 3))
+        else:
+            self.data = np.array(data, dtype=np.float64).reshape(-1, 3)
+            if normalize:
+                normalize_angles(self.data[:, 2], out=self.data[:, 2])
+
+    @classmethod
+    def from_poses(cls, poses: Iterable[Pose]) -> "PoseArray":
+        """
+        Packs scalar poses into an array.
+
+        Args:
+            poses (Iterable[Pose]): The poses.
+
+        Returns:
+            PoseArray: The packed poses.
+        """
+        return cls([pose.sunpack() for pose in poses], normalize=False)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index) -> Union[Pose, "PoseArray"]:
+        """
+        Returns one pose as a `Pose`, or a selection of poses as a `PoseArray` view.
+        """
+        if isinstance(index, (int, np.integer)):
+            return Pose(*self.data[index])
+        result = PoseArray.__new__(PoseArray)
+        result.data = self.data[index].reshape(-1, 3)
+        return result
+
+    def __repr__(self) -> str:
+        return f"PoseArray({self.data!r})"
+
+    @property
+    def x(self) -> np.ndarray:
+        """Returns the x-coordinates (a view)."""
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Returns the y-coordinates (a view)."""
+        return self.data[:, 1]
+
+    @property
+    def theta(self) -> np.ndarray:
+        """Returns the orientations (a view)."""
+        return self.data[:, 2]
+
+    @staticmethod
+    def _rows(poses: Union[Pose, "PoseArray"]) -> np.ndarray:
+        """
+        Returns the (N, 3) array of a pose or pose array.
+        """
+        if isinstance(poses, Pose):
+            return np.array([[poses.x, poses.y, poses.theta]])
+        return poses.data
+
+    def _result(self, out: Optional["PoseArray"], shape: Tuple[int, ...]) -> "PoseArray":
+        """
+        Returns `out`, or a new pose array of the given shape.
+        """
+        if out is None:
+            out = PoseArray.__new__(PoseArray)
+            out.data = np.empty(shape)
+        return out
+
+    def normalize(self) -> "PoseArray":
+        """
+        Wraps all angles to [-pi, pi) in place.
+
+        Returns:
+            PoseArray: This array.
+        """
+        normalize_angles(self.data[:, 2], out=self.data[:, 2])
+        return self
+
+    def compose(self, other: Union[Pose, "PoseArray"], out: Optional["PoseArray"] = None) -> "PoseArray":
+        """
+        Composes each pose with another: the result is `other` given relative to `self`,
+        expressed in the frame `self` is given in.
+
+        Args:
+            other (Union[Pose, PoseArray]): Relative poses (one, or one per pose).
+            out (Optional[PoseArray], optional): Result buffer (may be `self` or `other`).
+                                                 Defaults to None (allocate).
+
+        Returns:
+            PoseArray: The composed poses.
+        """
+        a, b = self.data, self._rows(other)
+        cos_theta, sin_theta = np.cos(a[:, 2]), np.sin(a[:, 2])
+
+        bx, by = b[:, 0], b[:, 1]
+        x = a[:, 0] + cos_theta * bx - sin_theta * by
+        y = a[:, 1] + sin_theta * bx + cos_theta * by
+        theta = a[:, 2] + b[:, 2]
+
+        out = self._result(out, np.broadcast_shapes(a.shape, b.shape))
+        out.data[:, 0], out.data[:, 1], out.data[:, 2] = x, y, theta
+        return out.normalize()
+
+    def transform_to(self, reference: Union[Pose, "PoseArray"], out: Optional["PoseArray"] = None) -> "PoseArray":
+        """
+        Transforms poses given relative to reference poses into the references' frame
+        (the batched `Pose.transform_to`).
+
+        Args:
+            reference (Union[Pose, PoseArray]): Reference poses (one, or one per pose).
+            out (Optional[PoseArray], optional): Result buffer. Defaults to None (allocate).
+
+        Returns:
+            PoseArray: The transformed poses.
+        """
+        if isinstance(reference, Pose):
+            reference = PoseArray.from_poses([reference])
+        return reference.compose(self, out=out)
+
+    def inverse(self, out: Optional["PoseArray"] = None) -> "PoseArray":
+        """
+        Inverts every pose.
+
+        Args:
+            out (Optional[PoseArray], optional): Result buffer (may be `self`). Defaults to None (allocate).
+
+        Returns:
+            PoseArray: The inverse poses.
+        """
+        a = self.data
+        cos_theta, sin_theta = np.cos(a[:, 2]), np.sin(a[:, 2])
+        x = -cos_theta * a[:, 0] - sin_theta * a[:, 1]
+        y = sin_theta * a[:, 0] - cos_theta * a[:, 1]
+
+        out = self._result(out, a.shape)
+        out.data[:, 0], out.data[:, 1] = x, y
+        np.negative(a[:, 2], out=out.data[:, 2])
+        return out.normalize()
+
+    def transform_points(self, points: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Maps points from the poses' frames into the frame the poses are given in.
+
+        Args:
+            points (np.ndarray): Points of shape (N, 2) (one per pose) or (2,) (the same point
+                                 for every pose).
+            out (Optional[np.ndarray], optional): Result buffer of shape (N, 2). Defaults to None (allocate).
+
+        Returns:
+            np.ndarray: The transformed points, shape (N, 2).
         """
-        return [self.x, self.y]
\ No newline at end of file
+        a = self.data
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        cos_theta, sin_theta = np.cos(a[:, 2]), np.sin(a[:, 2])
+        px, py = points[:, 0], points[:, 1]
+
+        x = a[:, 0] + cos_theta * px - sin_theta * py
+        y = a[:, 1] + sin_theta * px + cos_theta * py
+        if out is None:
+            out = np.empty((len(x), 2))
+        out[:, 0], out[:, 1] = x, y
+        return out
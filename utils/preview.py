@@ -0,0 +1,178 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from utils.metrics import metrics
+
+# Preview stream settings
+PREVIEW_HOST: str = '127.0.0.1'  # Only reachable from the robot itself (use an SSH tunnel to watch)
+PREVIEW_FPS: float = 10.0  # Maximum rate of preview frames
+PREVIEW_QUALITY: int = 70  # JPEG quality of preview frames
+BOUNDARY: bytes = b'frame'  # MJPEG multipart boundary
+
+
+class PreviewServer:
+    """
+    Streams annotated camera frames as MJPEG over HTTP, but only while someone is watching.
+
+    The control loop asks `wants_frame` before drawing any overlay: it is False while no
+    client is connected and otherwise True at most `max_fps` times per second. Published
+    frames are copied and JPEG-encoded on the client threads, once per frame no matter
+    how many clients are connected.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        host: str = PREVIEW_HOST,
+        max_fps: float = PREVIEW_FPS,
+        quality: int = PREVIEW_QUALITY,
+    ) -> None:
+        """
+        Initializes the server without starting it.
+
+        Args:
+            port (int): TCP port to listen on (0 picks a free port).
+            host (str, optional): Address to bind to. Defaults to `PREVIEW_HOST`.
+            max_fps (float, optional): Maximum preview frame rate. Defaults to `PREVIEW_FPS`.
+            quality (int, optional): JPEG quality (0-100). Defaults to `PREVIEW_QUALITY`.
+        """
+        self.min_interval: float = 1.0 / max_fps
+        self.quality: int = quality
+
+        self.server = ThreadingHTTPServer((host, port), _PreviewHandler)
+        self.server.daemon_threads = True
+        self.server.preview = self
+        self.port: int = self.server.server_address[1]
+        self._thread: Optional[threading.Thread] = None
+
+        # Latest published frame and its encoding (encoded lazily, once)
+        self._image: Optional[np.ndarray] = None
+        self._seq: int = 0
+        self._jpeg: bytes = b''
+        self._jpeg_seq: int = 0
+        self._next_time: float = 0.0
+        self._cond = threading.Condition()
+        self._encode_lock = threading.Lock()
+        self._stop = threading.Event()
+
+        # Statistics
+        self.clients: int = 0  # Connected clients
+        self._frames_encoded = metrics.counter('preview.frames_encoded')
+
+    def start(self) -> None:
+        """
+        Starts serving on a background thread.
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.server.serve_forever, name="preview", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Disconnects the clients, stops serving and closes the socket.
+        """
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread = None
+        self.server.server_close()
+
+    def wants_frame(self) -> bool:
+        """
+        Checks whether a new preview frame should be drawn and published now.
+
+        Returns:
+            bool: True if a client is connected and the frame rate cap allows another frame.
+        """
+        return self.clients > 0 and time.monotonic() >= self._next_time
+
+    def publish(self, image: np.ndarray) -> None:
+        """
+        Publishes a frame to the connected clients.
+
+        Args:
+            image (np.ndarray): The annotated frame. Its pixels are copied.
+        """
+        with self._cond:
+            if self._image is None or self._image.shape != image.shape:
+                self._image = np.empty_like(image)
+            np.copyto(self._image, image)
+            self._seq += 1
+            self._next_time = time.monotonic() + self.min_interval
+            self._cond.notify_all()
+
+    def _wait_jpeg(self, last_seq: int) -> tuple[int, Optional[bytes]]:
+        """
+        Waits for a frame newer than `last_seq` and returns its JPEG encoding.
+
+        Returns:
+            tuple[int, Optional[bytes]]: Sequence number and JPEG data (None once stopped).
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq != last_seq or self._stop.is_set())
+            if self._stop.is_set():
+                return last_seq, None
+
+        with self._encode_lock:
+            if self._jpeg_seq != self._seq:
+                with self._cond:
+                    seq, image = self._seq, self._image.copy()
+                ok, encoded = cv2.imencode('.jpg', image, (cv2.IMWRITE_JPEG_QUALITY, self.quality))
+                if ok:
+                    self._jpeg, self._jpeg_seq = encoded.tobytes(), seq
+                    self._frames_encoded.inc()
+            return self._jpeg_seq, self._jpeg
+
+    def _connect(self, delta: int) -> None:
+        """
+        Tracks client connections.
+        """
+        with self._cond:
+            self.clients += delta
+            if delta > 0:
+                self._next_time = 0.0  # Send the first frame right away
+
+
+class _PreviewHandler(BaseHTTPRequestHandler):
+    """
+    Serves the MJPEG stream on GET; every other method is rejected.
+    """
+
+    def do_GET(self) -> None:
+        if self.path not in ('/', '/stream'):
+            self.send_error(404)
+            return
+
+        preview: PreviewServer = self.server.preview
+        self.send_response(200)
+        self.send_header('Content-Type', f'multipart/x-mixed-replace; boundary={BOUNDARY.decode()}')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        preview._connect(1)
+        try:
+            seq = 0
+            while True:
+                seq, jpeg = preview._wait_jpeg(seq)
+                if jpeg is None:
+                    break
+                self.wfile.write(b'--' + BOUNDARY + b'\r\n')
+                self.wfile.write(b'Content-Type: image/jpeg\r\n')
+                self.wfile.write(f'Content-Length: {len(jpeg)}\r\n\r\n'.encode())
+                self.wfile.write(jpeg)
+                self.wfile.write(b'\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client disconnected
+        finally:
+            preview._connect(-1)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Keep the console free for the command prompt
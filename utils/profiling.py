@@ -0,0 +1,85 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator
+
+import numpy as np
+
+# Maximum number of samples kept per stage
+MAX_SAMPLES: int = 100000
+
+
+class StageProfiler:
+    """
+    Collects raw latency samples per control-loop stage and summarizes them as percentiles.
+
+    Intended for benchmarks: every sample is kept (up to `max_samples` per stage),
+    so percentiles are exact.
+    """
+
+    def __init__(self, max_samples: int = MAX_SAMPLES) -> None:
+        """
+        Initializes an empty profiler.
+
+        Args:
+            max_samples (int, optional): Maximum number of samples kept per stage. Defaults to `MAX_SAMPLES`.
+        """
+        self.max_samples: int = max_samples
+        self.samples: Dict[str, Deque[float]] = {}
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Measures the wall-clock duration of a block and records it for a stage.
+
+        Args:
+            stage (str): Name of the stage.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start_time)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Records a latency sample for a stage.
+
+        Args:
+            stage (str): Name of the stage.
+            seconds (float): Measured duration (in seconds).
+        """
+        samples = self.samples.get(stage)
+        if samples is None:
+            samples = self.samples[stage] = deque(maxlen=self.max_samples)
+        samples.append(seconds)
+
+    def reset(self) -> None:
+        """
+        Drops all recorded samples.
+        """
+        self.samples.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarizes the recorded samples per stage.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Per stage: sample count, mean, p50, p95, p99 and max
+                                         latency (in milliseconds).
+        """
+        result = {}
+        for stage, samples in self.samples.items():
+            if not samples:
+                continue
+            values = np.fromiter(samples, dtype=np.float64, count=len(samples)) * 1000.0
+            p50, p95, p99 = np.percentile(values, (50, 95, 99))
+            result[stage] = {
+                'count': len(values),
+                'mean_ms': float(values.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+                'max_ms': float(values.max()),
+            }
+        return result
@@ -0,0 +1,406 @@
+import mmap
+import queue
+import struct
+import threading
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+import utils.clock as clock
+from inference.objects import BBox, Object
+from utils.metrics import metrics
+
+# Log file layout: FILE_MAGIC, then records of RECORD_HEADER followed by `length` payload bytes
+FILE_MAGIC: bytes = b'RBTLOG1\n'
+RECORD_HEADER = struct.Struct('<B3xidI')  # kind, frame seq, timestamp (seconds), payload length
+RAW_FRAME_HEADER = struct.Struct('<HHB')  # height, width, channels (uint8 pixels follow)
+DETECTIONS_HEADER = struct.Struct('<d')  # detection latency (seconds)
+DETECTION_FORMAT = struct.Struct('<if4i')  # class id, score, xmin, ymin, xmax, ymax
+STATE_FORMAT = struct.Struct('<4d')  # pan, tilt, v, omega
+
+# Record kinds
+FRAME_JPEG: int = 1
+FRAME_RAW: int = 2
+DETECTIONS: int = 3
+COMMAND: int = 4
+STATE: int = 5
+
+# Recorder settings
+JPEG_QUALITY: int = 90  # JPEG quality of recorded frames (0 stores raw pixels)
+MAX_PENDING: int = 64  # Records queued for the writer before new ones are dropped
+
+
+class Record(NamedTuple):
+    """
+    Index entry of a record in a log file.
+    """
+
+    kind: int  # Record kind (`FRAME_JPEG`, `FRAME_RAW`, `DETECTIONS`, `COMMAND` or `STATE`)
+    seq: int  # Sequence number of the camera frame the record belongs to
+    timestamp: float  # Time of the record on the process clock (seconds)
+    offset: int  # Offset of the payload in the file
+    length: int  # Payload length (bytes)
+
+
+class Recorder:
+    """
+    Appends captured frames, detections, commands and actuator commands to a binary log.
+
+    Records are queued by the control loop and encoded and written by a background
+    thread, so recording costs the loop little more than a frame copy. If the writer
+    falls behind, new records are dropped (and counted) instead of blocking the loop.
+    """
+
+    def __init__(self, path: str, jpeg_quality: int = JPEG_QUALITY, max_pending: int = MAX_PENDING) -> None:
+        """
+        Initializes the recorder and creates the log file.
+
+        Args:
+            path (str): Path of the log file (overwritten if it exists).
+            jpeg_quality (int, optional): JPEG quality of recorded frames, or 0 to store raw pixels.
+                                          Defaults to `JPEG_QUALITY`.
+            max_pending (int, optional): Maximum number of queued records. Defaults to `MAX_PENDING`.
+        """
+        self.path: str = path
+        self.jpeg_quality: int = jpeg_quality
+        self._file = open(path, 'wb')
+        self._file.write(FILE_MAGIC)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.records_written: int = 0
+        self.records_dropped: int = 0
+        self._dropped = metrics.counter('recorder.dropped')
+
+    def start(self) -> None:
+        """
+        Starts the writer thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="recorder", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Writes all queued records and closes the log file.
+        """
+        if self._thread is not None:
+            self._queue.put(None)  # Sentinel: flush and exit
+            self._thread.join()
+            self._thread = None
+        if not self._file.closed:
+            self._file.close()
+
+    def frame(self, frame) -> None:
+        """
+        Records a camera frame.
+
+        Args:
+            frame (Frame): The captured frame. Its pixels are copied.
+        """
+        if frame.ok:
+            kind = FRAME_JPEG if self.jpeg_quality else FRAME_RAW
+            self._put((kind, frame.seq, frame.timestamp, frame.image.copy()))
+
+    def detections(self, detections) -> None:
+        """
+        Records the detections of a frame.
+
+        Args:
+            detections (Detections): The detection result.
+        """
+        payload = bytearray(DETECTIONS_HEADER.pack(detections.latency))
+        for o in detections.objects:
+            payload += DETECTION_FORMAT.pack(o.id, o.score, *(int(v) for v in o.bbox))
+        self._put((DETECTIONS, detections.seq, detections.timestamp, bytes(payload)))
+
+    def command(self, seq: int, command: str, target_object: str) -> None:
+        """
+        Records a command.
+
+        Args:
+            seq (int): Sequence number of the current camera frame.
+            command (str): The command.
+            target_object (str): The target object of the command.
+        """
+        self._put((COMMAND, seq, clock.monotonic(), f'{command}\0{target_object}'.encode()))
+
+    def state(self, seq: int, pan: float, tilt: float, v: float, omega: float) -> None:
+        """
+        Records the actuator commands issued by the control loop.
+
+        Args:
+            seq (int): Sequence number of the current camera frame.
+            pan (float): Pan angle (degrees).
+            tilt (float): Tilt angle (degrees).
+            v (float): Linear velocity (m/s).
+            omega (float): Angular velocity (rad/s).
+        """
+        self._put((STATE, seq, clock.monotonic(), STATE_FORMAT.pack(pan, tilt, v, omega)))
+
+    def _put(self, item: tuple) -> None:
+        """
+        Queues a record for the writer, dropping it if the queue is full.
+        """
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.records_dropped += 1
+            self._dropped.inc()
+
+    def _run(self) -> None:
+        """
+        Encodes and appends queued records until the sentinel arrives.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            kind, seq, timestamp, data = item
+            if kind == FRAME_JPEG:
+                ok, encoded = cv2.imencode('.jpg', data, (cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality))
+                if not ok:
+                    continue
+                data = encoded.tobytes()
+            elif kind == FRAME_RAW:
+                height, width = data.shape[:2]
+                channels = data.shape[2] if data.ndim == 3 else 1
+                data = RAW_FRAME_HEADER.pack(height, width, channels) + data.tobytes()
+
+            self._file.write(RECORD_HEADER.pack(kind, seq, timestamp, len(data)))
+            self._file.write(data)
+            self.records_written += 1
+
+        self._file.flush()
+
+
+class LogReader:
+    """
+    Reads a log written by `Recorder` through a read-only memory map.
+
+    The records are indexed once on open; raw frames are returned as views into the
+    map without copying. A truncated last record (e.g. after a crash) is ignored.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens and indexes a log file.
+
+        Args:
+            path (str): Path of the log file.
+
+        Raises:
+            ValueError: If the file is not a recorder log.
+        """
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(FILE_MAGIC)] != FILE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a recorder log")
+
+        self.records: List[Record] = []
+        offset = len(FILE_MAGIC)
+        size = len(self._map)
+        while offset + RECORD_HEADER.size <= size:
+            kind, seq, timestamp, length = RECORD_HEADER.unpack_from(self._map, offset)
+            offset += RECORD_HEADER.size
+            if offset + length > size:
+                break  # Truncated record
+            self.records.append(Record(kind, seq, timestamp, offset, length))
+            offset += length
+
+        self.frames: List[Record] = [r for r in self.records if r.kind in (FRAME_JPEG, FRAME_RAW)]
+
+    def close(self) -> None:
+        """
+        Closes the memory map and the file.
+        """
+        self._map.close()
+        self._file.close()
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self.records)
+
+    def payload(self, record: Record) -> memoryview:
+        """
+        Returns the payload of a record as a view into the memory map.
+        """
+        return memoryview(self._map)[record.offset:record.offset + record.length]
+
+    def image(self, record: Record, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Decodes the image of a frame record.
+
+        Args:
+            record (Record): A frame record.
+            out (Optional[np.ndarray], optional): Buffer to decode or copy into. Defaults to None,
+                                                  returning a new array (JPEG) or a read-only
+                                                  view into the map (raw).
+
+        Returns:
+            np.ndarray: The frame image.
+        """
+        data = self.payload(record)
+        if record.kind == FRAME_JPEG:
+            image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        else:
+            height, width, channels = RAW_FRAME_HEADER.unpack_from(data)
+            image = np.frombuffer(data, dtype=np.uint8, offset=RAW_FRAME_HEADER.size)
+            image = image.reshape((height, width, channels) if channels > 1 else (height, width))
+
+        if out is not None and out.shape == image.shape:
+            np.copyto(out, image)
+            return out
+        return image
+
+    def detections(self, record: Record) -> Tuple[List[Object], float]:
+        """
+        Decodes a detections record.
+
+        Returns:
+            Tuple[List[Object], float]: The detected objects and the detection latency (seconds).
+        """
+        data = self.payload(record)
+        (latency,) = DETECTIONS_HEADER.unpack_from(data)
+        objects = [
+            Object(class_id, score, BBox(*bbox))
+            for class_id, score, *bbox in DETECTION_FORMAT.iter_unpack(data[DETECTIONS_HEADER.size:])
+        ]
+        return objects, latency
+
+    def command(self, record: Record) -> Tuple[str, str]:
+        """
+        Decodes a command record.
+
+        Returns:
+            Tuple[str, str]: The command and its target object.
+        """
+        command, _, target_object = bytes(self.payload(record)).decode().partition('\0')
+        return command, target_object
+
+    def state(self, record: Record) -> Tuple[float, float, float, float]:
+        """
+        Decodes an actuator state record.
+
+        Returns:
+            Tuple[float, float, float, float]: Pan, tilt, v and omega.
+        """
+        return STATE_FORMAT.unpack_from(self.payload(record))
+
+
+class ReplayCapture:
+    """
+    Capture source playing back the frames of a recorder log, in place of `cv2.VideoCapture`.
+
+    Frames are delivered in recorded order, either paced on the process clock to the
+    recorded frame times or as fast as they are read.
+    """
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False) -> None:
+        """
+        Opens a log for playback.
+
+        Args:
+            path (str): Path of the log file.
+            realtime (bool, optional): Pace frames to their recorded times. Defaults to True.
+            loop (bool, optional): Restart from the first frame at the end. Defaults to False.
+        """
+        self.log = LogReader(path)
+        self.realtime: bool = realtime
+        self.loop: bool = loop
+        self.pos: int = 0  # Index of the next frame
+        self.timestamp: float = 0.0  # Recorded time of the last frame, relative to the first (seconds)
+        self._start: Optional[float] = None  # Clock time at which the current pass started
+
+    def isOpened(self) -> bool:
+        return bool(self.log.frames)
+
+    def release(self) -> None:
+        self.log.close()
+
+    def get(self, prop: int) -> float:
+        """
+        Returns a capture property (frame count, position, FPS, width or height).
+        """
+        frames = self.log.frames
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(frames))
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.pos)
+        if prop == cv2.CAP_PROP_FPS:
+            duration = frames[-1].timestamp - frames[0].timestamp if len(frames) > 1 else 0.0
+            return (len(frames) - 1) / duration if duration > 0 else 0.0
+        if prop in (cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT) and frames:
+            height, width = self.log.image(frames[0]).shape[:2]
+            return float(width if prop == cv2.CAP_PROP_FRAME_WIDTH else height)
+        return 0.0
+
+    def set(self, prop: int, value: float) -> bool:
+        """
+        Seeks to a frame index (`cv2.CAP_PROP_POS_FRAMES`).
+        """
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return False
+        self.pos = min(max(int(value), 0), len(self.log.frames))
+        self._start = None
+        return True
+
+    def grab(self) -> bool:
+        """
+        Skips the next frame.
+        """
+        return self._next() is not None
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Returns the next frame, decoded into `image` if its shape matches.
+
+        Returns:
+            Tuple[bool, Optional[np.ndarray]]: Success flag and the frame image.
+        """
+        record = self._next()
+        if record is None:
+            return False, None
+        return True, self.log.image(record, out=image)
+
+    def _next(self) -> Optional[Record]:
+        """
+        Advances to the next frame record, waiting for its recorded time in realtime mode.
+        """
+        frames = self.log.frames
+        if self.pos >= len(frames):
+            if not self.loop or not frames:
+                return None
+            self.pos = 0
+            self._start = None
+
+        record = frames[self.pos]
+        self.pos += 1
+        self.timestamp = record.timestamp - frames[0].timestamp
+
+        if self.realtime:
+            if self._start is None:
+                self._start = clock.monotonic() - self.timestamp
+            clock.sleep(self._start + self.timestamp - clock.monotonic())
+
+        return record
+
+
+def is_log(path: str) -> bool:
+    """
+    Checks whether a file is a recorder log.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        bool: True if the file starts with the log magic.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(FILE_MAGIC)) == FILE_MAGIC
+    except OSError:
+        return False
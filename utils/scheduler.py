@@ -0,0 +1,155 @@
+import math
+import threading
+from typing import Any, Callable, Dict, List
+
+import utils.clock as clock
+from utils.metrics import metrics
+
+# Longest uninterrupted sleep, so a stop request is noticed promptly (seconds)
+MAX_SLEEP: float = 0.05
+
+
+class Task:
+    """
+    A periodic task with its deadline and timing statistics.
+    """
+
+    __slots__ = (
+        'name', 'fn', 'period', 'deadline', 'runs', 'misses', 'jitter_sum', 'jitter_max',
+        '_jitter', '_misses',
+    )
+
+    def __init__(self, name: str, fn: Callable[[], Any], rate_hz: float) -> None:
+        """
+        Initializes the task.
+
+        Args:
+            name (str): Name of the task (used for statistics and metrics).
+            fn (Callable[[], Any]): Function run once per period.
+            rate_hz (float): Rate at which the task runs.
+        """
+        self.name: str = name
+        self.fn: Callable[[], Any] = fn
+        self.period: float = 1.0 / rate_hz
+        self.deadline: float = 0.0  # Release time of the next run
+
+        # Statistics
+        self.runs: int = 0
+        self.misses: int = 0  # Runs that finished after the next release time
+        self.jitter_sum: float = 0.0  # Total start delay past the release time (seconds)
+        self.jitter_max: float = 0.0
+        self._jitter = metrics.histogram(f'jitter.{name}')
+        self._misses = metrics.counter(f'deadline_misses.{name}')
+
+    def run(self, now: float) -> None:
+        """
+        Runs the task once and schedules its next release.
+
+        Args:
+            now (float): Current clock time (seconds).
+        """
+        jitter = now - self.deadline
+        self.fn()
+        end = clock.monotonic()
+
+        self.runs += 1
+        self.jitter_sum += jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+        self._jitter.observe(jitter)
+
+        # Next release on the original time grid; skip the slots an overrun consumed
+        self.deadline += self.period
+        if end > self.deadline:
+            self.misses += 1
+            self._misses.inc()
+            self.deadline += math.ceil((end - self.deadline) / self.period) * self.period
+
+
+class Scheduler:
+    """
+    Runs periodic tasks at individual rates on a single thread.
+
+    Each task is released on a fixed grid of monotonic deadlines. Due tasks run in the
+    order they were added (earlier tasks have priority), and the scheduler sleeps on the
+    process clock until the next release instead of polling.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the scheduler without tasks.
+        """
+        self.tasks: List[Task] = []
+        self.start_time: float = 0.0
+
+    def add(self, name: str, fn: Callable[[], Any], rate_hz: float) -> Task:
+        """
+        Adds a periodic task.
+
+        Args:
+            name (str): Name of the task.
+            fn (Callable[[], Any]): Function run once per period.
+            rate_hz (float): Rate at which the task runs.
+
+        Returns:
+            Task: The added task.
+        """
+        task = Task(name, fn, rate_hz)
+        self.tasks.append(task)
+        return task
+
+    def run_pending(self) -> float:
+        """
+        Runs all tasks whose release time has passed.
+
+        Returns:
+            float: Time until the next release (seconds, negative if a task is already due).
+        """
+        for task in self.tasks:
+            now = clock.monotonic()
+            if now >= task.deadline:
+                task.run(now)
+
+        return min(task.deadline for task in self.tasks) - clock.monotonic()
+
+    def start(self) -> None:
+        """
+        Releases every task now and clears their timing statistics.
+        """
+        self.start_time = clock.monotonic()
+        for task in self.tasks:
+            task.deadline = self.start_time
+            task.runs = task.misses = 0
+            task.jitter_sum = task.jitter_max = 0.0
+
+    def run(self, stop: threading.Event) -> None:
+        """
+        Runs the tasks until `stop` is set.
+
+        Args:
+            stop (threading.Event): Event ending the loop.
+        """
+        self.start()
+        while not stop.is_set():
+            delay = self.run_pending()
+            if delay > 0:
+                clock.sleep(min(delay, MAX_SLEEP))
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the timing statistics of each task.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Per task: achieved rate (Hz), runs, deadline misses and
+                                         mean and max jitter (seconds).
+        """
+        elapsed = clock.monotonic() - self.start_time
+        return {
+            task.name: {
+                'rate': task.runs / elapsed if elapsed > 0 else 0.0,
+                'runs': task.runs,
+                'misses': task.misses,
+                'jitter_mean': task.jitter_sum / task.runs if task.runs else 0.0,
+                'jitter_max': task.jitter_max,
+            }
+            for task in self.tasks
+        }